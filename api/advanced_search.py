@@ -5,7 +5,9 @@ Implements full search syntax from API Bible Section 5.1
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -465,6 +467,33 @@ class SmartQueryBuilder(AdvancedSearchBuilder):
         self.add_closure_status(['O'])  # Open records only
         return self
     
+    @classmethod
+    def preset_params(cls,
+                      preset: str,
+                      page: int = 0,
+                      per_page: int = 20,
+                      sort_option: str = "RELEVANCE") -> Mapping[str, Any]:
+        """
+        Build search parameters for a preset with no further terms or filters
+        
+        Preset-only searches always produce the same parameters, so results
+        are memoized. The returned mapping is read-only because it is shared
+        between callers.
+        
+        Args:
+            preset: Preset name (see PRESETS)
+            page: Page number (0-based)
+            per_page: Results per page
+            sort_option: Sort option
+            
+        Returns:
+            Read-only parameters mapping for API call
+        """
+        if preset not in PRESETS:
+            raise ValueError(f"Unknown preset '{preset}'. Must be one of: {list(PRESETS)}")
+        
+        return _build_preset_params(preset, page, per_page, sort_option)
+    
     def search_colonial_office(self, start_year: Optional[int] = None, end_year: Optional[int] = None) -> 'SmartQueryBuilder':
         """
         Pre-configured search for Colonial Office records
@@ -482,3 +511,25 @@ class SmartQueryBuilder(AdvancedSearchBuilder):
             self.add_date_range(start_year, end_year)
         
         return self
+
+
+# Preset name -> SmartQueryBuilder method applying it
+PRESETS = {
+    'wwi': 'search_wwi_records',
+    'wwii': 'search_wwii_records',
+    'colonial': 'search_colonial_office'
+}
+
+
+@lru_cache(maxsize=64)
+def _build_preset_params(preset: str, page: int, per_page: int, sort_option: str) -> Mapping[str, Any]:
+    """Build and freeze the parameters for a preset-only search"""
+    builder = SmartQueryBuilder()
+    getattr(builder, PRESETS[preset])()
+    params = builder.build_params(page=page, per_page=per_page, sort_option=sort_option)
+    
+    # Lists become tuples so the cached entry cannot be changed through a caller
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in params.items()
+    })
@@ -7,7 +7,7 @@ Implements high-impact performance optimization from TNA Bible Recommendations
 import logging
 import asyncio
 import time
-from typing import List, Dict, Any, Optional, Callable, Set
+from typing import List, Dict, Any, Optional, Callable, Set, Iterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import threading
@@ -86,6 +86,9 @@ class BatchRequestManager:
         self.is_processing = False
         self.processing_thread: Optional[threading.Thread] = None
         
+        # Signalled whenever a result lands in completed_results
+        self.results_ready = threading.Condition()
+        
         # Statistics
         self.stats = {
             'total_requests': 0,
@@ -211,15 +214,11 @@ class BatchRequestManager:
         Returns:
             BatchResult or None if timeout
         """
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            if request_id in self.completed_results:
+        with self.results_ready:
+            if self.results_ready.wait_for(lambda: request_id in self.completed_results, timeout):
                 result = self.completed_results.pop(request_id)
                 logger.debug(f"Retrieved result for request {request_id}")
                 return result
-            
-            time.sleep(0.1)  # Small delay to avoid busy waiting
         
         logger.warning(f"Timeout waiting for result {request_id}")
         return None
@@ -244,45 +243,72 @@ class BatchRequestManager:
         logger.info(f"Batched {len(record_ids)} record requests")
         return request_ids
     
-    def wait_for_results(self, request_ids: List[str], timeout: float = 60.0) -> List[BatchResult]:
+    def iter_completions(self, 
+                         request_ids: List[str], 
+                         timeout: float = 60.0) -> Iterator[Tuple[str, BatchResult]]:
         """
-        Wait for multiple results to complete
+        Yield results as soon as each request completes
+        
+        Results come out in completion order, not submission order. Requests
+        still outstanding when the timeout expires are yielded last with a
+        timeout error.
         
         Args:
             request_ids: List of request IDs to wait for
-            timeout: Maximum wait time
+            timeout: Maximum total wait time
             
-        Returns:
-            List of BatchResult objects
+        Yields:
+            (request_id, BatchResult) tuples
         """
-        results = []
-        start_time = time.time()
-        remaining_ids = set(request_ids)
-        
-        while remaining_ids and (time.time() - start_time) < timeout:
-            completed_ids = []
-            
-            for request_id in remaining_ids:
-                if request_id in self.completed_results:
-                    result = self.completed_results.pop(request_id)
-                    results.append(result)
-                    completed_ids.append(request_id)
+        remaining_ids = dict.fromkeys(request_ids)
+        deadline = time.monotonic() + timeout
+        
+        while remaining_ids:
+            with self.results_ready:
+                # Sleep until another result completes rather than polling
+                self.results_ready.wait_for(
+                    lambda: any(rid in self.completed_results for rid in remaining_ids),
+                    max(0.0, deadline - time.monotonic())
+                )
+                ready = [
+                    (rid, self.completed_results.pop(rid))
+                    for rid in list(remaining_ids) if rid in self.completed_results
+                ]
             
-            for completed_id in completed_ids:
-                remaining_ids.remove(completed_id)
+            if not ready:
+                break
             
-            if remaining_ids:
-                time.sleep(0.1)
+            # Yield outside the lock so slow consumers don't block the processing thread
+            for request_id, result in ready:
+                del remaining_ids[request_id]
+                yield request_id, result
+        
+        if remaining_ids:
+            logger.warning(f"{len(remaining_ids)} requests timed out")
         
         # Add timeout results for any remaining requests
         for request_id in remaining_ids:
-            results.append(BatchResult(
+            yield request_id, BatchResult(
                 request_id=request_id,
                 success=False,
                 error="Timeout waiting for result"
-            ))
+            )
+    
+    def wait_for_results(self, request_ids: List[str], timeout: float = 60.0) -> List[BatchResult]:
+        """
+        Wait for multiple results to complete
+        
+        Args:
+            request_ids: List of request IDs to wait for
+            timeout: Maximum wait time
+            
+        Returns:
+            List of BatchResult objects, in the same order as request_ids
+        """
+        collected = dict(self.iter_completions(request_ids, timeout))
+        results = [collected[request_id] for request_id in request_ids]
         
-        logger.info(f"Retrieved {len(results)} results ({len(remaining_ids)} timeouts)")
+        logger.info(f"Retrieved {len(results)} results")
         return results
     
     def _get_next_batch(self) -> List[BatchRequest]:
@@ -534,11 +560,12 @@ class BatchRequestManager:
     def _complete_request(self, request: BatchRequest, result: BatchResult):
         """Complete a request with its result"""
         # Remove from pending
-        if request.request_id in self.pending_requests:
-            del self.pending_requests[request.request_id]
+        self.pending_requests.pop(request.request_id, None)
         
-        # Store result
-        self.completed_results[request.request_id] = result
+        # Store result and wake anyone waiting on it
+        with self.results_ready:
+            self.completed_results[request.request_id] = result
+            self.results_ready.notify_all()
         
         # Call callback if provided
         if request.callback:
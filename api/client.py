@@ -4,8 +4,10 @@ Discovery API Client - Respectful and compliant access to National Archives data
 
 import logging
 from typing import List, Dict, Optional, Iterator, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import requests
+from requests.adapters import HTTPAdapter
 from ratelimit import limits, sleep_and_retry
 import os
 import time
@@ -21,10 +23,24 @@ load_dotenv('config.env')
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared session (override in config.env).
+# Idle keep-alive connections are kept per host, with headroom for callers
+# that share one client across threads. Retries are handled by
+# _exponential_backoff_retry, not by the adapter.
+POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '16'))
+POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '64'))
+
+# Requests allowed per day (API Bible Section 6.1)
+DAILY_REQUEST_LIMIT = 3000
+
 
 class RateLimitError(Exception):
     """Raised when API rate limits are exceeded"""
-    pass
+    
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds the server asked us to wait (Retry-After), if it said
+        self.retry_after = retry_after
 
 
 class AuthenticationError(Exception):
@@ -47,6 +63,23 @@ class ParsingError(Exception):
     pass
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class DiscoveryClient:
     """
     Client for The National Archives Discovery API
@@ -83,6 +116,12 @@ class DiscoveryClient:
         
         # Session for connection pooling
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # urllib3 logs "Starting new HTTPS connection" at DEBUG only when the
+        # pool has no reusable keep-alive connection
+        logger.debug(f"HTTP pool: {POOL_CONNECTIONS} hosts x {POOL_MAXSIZE} keep-alive connections")
         # Use CORRECT User-Agent format per API Bible Section 6.3
         self.session.headers.update({
             'User-Agent': 'clio/2.0 (https://github.com/rtw878/clio; contact@example.com)',
@@ -112,10 +151,14 @@ class DiscoveryClient:
                 if attempt == max_retries:
                     raise e
                 
-                # Exponential backoff with jitter for rate limits
-                base_delay = 2 ** attempt  # 1s, 2s, 4s, 8s...
-                jitter = random.uniform(0.1, 0.5)  # Add randomness
-                delay = min(base_delay + jitter, 60)  # Cap at 60 seconds
+                if e.retry_after is not None:
+                    # Server said how long to wait; honour it (still capped)
+                    delay = min(e.retry_after, 60)
+                else:
+                    # Exponential backoff with jitter for rate limits
+                    base_delay = 2 ** attempt  # 1s, 2s, 4s, 8s...
+                    jitter = random.uniform(0.1, 0.5)  # Add randomness
+                    delay = min(base_delay + jitter, 60)  # Cap at 60 seconds
                 
                 logger.warning(f"Rate limit hit, backing off for {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1})")
                 time.sleep(delay)
@@ -161,8 +204,8 @@ class DiscoveryClient:
             self.daily_request_count = 0
             self.daily_reset_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        if self.daily_request_count >= 3000:  # API Bible daily limit
-            raise RateLimitError("Daily limit of 3000 requests exceeded")
+        if self.daily_request_count >= DAILY_REQUEST_LIMIT:
+            raise RateLimitError(f"Daily limit of {DAILY_REQUEST_LIMIT} requests exceeded")
 
     def _make_request_internal(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
@@ -210,7 +253,8 @@ class DiscoveryClient:
                 elif response.status_code == 404:
                     raise PermanentError(f"Resource not found: {url}")
                 elif response.status_code == 429:
-                    raise RateLimitError("Rate limit exceeded - server side throttling")
+                    raise RateLimitError("Rate limit exceeded - server side throttling",
+                                         retry_after=_parse_retry_after(response.headers.get('Retry-After')))
                 elif response.status_code in [500, 503]:
                     raise TransientError(f"{error_name} {response.status_code}: {error_desc}")
             elif 400 <= response.status_code < 500:
@@ -524,29 +568,47 @@ class DiscoveryClient:
             List of enriched Record objects
         """
         enriched_records = []
+        for batch in self.iter_enrich_metadata(record_ids, batch_size):
+            enriched_records.extend(batch)
+        return enriched_records
+
+    def iter_enrich_metadata(self, record_ids: List[str], 
+                             batch_size: int = 10) -> Iterator[List[Record]]:
+        """
+        Enrich records with detailed metadata, yielding each batch as it completes
+        
+        Lets callers persist a batch before the next is fetched, so only
+        one batch of enriched records is held at a time. Requests are paced
+        by the _make_request rate limiter alone.
+        
+        Args:
+            record_ids: List of record identifiers
+            batch_size: Number of records to process per batch
+            
+        Yields:
+            Enriched Record objects for each batch (may be empty)
+        """
+        enriched_total = 0
         
         for i in range(0, len(record_ids), batch_size):
             batch = record_ids[i:i + batch_size]
             logger.info(f"Enriching metadata for batch {i//batch_size + 1}: {len(batch)} records")
             
+            enriched_batch = []
             for record_id in batch:
                 try:
                     enriched_record = self.enrich_record_metadata(record_id)
                     if enriched_record:
-                        enriched_records.append(enriched_record)
-                    
-                    # Rate limiting
-                    time.sleep(1.0 / self.requests_per_second)
+                        enriched_batch.append(enriched_record)
                     
                 except Exception as e:
                     logger.warning(f"Failed to enrich record {record_id}: {e}")
                     continue
             
-            # Batch-level rate limiting
-            time.sleep(2)
+            enriched_total += len(enriched_batch)
+            yield enriched_batch
         
-        logger.info(f"Successfully enriched {len(enriched_records)} out of {len(record_ids)} records")
-        return enriched_records
+        logger.info(f"Successfully enriched {enriched_total} out of {len(record_ids)} records")
 
     def browse_collection(self, 
                          collection_id: str,
@@ -5,12 +5,16 @@ Implements file authority endpoints from API Bible Section 3.1
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
-from .client import DiscoveryClient, PermanentError, TransientError, RateLimitError
+from .client import DiscoveryClient, PermanentError, TransientError, RateLimitError, DAILY_REQUEST_LIMIT
+from .models import CreatorEntry
 
 logger = logging.getLogger(__name__)
 
+# Pages fetched per creator type when searching by name
+NAME_SEARCH_MAX_PAGES = 5
+
 
 class CreatorClient:
     """
@@ -21,14 +25,19 @@ class CreatorClient:
     - GET /fileauthorities/v1/collection/{type}
     """
     
-    def __init__(self, api_client: Optional[DiscoveryClient] = None):
+    def __init__(self, 
+                 api_client: Optional[DiscoveryClient] = None,
+                 daily_request_count: Optional[Callable[[], int]] = None):
         """
         Initialize creator client
         
         Args:
             api_client: DiscoveryClient instance (will create new if None)
+            daily_request_count: Returns today's persisted API request count,
+                for the daily budget check (optional)
         """
         self.api_client = api_client or DiscoveryClient()
+        self.daily_request_count = daily_request_count
         self.logger = logging.getLogger(__name__)
         
         # Valid creator types from API Bible
@@ -100,6 +109,23 @@ class CreatorClient:
             self.logger.error(f"Error searching {creator_type} creators: {e}")
             raise
     
+    def list_creators(self, creator_type: str, limit: int = 30) -> List[CreatorEntry]:
+        """
+        Get the first page of creators of a type as typed entries
+        
+        Args:
+            creator_type: Type (Person/Business/Family/Manor/Organisation)
+            limit: Number of records (1-500, default 30)
+            
+        Returns:
+            List of creator entries
+        """
+        response = self.search_creators(creator_type, limit)
+        return [
+            CreatorEntry.from_api_response(creator, creator_type)
+            for creator in response.get('Creators', response.get('creators', []))
+        ]
+    
     def get_all_creators_by_type(self, creator_type: str, max_pages: int = 10) -> List[Dict[str, Any]]:
         """
         Get all creators of a specific type across multiple pages
@@ -144,7 +170,7 @@ class CreatorClient:
         self.logger.info(f"Retrieved total of {len(all_creators)} {creator_type} creators")
         return all_creators
     
-    def search_creators_by_name(self, name: str, creator_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def search_creators_by_name(self, name: str, creator_type: Optional[str] = None) -> List[CreatorEntry]:
         """
         Search for creators by name across types
         
@@ -160,15 +186,17 @@ class CreatorClient:
         
         types_to_search = [creator_type] if creator_type else self.valid_types
         
+        # Up to NAME_SEARCH_MAX_PAGES requests per type
+        self._check_daily_budget(NAME_SEARCH_MAX_PAGES * len(types_to_search))
+        
         for ctype in types_to_search:
             try:
-                creators = self.get_all_creators_by_type(ctype, max_pages=5)  # Limit search scope
+                creators = self.get_all_creators_by_type(ctype, max_pages=NAME_SEARCH_MAX_PAGES)  # Limit search scope
                 
                 for creator in creators:
-                    creator_name = creator.get('AuthorityName', creator.get('Name', ''))
-                    if name_lower in creator_name.lower():
-                        creator['_search_type'] = ctype  # Add type for reference
-                        matching_creators.append(creator)
+                    entry = CreatorEntry.from_api_response(creator, ctype)
+                    if name_lower in entry.name.lower():
+                        matching_creators.append(entry)
                 
             except Exception as e:
                 self.logger.warning(f"Error searching {ctype} creators for name '{name}': {e}")
@@ -177,7 +205,7 @@ class CreatorClient:
         self.logger.info(f"Found {len(matching_creators)} creators matching '{name}'")
         return matching_creators
     
-    def get_creator_by_exact_name(self, name: str, creator_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def get_creator_by_exact_name(self, name: str, creator_type: Optional[str] = None) -> Optional[CreatorEntry]:
         """
         Find creator by exact name match
         
@@ -191,8 +219,7 @@ class CreatorClient:
         matches = self.search_creators_by_name(name, creator_type)
         
         for creator in matches:
-            creator_name = creator.get('AuthorityName', creator.get('Name', ''))
-            if creator_name == name:
+            if creator.name == name:
                 return creator
         
         return None
@@ -210,6 +237,9 @@ class CreatorClient:
             'types_available': self.valid_types
         }
         
+        # One request per type
+        self._check_daily_budget(len(self.valid_types))
+        
         for creator_type in self.valid_types:
             try:
                 # Get first page to estimate totals
@@ -237,3 +267,23 @@ class CreatorClient:
             True if valid, False otherwise
         """
         return creator_type in self.valid_types
+    
+    def _check_daily_budget(self, planned_requests: int):
+        """
+        Refuse to start a multi-request operation the daily budget cannot cover
+        
+        Args:
+            planned_requests: Most API requests the operation can make
+            
+        Raises:
+            RateLimitError: If fewer requests than planned_requests remain today
+        """
+        # The persisted count covers earlier runs today; the client's own
+        # counter covers requests this process has not logged yet
+        used = self.api_client.daily_request_count
+        if self.daily_request_count:
+            used = max(used, self.daily_request_count())
+        
+        remaining = DAILY_REQUEST_LIMIT - used
+        if remaining < planned_requests:
+            raise RateLimitError(f"Daily request budget too low for {planned_requests} requests ({remaining} left)")
@@ -106,6 +106,10 @@ class APIHealthMonitor:
         self.is_monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
         
+        # Set whenever a health check result is recorded, so displays can
+        # redraw on new data instead of polling
+        self.completion_event = threading.Event()
+        
         # Alert configuration
         self.alert_callbacks: List[Callable] = []
         self.alert_thresholds = {
@@ -290,6 +294,8 @@ class APIHealthMonitor:
         
         # Check for alerts
         self._check_alerts(health_check)
+        
+        self.completion_event.set()
     
     def _update_endpoint_health(self, health_check: HealthCheck):
         """Update endpoint health statistics"""
@@ -5,9 +5,24 @@ Data models for National Archives Discovery API responses
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 import json
+import re
 from datetime import datetime
 
 
+# Numeric catalogue levels to archival level names (API Bible Section 2.2)
+_LEVEL_NAMES = {
+    0: "Department",
+    1: "Division", 
+    2: "Series",
+    3: "Sub-series",
+    4: "Sub sub-series", 
+    5: "Piece",
+    6: "Item"
+}
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
 @dataclass
 class Record:
     """Represents a single archive record from the Discovery catalogue"""
@@ -97,58 +112,50 @@ class Record:
         if not level_value:
             return None
             
-        # Handle numeric levels (convert to standard archival level names)
-        level_mapping = {
-            0: "Department",
-            1: "Division", 
-            2: "Series",
-            3: "Sub-series",
-            4: "Sub sub-series", 
-            5: "Piece",
-            6: "Item"
-        }
-        
         # If it's already a string level name, return as-is
         if isinstance(level_value, str):
             # Check if it's a numeric string
             try:
                 numeric_level = int(level_value)
-                return level_mapping.get(numeric_level, level_value)
+                return _LEVEL_NAMES.get(numeric_level, level_value)
             except ValueError:
-                # It's already a descriptive name
-                if level_value in ["Department", "Division", "Series", "Sub-series", "Sub sub-series", "Piece", "Item"]:
-                    return level_value
-                else:
-                    # Unknown string level, return as-is
-                    return level_value
+                # Descriptive name (known or not), return as-is
+                return level_value
         
-        # If it's a number, map it
+        # If it's a number, map it (convert to standard archival level names)
         if isinstance(level_value, (int, float)):
-            return level_mapping.get(int(level_value), f"Level{int(level_value)}")
+            return _LEVEL_NAMES.get(int(level_value), f"Level{int(level_value)}")
         
         return str(level_value) if level_value else None
 
+    @classmethod
+    def _parse_held_by(cls, held_by_value: Any) -> str:
+        """
+        Parse heldBy value from API response into a display string
+        
+        A list prefers the names of its repository dicts (xReferenceName);
+        the plain string items are only joined in when there are none.
+        """
+        if not isinstance(held_by_value, list):
+            return str(held_by_value) if held_by_value else ''
+        
+        names = [
+            item.get('xReferenceName', '') for item in held_by_value
+            if isinstance(item, dict)
+        ]
+        names = [name for name in names if name]
+        if names:
+            return ', '.join(names)
+        
+        # No named repositories: fall back to the string items
+        return ', '.join(str(item) for item in held_by_value if not isinstance(item, dict))
+
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> 'Record':
         """Create a Record instance from API response data"""
         
         # Handle heldBy field - can be list or string
-        held_by_value = data.get('heldBy', '')
-        if isinstance(held_by_value, list):
-            # Handle list of dictionaries or strings
-            held_by_items = []
-            for item in held_by_value:
-                if isinstance(item, dict):
-                    # Extract name from dictionary
-                    name = item.get('xReferenceName', '')
-                    if name:
-                        held_by_items.append(name)
-                else:
-                    # Handle string items
-                    held_by_items.append(str(item))
-            held_by_str = ', '.join(held_by_items) if held_by_items else ''
-        else:
-            held_by_str = str(held_by_value) if held_by_value else ''
+        held_by_enhanced = cls._parse_held_by(data.get('heldBy', ''))
         
         # Handle places - ensure it's a list
         places_value = data.get('places', [])
@@ -187,19 +194,6 @@ class Record:
         scope_content_obj = data.get('scopeContent', {})
         scope_content_desc = scope_content_obj.get('description', '') if isinstance(scope_content_obj, dict) else ''
         
-        # Enhanced held by information parsing
-        held_by_enhanced = ''
-        if isinstance(held_by_value, list) and held_by_value:
-            held_by_details = []
-            for held_by_item in held_by_value:
-                if isinstance(held_by_item, dict):
-                    name = held_by_item.get('xReferenceName', '')
-                    if name:
-                        held_by_details.append(name)
-            held_by_enhanced = ', '.join(held_by_details) if held_by_details else held_by_str
-        else:
-            held_by_enhanced = held_by_str
-        
         return cls(
             # Enhanced core metadata with TNA API fields
             id=data.get('Id', data.get('id', '')),
@@ -286,22 +280,7 @@ class Record:
         """
         
         # Handle heldBy field - can be list or string
-        held_by_value = data.get('heldBy', '')
-        if isinstance(held_by_value, list):
-            # Handle list of dictionaries or strings
-            held_by_items = []
-            for item in held_by_value:
-                if isinstance(item, dict):
-                    # Extract name from dictionary
-                    name = item.get('xReferenceName', '')
-                    if name:
-                        held_by_items.append(name)
-                else:
-                    # Handle string items
-                    held_by_items.append(str(item))
-            held_by_str = ', '.join(held_by_items) if held_by_items else ''
-        else:
-            held_by_str = str(held_by_value) if held_by_value else ''
+        held_by_enhanced = cls._parse_held_by(data.get('heldBy', ''))
         
         # Handle places - ensure it's a list
         places_value = data.get('places', [])
@@ -342,21 +321,7 @@ class Record:
         scope_content_desc = scope_content_obj.get('description', '') if isinstance(scope_content_obj, dict) else ''
         
         # Clean HTML tags from scope content for title/description
-        import re
-        clean_scope_desc = re.sub(r'<[^>]+>', '', scope_content_desc) if scope_content_desc else ''
-        
-        # Enhanced held by information parsing
-        held_by_enhanced = ''
-        if isinstance(held_by_value, list) and held_by_value:
-            held_by_details = []
-            for held_by_item in held_by_value:
-                if isinstance(held_by_item, dict):
-                    name = held_by_item.get('xReferenceName', '')
-                    if name:
-                        held_by_details.append(name)
-            held_by_enhanced = ', '.join(held_by_details) if held_by_details else held_by_str
-        else:
-            held_by_enhanced = held_by_str
+        clean_scope_desc = _HTML_TAG_RE.sub('', scope_content_desc) if scope_content_desc else ''
         
         return cls(
             # Enhanced core metadata with detailed TNA API fields
@@ -531,6 +496,46 @@ class Collection:
     archive: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class RepositoryEntry:
+    """Repository/archive from the repository collection endpoint"""
+    
+    name: str
+    repo_type: str
+    description: str = ''
+    is_tna: bool = False
+    
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> 'RepositoryEntry':
+        """Create from an API repository dict (PascalCase or camelCase keys)"""
+        return cls(
+            name=data.get('Name', data.get('name', '')) or '',
+            repo_type=data.get('Type', data.get('type', '')) or '',
+            description=data.get('Description', data.get('description', '')) or '',
+            is_tna=bool(data.get('IsTNA', False))
+        )
+
+
+@dataclass(frozen=True)
+class CreatorEntry:
+    """File authority (creator) from the file authorities endpoints"""
+    
+    name: str
+    epithet: str = ''
+    biography: str = ''
+    creator_type: Optional[str] = None
+    
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any], creator_type: Optional[str] = None) -> 'CreatorEntry':
+        """Create from an API file authority dict"""
+        return cls(
+            name=data.get('AuthorityName', data.get('Name', '')) or '',
+            epithet=data.get('Epithet', '') or '',
+            biography=data.get('BiographyHistory', '') or '',
+            creator_type=creator_type
+        )
+
+
 @dataclass
 class CrawlQueueItem:
     """Represents an item in the crawl queue for hierarchical traversal"""
@@ -8,6 +8,7 @@ import logging
 from typing import List, Dict, Any, Optional
 
 from .client import DiscoveryClient, PermanentError, TransientError, RateLimitError
+from .models import RepositoryEntry
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +56,7 @@ class RepositoryClient:
             self.logger.error(f"Error retrieving repository {repo_id}: {e}")
             raise
     
-    def list_repositories(self, limit: int = 30) -> List[Dict[str, Any]]:
+    def list_repositories(self, limit: int = 30) -> List[RepositoryEntry]:
         """
         Get Archon records collection
         (API Bible Section 3.3: GET /repository/v1/collection)
@@ -64,14 +65,17 @@ class RepositoryClient:
             limit: Number of records (1-500, default 30)
             
         Returns:
-            List of repository records
+            List of repository entries
         """
         try:
             params = {'limit': min(max(limit, 1), 500)}  # Enforce API limits
             data = self.api_client._make_request('repository/v1/collection', params)
             
             # Extract repositories from response
-            repositories = data.get('Repositories', data.get('repositories', []))
+            repositories = [
+                RepositoryEntry.from_api_response(repo)
+                for repo in data.get('Repositories', data.get('repositories', []))
+            ]
             
             self.logger.info(f"Retrieved {len(repositories)} repositories")
             return repositories
@@ -80,7 +84,7 @@ class RepositoryClient:
             self.logger.error(f"Error listing repositories: {e}")
             raise
     
-    def search_repositories(self, name_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+    def search_repositories(self, name_filter: Optional[str] = None) -> List[RepositoryEntry]:
         """
         Search repositories with optional name filtering
         
@@ -94,19 +98,14 @@ class RepositoryClient:
         
         if name_filter:
             name_filter_lower = name_filter.lower()
-            filtered_repos = []
-            
-            for repo in repositories:
-                repo_name = repo.get('Name', repo.get('name', '')).lower()
-                if name_filter_lower in repo_name:
-                    filtered_repos.append(repo)
+            filtered_repos = [repo for repo in repositories if name_filter_lower in repo.name.lower()]
             
             self.logger.info(f"Filtered to {len(filtered_repos)} repositories matching '{name_filter}'")
             return filtered_repos
         
         return repositories
     
-    def get_repository_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+    def get_repository_by_name(self, name: str) -> Optional[RepositoryEntry]:
         """
         Find repository by exact name match
         
@@ -118,9 +117,9 @@ class RepositoryClient:
         """
         repositories = self.search_repositories(name)
         
+        name_lower = name.lower()
         for repo in repositories:
-            repo_name = repo.get('Name', repo.get('name', ''))
-            if repo_name.lower() == name.lower():
+            if repo.name.lower() == name_lower:
                 return repo
         
         self.logger.info(f"Repository '{name}' not found")
@@ -142,8 +141,7 @@ class RepositoryClient:
             other_repos = 0
             
             for repo in repositories:
-                repo_type = repo.get('Type', repo.get('type', '')).lower()
-                if 'national archives' in repo_type or repo.get('IsTNA', False):
+                if 'national archives' in repo.repo_type.lower() or repo.is_tna:
                     tna_repos += 1
                 else:
                     other_repos += 1
@@ -22,6 +22,9 @@ from utils.logging_config import get_contextual_logger
 
 logger = logging.getLogger(__name__)
 
+# Pause before each page fetch from the Discovery website
+SCRAPE_DELAY_SECONDS = 2.0
+
 
 class ScrapingError(Exception):
     """Base exception for scraping errors"""
@@ -49,7 +52,7 @@ class DiscoveryScraper:
     - Fallback for API failures
     """
     
-    def __init__(self, delay_between_requests: float = 2.0):
+    def __init__(self, delay_between_requests: float = SCRAPE_DELAY_SECONDS):
         """
         Initialize the Discovery scraper
         
@@ -400,11 +403,13 @@ class DiscoveryScraper:
             links = soup.select(selector)
             child_links.extend(links)
         
-        # Filter for actual record detail links
+        # Filter for actual record detail links, keeping the first link per href
         filtered_links = []
+        seen_hrefs = set()
         for link in child_links:
             href = link.get('href', '')
-            if '/details/r/' in href and href not in [l.get('href', '') for l in filtered_links]:
+            if '/details/r/' in href and href not in seen_hrefs:
+                seen_hrefs.add(href)
                 filtered_links.append(link)
         
         return filtered_links
@@ -3,15 +3,25 @@ Command-line interface for National Archives Discovery clone
 """
 
 import click
+import csv
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import shutil
 import sys
+import threading
+from collections import Counter
+from types import MappingProxyType
 from pathlib import Path
 from dotenv import load_dotenv
 from tqdm import tqdm
 import json
-import statistics
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Iterable, Optional
 import time
 
 # Add project root to Python path
@@ -19,31 +29,201 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from api.client import DiscoveryClient
+from api.models import Record
+from api.advanced_search import SmartQueryBuilder, PRESETS
+from api.repository import RepositoryClient
+from api.creator import CreatorClient
+from api.intelligent_cache import get_intelligent_cache
+from api.batch_manager import BatchRequestManager
+from api.health_monitor import APIHealthMonitor, get_health_monitor, setup_console_alerts
 from storage.database import DatabaseManager
 from storage.cache import CacheManager
+from utils.provenance import get_provenance_tracker
+from utils.streaming import (
+    StreamingRecordProcessor, StreamingConfig,
+    export_records_streaming, analyze_records_streaming
+)
 try:
-    from search.semantic_search import SemanticSearchEngine, SEMANTIC_SEARCH_AVAILABLE
+    from search.semantic_search import SemanticSearchEngine, SEMANTIC_SEARCH_AVAILABLE, FAISS_AVAILABLE
 except ImportError:
     SEMANTIC_SEARCH_AVAILABLE = False
+    FAISS_AVAILABLE = False
     SemanticSearchEngine = None
 from search.query_processor import QueryProcessor
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Write buffers for export files (CSV exports can run to 100k+ rows)
+EXPORT_BUFFER_SIZE = 64 * 1024
+CSV_EXPORT_BUFFER_SIZE = 256 * 1024
+
+# Chunks stream-fetch and enrich-metadata may hold between the API reader and the DB writer
+STREAM_WRITE_QUEUE_SIZE = 4
+
+# Status icons for validation results and crawl queue rows
+_STATUS_ICONS = MappingProxyType({'PASS': '✅', 'FAIL': '❌', 'WARNING': '⚠️', 'ERROR': '💥'})
+_QUEUE_ICONS = MappingProxyType({'QUEUED': '⏳', 'PROCESSING': '🔄', 'COMPLETED': '✅', 'FAILED': '❌'})
+_DEFAULT_ICON = '📄'
+
+# QueueListener started by _setup_logging, reused by later invocations
+_log_listener = None
+
+# Title words of four or more letters, for stream-analyze word frequency
+_TITLE_WORD_RE = re.compile(r"[^\W\d_]{4,}")
+
 # Load environment variables
 load_dotenv('config.env')
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('./logs/discovery.log'),
-        logging.StreamHandler()
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_client():
+    """Return the process-wide DiscoveryClient (one pooled HTTP session)"""
+    return DiscoveryClient()
+
+
+@lru_cache(maxsize=1)
+def _get_db():
+    """Return the process-wide DatabaseManager"""
+    return DatabaseManager()
+
+
+@lru_cache(maxsize=1)
+def _get_cache():
+    """Return the process-wide CacheManager"""
+    return CacheManager()
+
+
+@lru_cache(maxsize=1)
+def _get_traverser():
+    """
+    Return the HierarchicalTraverser bound to the shared client and database
+    
+    api.traversal pulls in the scraping stack, so it is imported on first
+    use rather than at CLI start-up.
+    """
+    from api.traversal import HierarchicalTraverser
+    return HierarchicalTraverser(_get_client(), _get_db())
+
+
+@lru_cache(maxsize=1)
+def _get_validator():
+    """Return the DataValidator bound to the shared client and database (imported on first use)"""
+    from validation.validators import DataValidator
+    return DataValidator(_get_db(), _get_client())
+
+
+@lru_cache(maxsize=1)
+def _get_tracker():
+    """Return the provenance tracker bound to the shared DatabaseManager"""
+    return get_provenance_tracker(_get_db())
+
+
+class _QueueWriter:
+    """
+    Write items produced on the main thread from a background thread
+    
+    Items pass through a queue bounded at STREAM_WRITE_QUEUE_SIZE, so the
+    producer's next API requests overlap the previous item's database write.
+    The first write error is kept in `error`; put() then returns False so
+    the producer can stop fetching, and the queue is drained so it never
+    blocks.
+    """
+    
+    def __init__(self, write: Callable[[Iterable], None], name: str):
+        """
+        Start the writer thread
+        
+        Args:
+            write: Callable consuming an iterable of queued items
+            name: Thread name
+        """
+        self.error: Optional[Exception] = None
+        self._items = queue.Queue(maxsize=STREAM_WRITE_QUEUE_SIZE)
+        self._drained = False
+        self._thread = threading.Thread(target=self._run, args=(write,), name=name, daemon=True)
+        self._thread.start()
+    
+    def _queued(self):
+        yield from iter(self._items.get, None)
+        self._drained = True
+    
+    def _run(self, write: Callable[[Iterable], None]):
+        try:
+            write(self._queued())
+        except Exception as e:
+            self.error = e
+        
+        # Keep draining so the producer never blocks on a full queue
+        if not self._drained:
+            for _ in iter(self._items.get, None):
+                pass
+    
+    def put(self, item) -> bool:
+        """Queue an item for writing; False once a write has failed"""
+        if self.error is not None:
+            return False
+        self._items.put(item)
+        return True
+    
+    def close(self):
+        """Wait for every queued item to be written"""
+        self._items.put(None)
+        self._thread.join()
+
+
+def _setup_logging():
+    """
+    Route root logging through a queue so file/console I/O happens off the main thread
+    
+    Handlers already installed on the root logger (e.g. by init_from_environment)
+    are moved behind the listener; otherwise a rotating file handler and a
+    console handler are created. On later calls in the same process (the
+    previous command stops the listener on close) the existing listener is
+    restarted rather than leaving its queue unread.
+    
+    Returns:
+        Running QueueListener, or None if another QueueHandler owns logging
+    """
+    global _log_listener
+    root_logger = logging.getLogger()
+    
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root_logger.handlers):
+        if _log_listener is not None and _log_listener._thread is None:
+            _log_listener.start()
+        return _log_listener
+    
+    handlers = list(root_logger.handlers)
+    if not handlers:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.handlers.RotatingFileHandler(
+                './logs/discovery.log',
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
+                encoding='utf-8',
+                delay=True
+            ),
+            logging.StreamHandler()
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        root_logger.setLevel(logging.INFO)
+    
+    log_queue = queue.Queue(-1)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    return _log_listener
+
+
 @click.group()
 @click.option('--debug', is_flag=True, help='Enable debug logging')
 @click.option('--config', help='Path to configuration file')
@@ -51,13 +231,17 @@ logger = logging.getLogger(__name__)
 def cli(ctx, debug, config):
     """National Archives Discovery Catalogue Clone - Respectful archival research tool"""
     
-    if debug:
-        logging.getLogger().setLevel(logging.DEBUG)
-    
     # Ensure required directories exist
     Path('./data').mkdir(exist_ok=True)
     Path('./logs').mkdir(exist_ok=True)
     
+    listener = _setup_logging()
+    if listener:
+        ctx.call_on_close(listener.stop)
+    
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
     # Initialize context
     ctx.ensure_object(dict)
     ctx.obj['debug'] = debug
@@ -70,14 +254,14 @@ def cli(ctx, debug, config):
 @click.option('--collection', '-c', help='Filter by collection')
 @click.option('--archive', '-a', help='Filter by archive')
 @click.option('--semantic', '-s', is_flag=True, help='Use semantic search')
-@click.option('--export', '-e', help='Export results to file (JSON/CSV)')
+@click.option('--export', '-e', help='Export results to file (JSON/CSV/Parquet)')
 @click.pass_context
 def search(ctx, query, limit, collection, archive, semantic, export):
     """Search the Discovery catalogue"""
     
     try:
         # Initialize components
-        db_manager = DatabaseManager()
+        db_manager = _get_db()
         
         # Prepare filters
         filters = {}
@@ -94,50 +278,25 @@ def search(ctx, query, limit, collection, archive, semantic, export):
             
             search_engine = SemanticSearchEngine()
             
-            with click.progressbar(length=1, label='Performing semantic search') as bar:
-                results = search_engine.semantic_search(query, limit, filters)
-                bar.update(1)
+            results = search_engine.semantic_search(query, limit, filters)
             
             click.echo(f"\n🔍 Semantic search results for: '{query}'")
             click.echo(f"Found {len(results)} results\n")
             
-            for i, (record, score) in enumerate(results, 1):
-                click.echo(f"{i}. {record.title}")
-                click.echo(f"   📊 Relevance: {score:.3f}")
-                if record.reference:
-                    click.echo(f"   📋 Reference: {record.reference}")
-                if record.collection:
-                    click.echo(f"   📚 Collection: {record.collection}")
-                if record.date_from or record.date_to:
-                    date_range = f"{record.date_from or ''} - {record.date_to or ''}".strip(' -')
-                    click.echo(f"   📅 Date: {date_range}")
-                if record.description:
-                    desc = record.description[:200] + "..." if len(record.description) > 200 else record.description
-                    click.echo(f"   📝 {desc}")
-                click.echo()
+            out = [_format_record(record, i, score) for i, (record, score) in enumerate(results, 1)]
+            if out:
+                click.echo("\n".join(out))
         
         else:
             # Use traditional search
-            with click.progressbar(length=1, label='Searching database') as bar:
-                records = db_manager.search_records(query, limit, filters=filters)
-                bar.update(1)
+            records = db_manager.search_records(query, limit, filters=filters)
             
             click.echo(f"\n🔍 Search results for: '{query}'")
             click.echo(f"Found {len(records)} results\n")
             
-            for i, record in enumerate(records, 1):
-                click.echo(f"{i}. {record.title}")
-                if record.reference:
-                    click.echo(f"   📋 Reference: {record.reference}")
-                if record.collection:
-                    click.echo(f"   📚 Collection: {record.collection}")
-                if record.date_from or record.date_to:
-                    date_range = f"{record.date_from or ''} - {record.date_to or ''}".strip(' -')
-                    click.echo(f"   📅 Date: {date_range}")
-                if record.description:
-                    desc = record.description[:200] + "..." if len(record.description) > 200 else record.description
-                    click.echo(f"   📝 {desc}")
-                click.echo()
+            out = [_format_record(record, i) for i, record in enumerate(records, 1)]
+            if out:
+                click.echo("\n".join(out))
         
         # Export results if requested
         if export:
@@ -160,9 +319,9 @@ def fetch(ctx, query, per_page, collection):
     
     try:
         # Initialize components - IP-based access, no API key needed
-        client = DiscoveryClient()
-        db_manager = DatabaseManager()
-        cache_manager = CacheManager()
+        client = _get_client()
+        db_manager = _get_db()
+        cache_manager = _get_cache()
         
         click.echo(f"🔍 Fetching records for: '{query}'")
         click.echo(f"📊 Per page: {per_page} (NO PAGE LIMITS - will fetch ALL records)")
@@ -189,14 +348,14 @@ def fetch(ctx, query, per_page, collection):
                 
                 # Store in batches of 100
                 if len(batch) >= 100:
-                    stored = db_manager.store_records(batch)
+                    stored = db_manager.bulk_upsert(batch)
                     batch = []
                 
                 # The API client handles rate limiting automatically
             
             # Store remaining records
             if batch:
-                db_manager.store_records(batch)
+                db_manager.bulk_upsert(batch)
         
         click.echo(f"\n✅ Successfully fetched and stored {total_records} records")
         
@@ -212,22 +371,29 @@ def fetch(ctx, query, per_page, collection):
 @cli.command()
 @click.argument('series')
 @click.option('--per-page', '-p', default=100, help='Records per page (max 100)')
+@click.option('--force', '-f', is_flag=True, help='Re-enrich records that already have detailed metadata')
 @click.pass_context
-def fetch_series(ctx, series, per_page):
+def fetch_series(ctx, series, per_page, force):
     """Fetch all records from a specific record series (e.g., 'CO 1', 'WO 95') with automatic metadata enrichment"""
     
     try:
-        client = DiscoveryClient()
-        db_manager = DatabaseManager()
+        client = _get_client()
+        db_manager = _get_db()
         
         click.echo(f"🗂️  Fetching records from series: {series}")
         click.echo(f"📊 Per page: {per_page} (NO PAGE LIMITS - will fetch ALL records)")
         click.echo(f"🔍 Automatic metadata enrichment: ENABLED (will fetch detailed metadata for each record)")
         
+        # Records already stored with detailed metadata are not fetched again
+        enriched_ids = set() if force else db_manager.get_enriched_record_ids()
+        if enriched_ids:
+            click.echo(f"⏭️  {len(enriched_ids):,} records already enriched will be skipped (use --force to refresh)")
+        
         total_records = 0
+        skipped_records = 0
         current_page = 0  # Start from page 0
         
-        with tqdm(desc="Fetching series records", unit="page") as pbar:
+        with tqdm(desc="Fetching series records", unit="page", mininterval=0.2, miniters=1, smoothing=0.1) as pbar:
             while True:  # Continue until no more records
                 # Use the new record series search method with Discovery API parameters
                 api_response = client.search_record_series(
@@ -239,16 +405,21 @@ def fetch_series(ctx, series, per_page):
                 # Parse records from the response
                 raw_records = api_response.get('records', [])
                 if not raw_records:
-                    click.echo(f"📝 No more records found at page {current_page}")
+                    pbar.write(f"📝 No more records found at page {current_page}")
                     break
                 
                 # Convert to Record objects with basic metadata
-                from api.models import Record
                 records = [Record.from_api_response(record) for record in raw_records]
                 
+                # Skip records that already carry detailed metadata
+                page_count = len(records)
+                records = [record for record in records if record.id not in enriched_ids]
+                skipped_records += page_count - len(records)
+                
                 # ENHANCED: Automatically enrich each record with detailed metadata
                 enriched_records = []
-                click.echo(f"🔍 Enriching {len(records)} records with detailed metadata...")
+                if records:
+                    pbar.write(f"🔍 Enriching {len(records)} records with detailed metadata...")
                 
                 for i, record in enumerate(records, 1):
                     try:
@@ -258,40 +429,41 @@ def fetch_series(ctx, series, per_page):
                             # Create enriched record with detailed metadata
                             enriched_record = Record.from_detailed_api_response(detailed_data)
                             enriched_records.append(enriched_record)
-                            click.echo(f"  ✅ Enriched {i}/{len(records)}: {enriched_record.reference or enriched_record.id}")
+                            enriched_ids.add(record.id)
+                            pbar.write(f"  ✅ Enriched {i}/{len(records)}: {enriched_record.reference or enriched_record.id}")
                         else:
                             # Fallback to basic record if detailed fetch fails
                             enriched_records.append(record)
-                            click.echo(f"  ⚠️  Basic metadata only for {i}/{len(records)}: {record.reference or record.id}")
+                            pbar.write(f"  ⚠️  Basic metadata only for {i}/{len(records)}: {record.reference or record.id}")
                         
-                        # Rate limiting to be respectful to the API
-                        import time
-                        time.sleep(0.5)
+                        # No extra sleep: the client's limiter already paces
+                        # requests and backs off on 429 (honouring Retry-After)
                         
                     except Exception as e:
-                        click.echo(f"  ❌ Failed to enrich record {i}: {e}")
+                        pbar.write(f"  ❌ Failed to enrich record {i}: {e}")
                         # Fallback to basic record
                         enriched_records.append(record)
                 
                 # Ensure we have the right number of records
                 if len(enriched_records) != len(records):
-                    click.echo(f"⚠️  Warning: Expected {len(records)} records, got {len(enriched_records)}")
+                    pbar.write(f"⚠️  Warning: Expected {len(records)} records, got {len(enriched_records)}")
                     # Use basic records if enrichment failed
                     enriched_records = records
                 
                 # Store enriched records in database
-                try:
-                    stored_count = db_manager.store_records(enriched_records)
-                    total_records += stored_count
-                except Exception as e:
-                    click.echo(f"❌ Failed to store enriched records: {e}")
-                    # Fallback to storing basic records
-                    stored_count = db_manager.store_records(records)
-                    total_records += stored_count
+                if records:
+                    try:
+                        stored_count = db_manager.bulk_upsert(enriched_records)
+                        total_records += stored_count
+                    except Exception as e:
+                        pbar.write(f"❌ Failed to store enriched records: {e}")
+                        # Fallback to storing basic records
+                        stored_count = db_manager.bulk_upsert(records)
+                        total_records += stored_count
                 
                 # Check if we've reached the end (no more records)
                 if len(raw_records) < per_page:
-                    click.echo(f"📝 Reached end of series at page {current_page} (only {len(raw_records)} records)")
+                    pbar.write(f"📝 Reached end of series at page {current_page} (only {len(raw_records)} records)")
                     # Update progress bar for the current page before breaking
                     pbar.update(1)
                     pbar.set_postfix({"total": f"{total_records:,}", "page": current_page + 1})
@@ -302,6 +474,8 @@ def fetch_series(ctx, series, per_page):
                 pbar.set_postfix({"total": f"{total_records:,}", "page": current_page})
         
         click.echo(f"\n✅ Successfully fetched and stored {total_records:,} records from {series} series")
+        if skipped_records:
+            click.echo(f"⏭️  Skipped {skipped_records:,} records that were already enriched")
         click.echo(f"🎯 All records automatically enriched with detailed metadata!")
         
         # Log the API usage
@@ -321,8 +495,8 @@ def bootstrap(ctx, limit):
     """Bootstrap the database with popular searches"""
     
     try:
-        client = DiscoveryClient()
-        db_manager = DatabaseManager()
+        client = _get_client()
+        db_manager = _get_db()
         
         # Get popular search terms
         popular_searches = client.get_popular_searches()
@@ -345,11 +519,11 @@ def bootstrap(ctx, limit):
                     records_count += 1
                     
                     if len(batch) >= 100:
-                        db_manager.store_records(batch)
+                        db_manager.bulk_upsert(batch)
                         batch = []
                 
                 if batch:
-                    db_manager.store_records(batch)
+                    db_manager.bulk_upsert(batch)
                 
                 total_records += records_count
                 click.echo(f"   📊 Stored {records_count} records")
@@ -380,43 +554,42 @@ def index(ctx, batch_size, reset):
         click.echo("❌ Semantic search not available. Install dependencies: pip install sentence-transformers chromadb", err=True)
         return
     
+    search_engine = None
     try:
-        db_manager = DatabaseManager()
+        db_manager = _get_db()
         search_engine = SemanticSearchEngine()
         
         if reset:
             click.echo("🔄 Resetting semantic search index...")
             search_engine.reset_index()
         
-        # Get all records for indexing
+        # Count records for indexing
         click.echo("📊 Getting records from database...")
         
-        # Use a simple query to get all records
-        all_records = db_manager.search_records("", limit=100000)  # Large limit to get all
+        total_records = db_manager.count_records()
         
-        if not all_records:
+        if not total_records:
             click.echo("❌ No records found in database. Run 'fetch' or 'bootstrap' first.")
             return
         
-        click.echo(f"🔍 Indexing {len(all_records)} records...")
+        click.echo(f"🔍 Indexing {total_records} records...")
         
-        # Index in batches with progress bar
+        # Stream records from the database and index them batch by batch
         indexed_count = 0
         
-        with click.progressbar(
-            range(0, len(all_records), batch_size),
-            label='Building index'
-        ) as batch_starts:
-            
-            for start in batch_starts:
-                end = min(start + batch_size, len(all_records))
-                batch = all_records[start:end]
-                
+        with click.progressbar(length=total_records, label='Building index') as bar:
+            for batch in db_manager.iter_all_records(batch_size):
                 batch_indexed = search_engine.index_records_batch(batch, len(batch))
                 indexed_count += batch_indexed
+                bar.update(len(batch))
         
         click.echo(f"\n✅ Successfully indexed {indexed_count} records")
         
+        if FAISS_AVAILABLE:
+            click.echo("⚡ Building FAISS search index...")
+            faiss_count = search_engine.build_faiss_index()
+            click.echo(f"   {faiss_count} vectors in FAISS index")
+        
         # Show index statistics
         stats = search_engine.get_index_stats()
         click.echo(f"📈 Index statistics:")
@@ -427,6 +600,10 @@ def index(ctx, batch_size, reset):
         click.echo(f"❌ Indexing failed: {e}", err=True)
         if ctx.obj['debug']:
             raise
+    finally:
+        # Stops the encoding pool on every exit path
+        if search_engine is not None:
+            search_engine.close()
 
 
 @cli.command('traverse-co')
@@ -437,13 +614,7 @@ def traverse_co(ctx, max_records, resume):
     """Start complete Colonial Office series hierarchical traversal (Workflow.md implementation)"""
     
     try:
-        from api.client import DiscoveryClient
-        from api.traversal import HierarchicalTraverser
-        from storage.database import DatabaseManager
-        
-        client = DiscoveryClient()
-        db_manager = DatabaseManager()
-        traverser = HierarchicalTraverser(client, db_manager)
+        traverser = _get_traverser()
         
         if resume:
             click.echo("🔄 Resuming interrupted CO traversal...")
@@ -488,13 +659,7 @@ def traverse_series(ctx, series_id, max_records):
     """Start traversal of specific CO series (e.g., C243 for CO 1)"""
     
     try:
-        from api.client import DiscoveryClient
-        from api.traversal import HierarchicalTraverser
-        from storage.database import DatabaseManager
-        
-        client = DiscoveryClient()
-        db_manager = DatabaseManager()
-        traverser = HierarchicalTraverser(client, db_manager)
+        traverser = _get_traverser()
         
         click.echo(f"🗂️  Starting traversal of series: {series_id}")
         
@@ -518,13 +683,7 @@ def traversal_status(ctx):
     """Show current traversal status and queue statistics"""
     
     try:
-        from api.client import DiscoveryClient
-        from api.traversal import HierarchicalTraverser
-        from storage.database import DatabaseManager
-        
-        client = DiscoveryClient()
-        db_manager = DatabaseManager()
-        traverser = HierarchicalTraverser(client, db_manager)
+        traverser = _get_traverser()
         
         status = traverser.get_traversal_status()
         
@@ -534,7 +693,7 @@ def traversal_status(ctx):
         
         click.echo("\n📋 Crawl Queue Statistics:")
         for queue_status, count in status['queue_statistics'].items():
-            icon = {"QUEUED": "⏳", "PROCESSING": "🔄", "COMPLETED": "✅", "FAILED": "❌"}.get(queue_status, "📄")
+            icon = _QUEUE_ICONS.get(queue_status, _DEFAULT_ICON)
             click.echo(f"   {icon} {queue_status}: {count:,}")
         
     except Exception as e:
@@ -560,17 +719,12 @@ def validate(ctx, validation_type, series, sample_size, report_format, save_repo
     """Run comprehensive data validation checks"""
     
     try:
-        from validation.validators import DataValidator
         from validation.reports import ValidationReport
-        from storage.database import DatabaseManager
-        from api.client import DiscoveryClient
         
         click.echo(f"🔍 Starting {validation_type} validation...")
         
         # Initialize components
-        db_manager = DatabaseManager()
-        api_client = DiscoveryClient()
-        validator = DataValidator(db_manager, api_client)
+        validator = _get_validator()
         
         # Run validation based on type
         if validation_type == 'full':
@@ -630,7 +784,7 @@ def validate(ctx, validation_type, series, sample_size, report_format, save_repo
             
             # Show key results
             for result in results.get('results', [])[:10]:
-                status_icon = {'PASS': '✅', 'FAIL': '❌', 'WARNING': '⚠️', 'ERROR': '💥'}.get(result['status'], '📄')
+                status_icon = _STATUS_ICONS.get(result['status'], _DEFAULT_ICON)
                 click.echo(f"  {status_icon} {result['check_name']}: {result['message']}")
         
     except Exception as e:
@@ -649,15 +803,9 @@ def validate_series(ctx, series, check_counts, check_hierarchy, verbose):
     """Quick validation for a specific series"""
     
     try:
-        from validation.validators import DataValidator
-        from storage.database import DatabaseManager
-        from api.client import DiscoveryClient
-        
         click.echo(f"🗂️  Validating series: {series}")
         
-        db_manager = DatabaseManager()
-        api_client = DiscoveryClient()
-        validator = DataValidator(db_manager, api_client)
+        validator = _get_validator()
         
         results = validator.validate_series(series)
         
@@ -671,7 +819,7 @@ def validate_series(ctx, series, check_counts, check_hierarchy, verbose):
         if verbose:
             click.echo("\n📋 Detailed Results:")
             for result in results['results']:
-                status_icon = {'PASS': '✅', 'FAIL': '❌', 'WARNING': '⚠️', 'ERROR': '💥'}.get(result['status'], '📄')
+                status_icon = _STATUS_ICONS.get(result['status'], _DEFAULT_ICON)
                 click.echo(f"  {status_icon} {result['check_name']}: {result['message']}")
         
     except Exception as e:
@@ -690,9 +838,8 @@ def data_quality(ctx, summary, trends, alerts):
     
     try:
         from validation.reports import ValidationDashboard
-        from storage.database import DatabaseManager
         
-        db_manager = DatabaseManager()
+        db_manager = _get_db()
         dashboard = ValidationDashboard(db_manager)
         
         if summary or not any([trends, alerts]):
@@ -736,95 +883,108 @@ def data_quality(ctx, summary, trends, alerts):
 @click.option('--start-date', help='Start date for report (YYYY-MM-DD)')
 @click.option('--end-date', help='End date for report (YYYY-MM-DD)')
 @click.option('--save-to', '-o', help='Save report to file')
+@click.option('--cache-stats', is_flag=True, help='Show lineage cache statistics')
 @click.pass_context
-def provenance(ctx, record_id, lineage, report, start_date, end_date, save_to):
+def provenance(ctx, record_id, lineage, report, start_date, end_date, save_to, cache_stats):
     """Show provenance and data lineage information"""
     
     try:
-        from utils.provenance import get_provenance_tracker
-        from storage.database import DatabaseManager
-        
-        db_manager = DatabaseManager()
-        tracker = get_provenance_tracker(db_manager)
+        db_manager = _get_db()
+        tracker = _get_tracker()
+        out = []
         
         if record_id:
             # Show provenance for specific record
-            click.echo(f"📜 Provenance for record: {record_id}")
+            out.append(f"📜 Provenance for record: {record_id}")
             
             if lineage:
                 # Show full data lineage
                 lineage_obj = tracker.create_data_lineage(record_id)
                 if lineage_obj:
-                    click.echo("\n🔗 DATA LINEAGE:")
-                    click.echo(f"  Source: {lineage_obj.source_system}")
-                    click.echo(f"  URL: {lineage_obj.source_url}")
-                    click.echo(f"  Extracted: {lineage_obj.extraction_timestamp}")
-                    click.echo(f"  Parser: {lineage_obj.parser_version}")
-                    click.echo(f"  Quality: {lineage_obj.quality_score or 'Not calculated'}")
-                    click.echo(f"  Confidence: {lineage_obj.confidence_level or 'Not calculated'}")
+                    out.append("\n🔗 DATA LINEAGE:")
+                    out.append(f"  Source: {lineage_obj.source_system}")
+                    out.append(f"  URL: {lineage_obj.source_url}")
+                    out.append(f"  Extracted: {lineage_obj.extraction_timestamp}")
+                    out.append(f"  Parser: {lineage_obj.parser_version}")
+                    out.append(f"  Quality: {lineage_obj.quality_score or 'Not calculated'}")
+                    out.append(f"  Confidence: {lineage_obj.confidence_level or 'Not calculated'}")
                     
                     if lineage_obj.transformation_history:
-                        click.echo(f"\n🔄 TRANSFORMATIONS ({len(lineage_obj.transformation_history)}):")
+                        out.append(f"\n🔄 TRANSFORMATIONS ({len(lineage_obj.transformation_history)}):")
                         for i, transform in enumerate(lineage_obj.transformation_history[:5]):
-                            click.echo(f"  {i+1}. {transform.get('type', 'Unknown')}: {transform.get('description', 'No description')}")
+                            out.append(f"  {i+1}. {transform.get('type', 'Unknown')}: {transform.get('description', 'No description')}")
                     
                     if lineage_obj.validation_history:
-                        click.echo(f"\n✅ VALIDATIONS ({len(lineage_obj.validation_history)}):")
+                        out.append(f"\n✅ VALIDATIONS ({len(lineage_obj.validation_history)}):")
                         for i, validation in enumerate(lineage_obj.validation_history[:5]):
-                            status_icon = {'PASS': '✅', 'FAIL': '❌', 'WARNING': '⚠️', 'ERROR': '💥'}.get(validation.get('status'), '📄')
-                            click.echo(f"  {status_icon} {validation.get('validation_type', 'Unknown')}: {validation.get('status', 'Unknown')}")
+                            status_icon = _STATUS_ICONS.get(validation.get('status'), _DEFAULT_ICON)
+                            out.append(f"  {status_icon} {validation.get('validation_type', 'Unknown')}: {validation.get('status', 'Unknown')}")
                 else:
-                    click.echo("❌ No lineage data found for this record")
+                    out.append("❌ No lineage data found for this record")
             else:
                 # Show basic provenance
                 # This would query the database for basic provenance info
-                click.echo("Basic provenance display not yet implemented")
+                out.append("Basic provenance display not yet implemented")
         
         elif report:
             # Generate comprehensive provenance report
             click.echo("📊 Generating comprehensive provenance report...")
             
-            report_data = tracker.generate_provenance_report(
-                start_date=start_date,
-                end_date=end_date
-            )
+            if save_to:
+                # Stream lineage records straight to disk as they are built
+                report_data, lineage_records = tracker.stream_provenance_report(
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                _write_provenance_report(save_to, report_data, lineage_records)
+            else:
+                report_data = tracker.generate_provenance_report(
+                    start_date=start_date,
+                    end_date=end_date
+                )
             
             # Display summary
             summary = report_data.get('summary', {})
-            click.echo(f"\n📈 PROVENANCE REPORT SUMMARY:")
-            click.echo(f"  Total records: {summary.get('total_records', 0):,}")
-            click.echo(f"  Records with lineage: {summary.get('records_with_lineage', 0):,}")
-            click.echo(f"  Average quality score: {summary.get('average_quality_score', 0):.3f}")
+            out.append(f"\n📈 PROVENANCE REPORT SUMMARY:")
+            out.append(f"  Total records: {summary.get('total_records', 0):,}")
+            out.append(f"  Records with lineage: {summary.get('records_with_lineage', 0):,}")
+            out.append(f"  Average quality score: {summary.get('average_quality_score', 0):.3f}")
             
             # Show statistics
             stats = report_data.get('statistics', {})
             if stats.get('source_methods'):
-                click.echo(f"\n📊 SOURCE METHODS:")
+                out.append(f"\n📊 SOURCE METHODS:")
                 for method, count in stats['source_methods'].items():
-                    click.echo(f"  • {method}: {count:,} records")
+                    out.append(f"  • {method}: {count:,} records")
             
             # Show recommendations
             recommendations = report_data.get('recommendations', [])
             if recommendations:
-                click.echo(f"\n💡 RECOMMENDATIONS:")
+                out.append(f"\n💡 RECOMMENDATIONS:")
                 for rec in recommendations[:5]:
-                    click.echo(f"  • {rec}")
+                    out.append(f"  • {rec}")
             
-            # Save report if requested
             if save_to:
-                import json
-                with open(save_to, 'w') as f:
-                    json.dump(report_data, f, indent=2, default=str)
-                click.echo(f"\n📁 Report saved to: {save_to}")
+                out.append(f"\n📁 Report saved to: {save_to}")
         
         else:
             # Show general provenance statistics
-            click.echo("📊 PROVENANCE SYSTEM STATUS")
-            click.echo("-" * 40)
-            click.echo(f"Session ID: {tracker.session_id}")
-            click.echo(f"System: {tracker.system_info.get('platform', 'Unknown')}")
-            click.echo(f"Python: {tracker.system_info.get('python_version', 'Unknown').split()[0]}")
-            click.echo("\nUse --help for more options")
+            out.append("📊 PROVENANCE SYSTEM STATUS")
+            out.append("-" * 40)
+            out.append(f"Session ID: {tracker.session_id}")
+            out.append(f"System: {tracker.system_info.get('platform', 'Unknown')}")
+            out.append(f"Python: {tracker.system_info.get('python_version', 'Unknown').split()[0]}")
+            out.append("\nUse --help for more options")
+        
+        if cache_stats:
+            lineage_stats = tracker.get_lineage_cache_stats()
+            out.append(f"\n🗃️  LINEAGE CACHE:")
+            out.append(f"  Hits: {lineage_stats['hits']:,}")
+            out.append(f"  Misses: {lineage_stats['misses']:,}")
+            out.append(f"  Hit rate: {lineage_stats['hit_rate']:.1%}")
+            out.append(f"  Entries: {lineage_stats['size']:,} / {lineage_stats['max_size']:,}")
+        
+        click.echo("\n".join(out))
         
     except Exception as e:
         click.echo(f"❌ Provenance operation failed: {e}", err=True)
@@ -838,54 +998,57 @@ def stats(ctx):
     """Show database and system statistics"""
     
     try:
-        db_manager = DatabaseManager()
-        cache_manager = CacheManager()
+        db_manager = _get_db()
+        cache_manager = _get_cache()
         
-        click.echo("📊 National Archives Discovery Clone Statistics\n")
+        # Collect the report and write it in one go
+        out = []
+        out.append("📊 National Archives Discovery Clone Statistics\n")
         
         # Database statistics
-        db_stats = db_manager.get_statistics()
-        click.echo("🗄️  Database:")
-        click.echo(f"   Total records: {db_stats.get('total_records', 0):,}")
-        click.echo(f"   Database size: {db_stats.get('database_size', 0) / (1024*1024):.1f} MB")
+        db_stats = db_manager.get_statistics_cached()
+        out.append("🗄️  Database:")
+        out.append(f"   Total records: {db_stats.get('total_records', 0):,}")
+        out.append(f"   Database size: {db_stats.get('database_size', 0) / (1024*1024):.1f} MB")
         
         if db_stats.get('archives'):
-            click.echo(f"   Top archives:")
+            out.append(f"   Top archives:")
             for archive, count in list(db_stats['archives'].items())[:5]:
-                click.echo(f"     • {archive}: {count:,} records")
+                out.append(f"     • {archive}: {count:,} records")
         
         # Collections
-        collections = db_manager.get_collections()
+        collections = db_manager.get_collections_cached()
         if collections:
-            click.echo(f"\n📚 Collections ({len(collections)} total):")
+            out.append(f"\n📚 Collections ({len(collections)} total):")
             for coll in collections[:10]:
-                click.echo(f"   • {coll['collection']}: {coll['record_count']:,} records")
+                out.append(f"   • {coll['collection']}: {coll['record_count']:,} records")
         
         # Cache statistics
         cache_stats = cache_manager.get_cache_stats()
-        click.echo(f"\n💾 Cache:")
-        click.echo(f"   Active entries: {cache_stats.get('active_entries', 0)}")
-        click.echo(f"   Cache size: {cache_stats.get('size_mb', 0)} MB")
+        out.append(f"\n💾 Cache:")
+        out.append(f"   Active entries: {cache_stats.get('active_entries', 0)}")
+        out.append(f"   Cache size: {cache_stats.get('size_mb', 0)} MB")
         
         # API usage
-        today_requests = db_manager.get_daily_request_count()
-        click.echo(f"\n🌐 API Usage (today):")
-        click.echo(f"   Requests made: {today_requests}/3000")
-        click.echo(f"   Remaining: {3000 - today_requests}")
+        today_requests = db_manager.get_daily_request_count_cached()
+        out.append(f"\n🌐 API Usage (today):")
+        out.append(f"   Requests made: {today_requests}/3000")
+        out.append(f"   Remaining: {3000 - today_requests}")
         
         # Semantic search index
         if SEMANTIC_SEARCH_AVAILABLE:
-            try:
-                search_engine = SemanticSearchEngine()
-                index_stats = search_engine.get_index_stats()
-                
-                click.echo(f"\n🧠 Semantic Search:")
-                click.echo(f"   Indexed records: {index_stats.get('total_records_indexed', 0):,}")
-                click.echo(f"   Model: {index_stats.get('model_name', 'Not loaded')}")
-            except Exception:
-                click.echo(f"\n🧠 Semantic Search: Index not built")
+            index_stats = SemanticSearchEngine.index_stats_only()
+            
+            if index_stats.get('collection_name'):
+                out.append(f"\n🧠 Semantic Search:")
+                out.append(f"   Indexed records: {index_stats.get('total_records_indexed', 0):,}")
+                out.append(f"   Model: {index_stats.get('model_name', 'Not loaded')}")
+            else:
+                out.append(f"\n🧠 Semantic Search: Index not built")
         else:
-            click.echo(f"\n🧠 Semantic Search: Not available (install dependencies)")
+            out.append(f"\n🧠 Semantic Search: Not available (install dependencies)")
+        
+        click.echo("\n".join(out))
         
     except Exception as e:
         click.echo(f"❌ Failed to get statistics: {e}", err=True)
@@ -895,54 +1058,23 @@ def stats(ctx):
 
 @cli.command()
 @click.option('--limit', '-l', default=10, help='Number of records to display')
-@click.option('--reference', '-r', help='Filter by reference (e.g., CO, WO, FO)')
+@click.option('--reference', '-r', help='Filter by reference, comma-separated for several (e.g., CO, "CO 1,WO 95")')
+@click.option('--no-pager', is_flag=True, help='Print directly instead of through a pager')
 @click.pass_context
-def list_records(ctx, limit, reference):
+def list_records(ctx, limit, reference, no_pager):
     """List records in the database"""
     
     try:
-        db_manager = DatabaseManager()
-        
-        # Build query
-        query = "SELECT id, reference, title, date_from, date_to FROM records"
-        params = []
-        
-        if reference:
-            # Fix: Use proper archival reference matching
-            # For series like "CO 1", we want to match:
-            # - "CO 1" (exact series)
-            # - "CO 1/" (series with sub-items)
-            # - "CO 1/1", "CO 1/2", etc. (sub-items)
-            # But NOT "CO 10", "CO 11", etc. (different series)
-            
-            # Split the reference to get series prefix
-            if '/' in reference:
-                # If reference contains "/", match the exact prefix
-                series_prefix = reference.split('/')[0]
-                query += " WHERE reference LIKE ? AND reference NOT LIKE ?"
-                params.append(f"{reference}%")
-                params.append(f"{series_prefix}%/%")  # Exclude other series
-            else:
-                # If reference is just a series (e.g., "CO 1"), match exactly
-                query += " WHERE (reference = ? OR reference LIKE ?) AND reference NOT LIKE ?"
-                params.append(reference)
-                params.append(f"{reference}/%")
-                params.append(f"{reference}%/%")  # Exclude other series like "CO 10"
+        db_manager = _get_db()
         
-        query += " ORDER BY reference, id LIMIT ?"
-        params.append(limit)
+        header = f"📋 Records in Database (showing {limit} records):\n"
         
-        click.echo(f"📋 Records in Database (showing {limit} records):\n")
+        # Series filtering ("CO 1" matches "CO 1/..." but not "CO 10") is an
+        # indexed lookup on reference_series
+        rows = db_manager.list_records(limit, reference)
         
-        import sqlite3
-        with sqlite3.connect(db_manager.db_path) as conn:
-            cursor = conn.execute(query, params)
-            
-            count = 0
-            for row in cursor.fetchall():
-                count += 1
-                record_id, ref, title, date_from, date_to = row
-                
+        def format_rows():
+            for count, (record_id, ref, title, date_from, date_to) in enumerate(rows, 1):
                 # Format dates
                 date_str = ""
                 if date_from and date_to:
@@ -950,11 +1082,24 @@ def list_records(ctx, limit, reference):
                 elif date_from:
                     date_str = f" ({date_from})"
                 
-                click.echo(f"{count:3d}. {ref or 'No Ref':<12} | {record_id:<12} | {title[:60]}...{date_str}")
+                yield f"{count:3d}. {ref or 'No Ref':<12} | {record_id:<12} | {title[:60]}...{date_str}"
         
-        if count == 0:
+        lines = format_rows()
+        first = next(lines, None)
+        
+        if first is None:
+            click.echo(header)
             click.echo("   No records found!")
             click.echo("   Use 'python main.py fetch <query>' to add records.")
+        elif no_pager or limit <= shutil.get_terminal_size().lines:
+            click.echo("\n".join(chain([header, first], lines)))
+        else:
+            # Rows are fetched and formatted only as the pager (or pipe) consumes them
+            click.echo_via_pager(f"{line}\n" for line in chain([header, first], lines))
+        
+    except BrokenPipeError:
+        # The reader (e.g. head) stopped early; silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
         
     except Exception as e:
         click.echo(f"❌ Failed to list records: {e}", err=True)
@@ -1000,8 +1145,8 @@ def cleanup(ctx, days):
     """Clean up old cache and log data"""
     
     try:
-        db_manager = DatabaseManager()
-        cache_manager = CacheManager()
+        db_manager = _get_db()
+        cache_manager = _get_cache()
         
         click.echo(f"🧹 Cleaning up data older than {days} days...")
         
@@ -1019,6 +1164,164 @@ def cleanup(ctx, days):
             raise
 
 
+@lru_cache(maxsize=4096)
+def _format_clock_time(timestamp):
+    """Format a whole-second Unix timestamp as local HH:MM:SS (failures cluster, so memoized)"""
+    return datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')
+
+
+def _record_year(date_text):
+    """
+    Extract the year from a 'yyyy...' or 'dd/mm/yyyy' record date
+    
+    Malformed dates return None rather than raising, so streaming analysis
+    never pays for exception handling on bad rows.
+    
+    Args:
+        date_text: Record date string
+        
+    Returns:
+        Year as int, or None if the date has no leading/trailing year
+    """
+    # Fast path: ISO-style dates start with the year
+    year = date_text[:4]
+    if len(year) == 4 and year.isdecimal():
+        return int(year)
+    
+    year = date_text.rpartition('/')[2][:4]
+    return int(year) if year.isdecimal() else None
+
+
+# Stream analyses take a dict of column lists (see analyze_records_streaming)
+def _archive_stats_analysis(cols):
+    """Analyze archive distribution"""
+    return dict(Counter(archive for archive in cols['archive'] if archive))
+
+
+def _date_distribution_analysis(cols):
+    """Analyze date distribution by decade"""
+    years = (_record_year(date_from) for date_from in cols['date_from'] if date_from)
+    return dict(Counter(f"{(year // 10) * 10}s" for year in years if year is not None))
+
+
+def _word_frequency_analysis(cols):
+    """Analyze word frequency in titles"""
+    words = Counter()
+    findall = _TITLE_WORD_RE.findall
+    for title in cols['title']:
+        if title:
+            words.update(findall(title.lower()))
+    # Return top 50 words
+    return dict(words.most_common(50))
+
+
+# stream-analyze --analysis choices: (analysis function, columns it reads)
+_STREAM_ANALYSES = MappingProxyType({
+    'archive_stats': (_archive_stats_analysis, ('archive',)),
+    'date_distribution': (_date_distribution_analysis, ('date_from',)),
+    'word_frequency': (_word_frequency_analysis, ('title',))
+})
+
+
+def _format_record(record, idx, score=None):
+    """Format a single search result as one block of text (trailing blank line included)"""
+    
+    title = record.title
+    reference = record.reference
+    collection = record.collection
+    date_from = record.date_from
+    date_to = record.date_to
+    description = record.description
+    
+    lines = [f"{idx}. {title}"]
+    if score is not None:
+        lines.append(f"   📊 Relevance: {score:.3f}")
+    if reference:
+        lines.append(f"   📋 Reference: {reference}")
+    if collection:
+        lines.append(f"   📚 Collection: {collection}")
+    if date_from or date_to:
+        date_range = f"{date_from or ''} - {date_to or ''}".strip(' -')
+        lines.append(f"   📅 Date: {date_range}")
+    if description:
+        desc = (description[:200] + "...") if len(description) > 200 else description
+        lines.append(f"   📝 {desc}")
+    lines.append("")
+    
+    return "\n".join(lines)
+
+
+def _json_bytes(obj):
+    """Encode obj as compact UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _json_pretty_bytes(obj):
+    """Encode obj as 2-space indented UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _write_provenance_report(filename, report_data, lineage_records):
+    """
+    Write a provenance report to disk one lineage record at a time
+    
+    Files ending in .ndjson start with a line holding the report header and
+    summary, followed by one lineage record per line. The summary line leaves
+    out records_with_lineage, which is the number of lines after it. Anything
+    else gets a single JSON document with the summary written after the
+    records.
+    
+    Args:
+        filename: Output path
+        report_data: Report without its records (from stream_provenance_report)
+        lineage_records: Iterator of lineage dicts
+        
+    Returns:
+        Number of lineage records written
+    """
+    count = 0
+    summary = report_data.setdefault('summary', {})
+    ndjson = filename.endswith('.ndjson')
+    
+    with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+        if ndjson:
+            # records_with_lineage is only known once the records are written
+            header = dict(report_data, summary={
+                key: value for key, value in summary.items() if key != 'records_with_lineage'
+            })
+            f.write(_json_bytes(header))
+            f.write(b"\n")
+        else:
+            header = {key: value for key, value in report_data.items() if key != 'summary'}
+            
+            # Reopen the header object so records and summary can follow it
+            f.write(_json_bytes(header)[:-1])
+            f.write(b', "records": [' if header else b'"records": [')
+        
+        for record in lineage_records:
+            if ndjson:
+                f.write(_json_bytes(record))
+                f.write(b"\n")
+            else:
+                f.write(b",\n  " if count else b"\n  ")
+                f.write(_json_bytes(record))
+            count += 1
+        
+        if summary:
+            summary['records_with_lineage'] = count
+        
+        if not ndjson:
+            f.write(b'\n], "summary": ')
+            f.write(_json_bytes(summary))
+            f.write(b"}\n")
+    
+    return count
+
+
 def export_results(results, filename, query):
     """Export search results to file"""
     
@@ -1036,15 +1339,26 @@ def export_results(results, filename, query):
                 result_data['relevance_score'] = score
                 export_data['results'].append(result_data)
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                # orjson encodes straight to UTF-8 bytes in C
+                payload = orjson.dumps(
+                    export_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                )
+                with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(payload)
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
         
         elif filename.endswith('.csv'):
             # Export as CSV
-            import csv
             
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
+            format_score = "{:.3f}".format
+            
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_EXPORT_BUFFER_SIZE) as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
                 
                 # Header
                 writer.writerow([
@@ -1053,8 +1367,8 @@ def export_results(results, filename, query):
                 ])
                 
                 # Data
-                for record, score in results:
-                    writer.writerow([
+                writer.writerows(
+                    (
                         record.title,
                         record.reference or '',
                         record.collection or '',
@@ -1062,8 +1376,30 @@ def export_results(results, filename, query):
                         record.date_from or '',
                         record.date_to or '',
                         record.description or '',
-                        f"{score:.3f}"
-                    ])
+                        format_score(score)
+                    )
+                    for record, score in results
+                )
+        
+        elif filename.endswith('.parquet'):
+            # Export as Parquet (columnar, for pandas/duckdb analysis)
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("pyarrow is required for Parquet export. Install with: pip install pyarrow")
+            
+            table = pa.table({
+                'title': [record.title for record, _ in results],
+                'reference': [record.reference or '' for record, _ in results],
+                'collection': [record.collection or '' for record, _ in results],
+                'archive': [record.archive or '' for record, _ in results],
+                'date_from': [record.date_from or '' for record, _ in results],
+                'date_to': [record.date_to or '' for record, _ in results],
+                'description': [record.description or '' for record, _ in results],
+                'relevance_score': pa.array([float(score) for _, score in results], type=pa.float64())
+            })
+            pq.write_table(table, filename, compression='zstd', use_dictionary=True)
         
         click.echo(f"📄 Results exported to {filename}")
         
@@ -1093,89 +1429,87 @@ def main():
 @click.option('--fields', '-f', help='Restrict to fields (comma-separated: title,description,reference,people,places,subjects)')
 @click.option('--sort', '-s', type=click.Choice(['RELEVANCE', 'REFERENCE_ASCENDING', 'DATE_ASCENDING', 'DATE_DESCENDING', 'TITLE_ASCENDING', 'TITLE_DESCENDING']), default='RELEVANCE', help='Sort option')
 @click.option('--limit', '-l', type=int, default=20, help='Number of results to return')
-@click.option('--preset', type=click.Choice(['wwi', 'wwii', 'colonial']), help='Use preset search configuration')
+@click.option('--preset', type=click.Choice(list(PRESETS)), help='Use preset search configuration')
 @click.pass_context
 def advanced_search(ctx, exact_phrase, person, place, departments, start_year, end_year, 
                    closure_status, repository, online_only, wildcard, and_terms, or_terms, 
                    not_terms, fields, sort, limit, preset):
     """Advanced search with boolean operators, wildcards, and field restrictions (API Bible Section 5.1)"""
     try:
-        from api.advanced_search import SmartQueryBuilder
-        from api.client import DiscoveryClient
+        overrides = (exact_phrase, person, place, departments, start_year, end_year, closure_status,
+                     repository, online_only, wildcard, and_terms, or_terms, not_terms, fields)
         
-        # Initialize search builder
-        if preset:
-            builder = SmartQueryBuilder()
-            if preset == 'wwi':
-                builder.search_wwi_records()
-            elif preset == 'wwii':
-                builder.search_wwii_records()
-            elif preset == 'colonial':
-                builder.search_colonial_office()
+        if preset and not any(overrides):
+            # Preset-only searches always build the same parameters
+            params = SmartQueryBuilder.preset_params(preset, page=0, per_page=limit, sort_option=sort)
         else:
+            # Initialize search builder
             builder = SmartQueryBuilder()
+            if preset:
+                getattr(builder, PRESETS[preset])()
+            
+            # Add search terms
+            if exact_phrase:
+                builder.exact_phrase(exact_phrase)
+            
+            if person:
+                builder.search_person(person, approximate=True)
+            
+            if place:
+                builder.search_place(place, approximate=True)
+            
+            if wildcard:
+                builder.wildcard(wildcard)
+            
+            if and_terms:
+                terms = and_terms.split(',')
+                if len(terms) == 2:
+                    builder.boolean_and(terms[0].strip(), terms[1].strip())
+                else:
+                    click.echo("Error: --and-terms requires exactly 2 terms separated by comma")
+                    return
+            
+            if or_terms:
+                terms = or_terms.split(',')
+                if len(terms) == 2:
+                    builder.boolean_or(terms[0].strip(), terms[1].strip())
+                else:
+                    click.echo("Error: --or-terms requires exactly 2 terms separated by comma")
+                    return
+            
+            if not_terms:
+                terms = not_terms.split(',')
+                if len(terms) == 2:
+                    builder.boolean_not(terms[0].strip(), terms[1].strip())
+                else:
+                    click.echo("Error: --not-terms requires exactly 2 terms separated by comma")
+                    return
+            
+            # Add filters
+            if departments:
+                dept_list = [d.strip().upper() for d in departments.split(',')]
+                builder.add_departments(dept_list)
+            
+            if start_year and end_year:
+                builder.add_date_range(start_year, end_year)
+            
+            if closure_status:
+                builder.add_closure_status([closure_status.upper()])
+            
+            if repository:
+                builder.add_repository_filter(repository)
+            
+            if online_only:
+                builder.only_online(True)
+            
+            if fields:
+                field_list = [f.strip() for f in fields.split(',')]
+                builder.restrict_to_fields(field_list)
+            
+            params = builder.build_params(page=0, per_page=limit, sort_option=sort)
         
-        # Add search terms
-        if exact_phrase:
-            builder.exact_phrase(exact_phrase)
-        
-        if person:
-            builder.search_person(person, approximate=True)
-        
-        if place:
-            builder.search_place(place, approximate=True)
-        
-        if wildcard:
-            builder.wildcard(wildcard)
-        
-        if and_terms:
-            terms = and_terms.split(',')
-            if len(terms) == 2:
-                builder.boolean_and(terms[0].strip(), terms[1].strip())
-            else:
-                click.echo("Error: --and-terms requires exactly 2 terms separated by comma")
-                return
-        
-        if or_terms:
-            terms = or_terms.split(',')
-            if len(terms) == 2:
-                builder.boolean_or(terms[0].strip(), terms[1].strip())
-            else:
-                click.echo("Error: --or-terms requires exactly 2 terms separated by comma")
-                return
-        
-        if not_terms:
-            terms = not_terms.split(',')
-            if len(terms) == 2:
-                builder.boolean_not(terms[0].strip(), terms[1].strip())
-            else:
-                click.echo("Error: --not-terms requires exactly 2 terms separated by comma")
-                return
-        
-        # Add filters
-        if departments:
-            dept_list = [d.strip().upper() for d in departments.split(',')]
-            builder.add_departments(dept_list)
-        
-        if start_year and end_year:
-            builder.add_date_range(start_year, end_year)
-        
-        if closure_status:
-            builder.add_closure_status([closure_status.upper()])
-        
-        if repository:
-            builder.add_repository_filter(repository)
-        
-        if online_only:
-            builder.only_online(True)
-        
-        if fields:
-            field_list = [f.strip() for f in fields.split(',')]
-            builder.restrict_to_fields(field_list)
-        
-        # Build and execute search
-        client = DiscoveryClient()
-        params = builder.build_params(page=0, per_page=limit, sort_option=sort)
+        # Execute search
+        client = _get_client()
         
         click.echo(f"\n=== Advanced Search Query ===")
         click.echo(f"Query: {params.get('sps.searchQuery', 'No query terms')}")
@@ -1217,38 +1551,36 @@ def advanced_search(ctx, exact_phrase, person, place, departments, start_year, e
 def browse_repositories(ctx, name_filter, limit, stats):
     """Browse and search repositories/archives (API Bible Section 3.3)"""
     try:
-        from api.repository import RepositoryClient
-        
-        repo_client = RepositoryClient()
+        repo_client = RepositoryClient(_get_client())
+        out = []
         
         if stats:
             statistics = repo_client.get_repository_statistics()
-            click.echo(f"\n=== Repository Statistics ===")
-            click.echo(f"Total repositories: {statistics.get('total_repositories', 0)}")
-            click.echo(f"TNA repositories: {statistics.get('tna_repositories', 0)}")
-            click.echo(f"Other repositories: {statistics.get('other_repositories', 0)}")
+            out.append(f"\n=== Repository Statistics ===")
+            out.append(f"Total repositories: {statistics.get('total_repositories', 0)}")
+            out.append(f"TNA repositories: {statistics.get('tna_repositories', 0)}")
+            out.append(f"Other repositories: {statistics.get('other_repositories', 0)}")
+            click.echo("\n".join(out))
             return
         
         if name_filter:
             repositories = repo_client.search_repositories(name_filter)
-            click.echo(f"\n=== Repositories matching '{name_filter}' ===")
+            out.append(f"\n=== Repositories matching '{name_filter}' ===")
         else:
             repositories = repo_client.list_repositories(limit)
-            click.echo(f"\n=== First {limit} Repositories ===")
+            out.append(f"\n=== First {limit} Repositories ===")
         
         for i, repo in enumerate(repositories[:limit], 1):
-            name = repo.get('Name', repo.get('name', 'Unknown'))
-            repo_type = repo.get('Type', repo.get('type', 'Unknown'))
-            click.echo(f"{i}. {name} ({repo_type})")
+            out.append(f"{i}. {repo.name or 'Unknown'} ({repo.repo_type or 'Unknown'})")
             
             # Show additional info if available
-            if 'Description' in repo or 'description' in repo:
-                desc = repo.get('Description', repo.get('description', ''))[:100]
-                if desc:
-                    click.echo(f"   Description: {desc}...")
+            if repo.description:
+                out.append(f"   Description: {repo.description[:100]}...")
         
         if not repositories:
-            click.echo("No repositories found.")
+            out.append("No repositories found.")
+        
+        click.echo("\n".join(out))
             
     except Exception as e:
         click.echo(f"Error browsing repositories: {e}")
@@ -1263,41 +1595,38 @@ def browse_repositories(ctx, name_filter, limit, stats):
 def browse_creators(ctx, creator_type, name_search, limit, stats):
     """Browse creators/file authorities by type (API Bible Section 3.1)"""
     try:
-        from api.creator import CreatorClient
-        
-        creator_client = CreatorClient()
+        creator_client = CreatorClient(_get_client(), _get_db().get_daily_request_count)
+        out = []
         
         if stats:
             statistics = creator_client.get_creator_statistics()
-            click.echo(f"\n=== Creator Statistics ===")
+            out.append(f"\n=== Creator Statistics ===")
             for ctype, count in statistics.get('by_type', {}).items():
-                click.echo(f"{ctype}: {count}")
-            click.echo(f"Total: {statistics.get('total_creators', 0)}")
+                out.append(f"{ctype}: {count}")
+            out.append(f"Total: {statistics.get('total_creators', 0)}")
+            click.echo("\n".join(out))
             return
         
         if name_search:
             creators = creator_client.search_creators_by_name(name_search, creator_type)
-            click.echo(f"\n=== {creator_type} creators matching '{name_search}' ===")
+            out.append(f"\n=== {creator_type} creators matching '{name_search}' ===")
         else:
-            response = creator_client.search_creators(creator_type, limit)
-            creators = response.get('Creators', response.get('creators', []))
-            click.echo(f"\n=== First {limit} {creator_type} creators ===")
+            creators = creator_client.list_creators(creator_type, limit)
+            out.append(f"\n=== First {limit} {creator_type} creators ===")
         
         for i, creator in enumerate(creators[:limit], 1):
-            name = creator.get('AuthorityName', creator.get('Name', 'Unknown'))
-            epithet = creator.get('Epithet', '')
-            
-            click.echo(f"{i}. {name}")
-            if epithet:
-                click.echo(f"   {epithet}")
+            out.append(f"{i}. {creator.name or 'Unknown'}")
+            if creator.epithet:
+                out.append(f"   {creator.epithet}")
             
             # Show biography snippet if available
-            bio = creator.get('BiographyHistory', '')
-            if bio and len(bio) > 50:
-                click.echo(f"   Bio: {bio[:100]}...")
+            if len(creator.biography) > 50:
+                out.append(f"   Bio: {creator.biography[:100]}...")
         
         if not creators:
-            click.echo(f"No {creator_type} creators found.")
+            out.append(f"No {creator_type} creators found.")
+        
+        click.echo("\n".join(out))
             
     except Exception as e:
         click.echo(f"Error browsing creators: {e}")
@@ -1312,39 +1641,39 @@ def browse_creators(ctx, creator_type, name_search, limit, stats):
 def cache_management(ctx, stats, cleanup, invalidate, clear):
     """Manage and monitor intelligent cache system"""
     try:
-        from api.intelligent_cache import get_intelligent_cache
-        
         cache = get_intelligent_cache()
         
         if stats:
             statistics = cache.get_statistics()
             
-            click.echo(f"\n=== Cache Performance Statistics ===")
+            out = []
+            out.append(f"\n=== Cache Performance Statistics ===")
             perf = statistics.get('performance', {})
-            click.echo(f"Hit Rate: {perf.get('hit_rate_percent', 0):.1f}%")
-            click.echo(f"Total Requests: {perf.get('total_requests', 0)}")
-            click.echo(f"Cache Hits: {perf.get('cache_hits', 0)} (Memory: {perf.get('memory_hits', 0)}, Disk: {perf.get('disk_hits', 0)})")
-            click.echo(f"Cache Misses: {perf.get('cache_misses', 0)}")
-            click.echo(f"Invalidations: {perf.get('invalidations', 0)}")
+            out.append(f"Hit Rate: {perf.get('hit_rate_percent', 0):.1f}%")
+            out.append(f"Total Requests: {perf.get('total_requests', 0)}")
+            out.append(f"Cache Hits: {perf.get('cache_hits', 0)} (Memory: {perf.get('memory_hits', 0)}, Disk: {perf.get('disk_hits', 0)})")
+            out.append(f"Cache Misses: {perf.get('cache_misses', 0)}")
+            out.append(f"Invalidations: {perf.get('invalidations', 0)}")
             
-            click.echo(f"\n=== Cache Storage ===")
+            out.append(f"\n=== Cache Storage ===")
             storage = statistics.get('storage', {})
-            click.echo(f"Total Entries: {storage.get('total_entries', 0)}")
-            click.echo(f"Memory Entries: {storage.get('memory_entries', 0)}")
-            click.echo(f"Disk Size: {storage.get('disk_size_bytes', 0):,} bytes")
-            click.echo(f"Memory Size: {storage.get('memory_size_bytes', 0):,} bytes")
+            out.append(f"Total Entries: {storage.get('total_entries', 0)}")
+            out.append(f"Memory Entries: {storage.get('memory_entries', 0)}")
+            out.append(f"Disk Size: {storage.get('disk_size_bytes', 0):,} bytes")
+            out.append(f"Memory Size: {storage.get('memory_size_bytes', 0):,} bytes")
             
             entries_by_type = storage.get('entries_by_type', {})
             if entries_by_type:
-                click.echo(f"\nEntries by Type:")
+                out.append(f"\nEntries by Type:")
                 for cache_type, count in entries_by_type.items():
-                    click.echo(f"  {cache_type}: {count}")
+                    out.append(f"  {cache_type}: {count}")
             
-            click.echo(f"\n=== Configuration ===")
+            out.append(f"\n=== Configuration ===")
             config = statistics.get('configuration', {})
-            click.echo(f"Static Data TTL: {config.get('static_ttl_hours', 0):.1f} hours")
-            click.echo(f"Dynamic Data TTL: {config.get('dynamic_ttl_hours', 0):.1f} hours")
-            click.echo(f"Record Data TTL: {config.get('record_ttl_hours', 0):.1f} hours")
+            out.append(f"Static Data TTL: {config.get('static_ttl_hours', 0):.1f} hours")
+            out.append(f"Dynamic Data TTL: {config.get('dynamic_ttl_hours', 0):.1f} hours")
+            out.append(f"Record Data TTL: {config.get('record_ttl_hours', 0):.1f} hours")
+            click.echo("\n".join(out))
             
         if cleanup:
             click.echo("Cleaning up expired cache entries...")
@@ -1378,10 +1707,7 @@ def cache_management(ctx, stats, cleanup, invalidate, clear):
 def batch_fetch(ctx, record_ids, batch_size, priority, timeout, stats):
     """Efficiently fetch multiple records using request batching"""
     try:
-        from api.batch_manager import BatchRequestManager
-        from api.client import DiscoveryClient
-        
-        client = DiscoveryClient()
+        client = _get_client()
         
         with BatchRequestManager(client, batch_size=batch_size) as batch_manager:
             if stats:
@@ -1404,39 +1730,41 @@ def batch_fetch(ctx, record_ids, batch_size, priority, timeout, stats):
                 
                 click.echo(f"Submitted {len(request_ids)} requests...")
                 
-                # Wait for results
-                results = batch_manager.wait_for_results(request_ids, timeout=timeout)
-                
-                # Display results
-                successful = sum(1 for r in results if r.success)
-                failed = len(results) - successful
-                
+                # Display each result as soon as it completes
                 click.echo(f"\n=== Batch Results ===")
-                click.echo(f"Successful: {successful}")
-                click.echo(f"Failed: {failed}")
+                successful = 0
                 
-                for i, result in enumerate(results, 1):
+                for i, (_, result) in enumerate(batch_manager.iter_completions(request_ids, timeout=timeout), 1):
                     if result.success and result.data:
+                        successful += 1
                         record = result.data
-                        click.echo(f"\n{i}. ✅ [{record.reference}] {record.title}")
+                        lines = [f"\n{i}. ✅ [{record.reference}] {record.title}"]
                         if record.date_from or record.date_to:
-                            click.echo(f"   Dates: {record.date_from} - {record.date_to}")
-                        click.echo(f"   Processing Time: {result.processing_time:.3f}s")
+                            lines.append(f"   Dates: {record.date_from} - {record.date_to}")
+                        lines.append(f"   Processing Time: {result.processing_time:.3f}s")
                     else:
-                        click.echo(f"\n{i}. ❌ Error: {result.error}")
+                        lines = [f"\n{i}. ❌ Error: {result.error}"]
+                    click.echo("\n".join(lines))
+                
+                # Summary and final statistics are written as one block
+                out = []
+                out.append(f"\nSuccessful: {successful}")
+                out.append(f"Failed: {len(request_ids) - successful}")
                 
                 # Show final statistics
                 if stats:
                     final_stats = batch_manager.get_statistics()
-                    click.echo(f"\n=== Final Statistics ===")
-                    click.echo(f"Total Requests Processed: {final_stats['total_requests']}")
-                    click.echo(f"Successful Batches: {final_stats['successful_batches']}")
-                    click.echo(f"Average Batch Time: {final_stats['average_batch_time']:.3f}s")
-                    click.echo(f"Requests Batched: {final_stats['requests_batched']}")
+                    out.append(f"\n=== Final Statistics ===")
+                    out.append(f"Total Requests Processed: {final_stats['total_requests']}")
+                    out.append(f"Successful Batches: {final_stats['successful_batches']}")
+                    out.append(f"Average Batch Time: {final_stats['average_batch_time']:.3f}s")
+                    out.append(f"Requests Batched: {final_stats['requests_batched']}")
                     
                     if final_stats['requests_batched'] > 0:
                         efficiency = (final_stats['requests_batched'] / final_stats['total_requests']) * 100
-                        click.echo(f"Batching Efficiency: {efficiency:.1f}%")
+                        out.append(f"Batching Efficiency: {efficiency:.1f}%")
+                
+                click.echo("\n".join(out))
             
     except Exception as e:
         click.echo(f"Error in batch fetch: {e}")
@@ -1452,10 +1780,7 @@ def batch_fetch(ctx, record_ids, batch_size, priority, timeout, stats):
 def batch_search(ctx, queries, batch_size, priority, limit, timeout):
     """Efficiently execute multiple searches using request batching"""
     try:
-        from api.batch_manager import BatchRequestManager
-        from api.client import DiscoveryClient
-        
-        client = DiscoveryClient()
+        client = _get_client()
         
         with BatchRequestManager(client, batch_size=batch_size) as batch_manager:
             click.echo(f"\n=== Batch Searching {len(queries)} Queries ===")
@@ -1473,33 +1798,46 @@ def batch_search(ctx, queries, batch_size, priority, limit, timeout):
             
             click.echo(f"Submitted {len(request_ids)} search requests...")
             
-            # Wait for results
-            results = batch_manager.wait_for_results(request_ids, timeout=timeout)
-            
-            # Display results
             click.echo(f"\n=== Search Results ===")
             
-            for i, (query, result) in enumerate(zip(queries, results), 1):
-                click.echo(f"\n{i}. Query: '{query}'")
+            # Results arrive in completion order; each query is shown as soon
+            # as it and every query before it have completed
+            positions = {request_id: i for i, request_id in enumerate(request_ids)}
+            results = [None] * len(request_ids)
+            shown = 0
+            
+            for request_id, result in batch_manager.iter_completions(request_ids, timeout=timeout):
+                results[positions[request_id]] = result
                 
-                if result.success and result.data:
-                    search_result = result.data
-                    click.echo(f"   Results: {search_result.total_results} total, showing {len(search_result.records)}")
-                    click.echo(f"   Processing Time: {result.processing_time:.3f}s")
+                while shown < len(results) and results[shown] is not None:
+                    result = results[shown]
+                    shown += 1
                     
-                    for j, record in enumerate(search_result.records[:3], 1):  # Show first 3
-                        click.echo(f"   {j}. [{record.reference}] {record.title}")
+                    out = [f"\n{shown}. Query: '{queries[shown - 1]}'"]
                     
-                    if len(search_result.records) > 3:
-                        click.echo(f"   ... and {len(search_result.records) - 3} more")
-                else:
-                    click.echo(f"   ❌ Error: {result.error}")
+                    if result.success and result.data:
+                        search_result = result.data
+                        out.append(f"   Results: {search_result.total_results} total, showing {len(search_result.records)}")
+                        out.append(f"   Processing Time: {result.processing_time:.3f}s")
+                        
+                        for j, record in enumerate(search_result.records[:3], 1):  # Show first 3
+                            out.append(f"   {j}. [{record.reference}] {record.title}")
+                        
+                        if len(search_result.records) > 3:
+                            out.append(f"   ... and {len(search_result.records) - 3} more")
+                    else:
+                        out.append(f"   ❌ Error: {result.error}")
+                    
+                    click.echo("\n".join(out))
             
             # Show statistics
             stats = batch_manager.get_statistics()
-            click.echo(f"\n=== Batch Statistics ===")
-            click.echo(f"Successful Batches: {stats['successful_batches']}")
-            click.echo(f"Average Batch Time: {stats['average_batch_time']:.3f}s")
+            out = []
+            out.append(f"\n=== Batch Statistics ===")
+            out.append(f"Successful Batches: {stats['successful_batches']}")
+            out.append(f"Average Batch Time: {stats['average_batch_time']:.3f}s")
+            
+            click.echo("\n".join(out))
             
     except Exception as e:
         click.echo(f"Error in batch search: {e}")
@@ -1516,10 +1854,7 @@ def batch_search(ctx, queries, batch_size, priority, limit, timeout):
 def health_monitoring(ctx, monitor, status, history, errors, check, interval):
     """API health monitoring and diagnostics"""
     try:
-        from api.health_monitor import APIHealthMonitor, setup_console_alerts
-        from api.client import DiscoveryClient
-        
-        client = DiscoveryClient()
+        client = _get_client()
         
         if monitor:
             click.echo(f"🏥 Starting API Health Monitor (interval={interval}s)")
@@ -1531,32 +1866,48 @@ def health_monitoring(ctx, monitor, status, history, errors, check, interval):
             with APIHealthMonitor(client, check_interval=interval) as monitor:
                 monitor.add_alert_callback(alert_handler)
                 
+                last_body = None
+                
                 try:
                     while True:
-                        time.sleep(5)  # Check every 5 seconds for display updates
+                        # Redraw only when a health check has completed; the
+                        # timeout just keeps Ctrl+C responsive while idle
+                        if not monitor.completion_event.wait(timeout=5):
+                            continue
+                        monitor.completion_event.clear()
                         
-                        # Show current status
+                        # Show current status, building the whole frame before
+                        # clearing so the screen is redrawn in one write
                         summary = monitor.get_health_summary()
-                        click.clear()
-                        click.echo(f"🏥 API Health Monitor - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                        click.echo(f"Overall Status: {summary['overall_status']} | Success Rate: {summary['overall_success_rate']:.1f}%")
-                        click.echo(f"Avg Response Time: {summary['average_response_time']:.3f}s | Checks/Hour: {summary['total_checks_last_hour']}")
-                        click.echo()
+                        frame = []
+                        frame.append(f"Overall Status: {summary['overall_status']} | Success Rate: {summary['overall_success_rate']:.1f}%")
+                        frame.append(f"Avg Response Time: {summary['average_response_time']:.3f}s | Checks/Hour: {summary['total_checks_last_hour']}")
+                        frame.append("")
                         
                         for endpoint, stats in summary['endpoints'].items():
                             status_icon = "✅" if stats['status'] == "HEALTHY" else "⚠️" if stats['status'] == "WARNING" else "❌"
-                            click.echo(f"{status_icon} {endpoint}")
-                            click.echo(f"   Status: {stats['status']} | Success: {stats['success_rate']:.1f}% | Response: {stats['average_response_time']:.3f}s")
+                            frame.append(f"{status_icon} {endpoint}")
+                            frame.append(f"   Status: {stats['status']} | Success: {stats['success_rate']:.1f}% | Response: {stats['average_response_time']:.3f}s")
                             if stats['consecutive_failures'] > 0:
-                                click.echo(f"   ⚠️ Consecutive Failures: {stats['consecutive_failures']}")
+                                frame.append(f"   ⚠️ Consecutive Failures: {stats['consecutive_failures']}")
+                        
+                        frame.append("\nPress Ctrl+C to stop monitoring...")
                         
-                        click.echo("\nPress Ctrl+C to stop monitoring...")
+                        # Skip the clear + rewrite when nothing but the
+                        # clock in the header line would change
+                        body = "\n".join(frame)
+                        if body == last_body:
+                            continue
+                        last_body = body
+                        
+                        click.clear()
+                        click.echo(f"🏥 API Health Monitor - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n{body}")
                         
                 except KeyboardInterrupt:
                     click.echo("\n\n✅ Health monitoring stopped.")
         
         elif status:
-            monitor = APIHealthMonitor(client)
+            monitor = get_health_monitor(client)
             
             # Perform quick health checks
             click.echo("🏥 Performing Health Checks...\n")
@@ -1578,10 +1929,12 @@ def health_monitoring(ctx, monitor, status, history, errors, check, interval):
             
             # Show summary
             summary = monitor.get_health_summary()
-            click.echo(f"\n=== Health Summary ===")
-            click.echo(f"Overall Status: {summary['overall_status']}")
-            click.echo(f"Success Rate: {summary['overall_success_rate']:.1f}%")
-            click.echo(f"Average Response Time: {summary['average_response_time']:.3f}s")
+            out = []
+            out.append(f"\n=== Health Summary ===")
+            out.append(f"Overall Status: {summary['overall_status']}")
+            out.append(f"Success Rate: {summary['overall_success_rate']:.1f}%")
+            out.append(f"Average Response Time: {summary['average_response_time']:.3f}s")
+            click.echo("\n".join(out))
         
         elif history:
             try:
@@ -1591,7 +1944,7 @@ def health_monitoring(ctx, monitor, status, history, errors, check, interval):
                 click.echo("Error: History format should be 'endpoint:hours' (e.g., 'search/v1/records:24')")
                 return
             
-            monitor = APIHealthMonitor(client)
+            monitor = get_health_monitor(client)
             history_data = monitor.get_endpoint_history(endpoint, hours)
             
             if not history_data:
@@ -1601,44 +1954,53 @@ def health_monitoring(ctx, monitor, status, history, errors, check, interval):
             click.echo(f"\n=== {endpoint} History (Last {hours} hours) ===")
             click.echo(f"Total Checks: {len(history_data)}")
             
-            successful = sum(1 for check in history_data if check['success'])
+            # Success count and response time total in a single pass
+            successful = 0
+            total_response_time = 0.0
+            for check in history_data:
+                if check['success']:
+                    successful += 1
+                    total_response_time += check['response_time']
+            
             click.echo(f"Success Rate: {(successful/len(history_data)*100):.1f}%")
             
-            response_times = [check['response_time'] for check in history_data if check['success']]
-            if response_times:
-                click.echo(f"Avg Response Time: {statistics.mean(response_times):.3f}s")
+            if successful:
+                click.echo(f"Avg Response Time: {total_response_time / successful:.3f}s")
             
             # Show recent failures
             failures = [check for check in history_data if not check['success']]
             if failures:
                 click.echo(f"\nRecent Failures ({len(failures)}):")
                 for failure in failures[-5:]:  # Last 5 failures
-                    timestamp = datetime.fromtimestamp(failure['timestamp']).strftime('%H:%M:%S')
+                    timestamp = _format_clock_time(int(failure['timestamp']))
                     click.echo(f"  {timestamp}: {failure['error_type']} - {failure['error_message']}")
         
         elif errors is not None:
-            monitor = APIHealthMonitor(client)
+            monitor = get_health_monitor(client)
             error_analysis = monitor.get_error_analysis(errors)
             
-            click.echo(f"\n=== Error Analysis (Last {errors} hours) ===")
-            click.echo(f"Total Errors: {error_analysis['total_errors']}")
-            click.echo(f"Error Rate: {error_analysis['error_rate']:.1f}%")
+            out = []
+            out.append(f"\n=== Error Analysis (Last {errors} hours) ===")
+            out.append(f"Total Errors: {error_analysis['total_errors']}")
+            out.append(f"Error Rate: {error_analysis['error_rate']:.1f}%")
             
             if error_analysis['error_types']:
-                click.echo("\nError Types:")
+                out.append("\nError Types:")
                 for error_type, count in error_analysis['error_types'].items():
-                    click.echo(f"  {error_type}: {count}")
+                    out.append(f"  {error_type}: {count}")
             
             if error_analysis['error_endpoints']:
-                click.echo("\nErrors by Endpoint:")
+                out.append("\nErrors by Endpoint:")
                 for endpoint, count in error_analysis['error_endpoints'].items():
-                    click.echo(f"  {endpoint}: {count}")
+                    out.append(f"  {endpoint}: {count}")
             
             if error_analysis['most_common_error']:
-                click.echo(f"\nMost Common Error: {error_analysis['most_common_error']}")
+                out.append(f"\nMost Common Error: {error_analysis['most_common_error']}")
+            
+            click.echo("\n".join(out))
         
         elif check:
-            monitor = APIHealthMonitor(client)
+            monitor = get_health_monitor(client)
             click.echo(f"Performing health check on {check}...")
             
             health_check = monitor.perform_health_check(check, {})
@@ -1670,14 +2032,11 @@ def health_monitoring(ctx, monitor, status, history, errors, check, interval):
 def stream_fetch(ctx, query, max_records, chunk_size, memory_limit, output):
     """Fetch large datasets using memory-efficient streaming"""
     try:
-        from utils.streaming import StreamingRecordProcessor, StreamingConfig
-        from api.client import DiscoveryClient
-        
         click.echo(f"🔄 Starting streaming fetch for '{query}'")
         click.echo(f"📊 Max records: {max_records}, Chunk size: {chunk_size}, Memory limit: {memory_limit}MB")
         
         # Initialize components
-        api_client = DiscoveryClient()
+        api_client = _get_client()
         config = StreamingConfig(
             chunk_size=chunk_size,
             memory_limit_mb=memory_limit,
@@ -1685,22 +2044,38 @@ def stream_fetch(ctx, query, max_records, chunk_size, memory_limit, output):
         )
         processor = StreamingRecordProcessor(config)
         
-        # Store records in database
-        from storage.database import DatabaseManager
-        db = DatabaseManager()
+        # Store records in database on a writer thread so the next API page
+        # is fetched while the previous chunk is being written. Chunks share
+        # a transaction until commit_every rows are pending.
+        db = _get_db()
+        progress = {'stored': 0}
         
-        total_stored = 0
+        def store_chunks(chunks):
+            progress['stored'] = db.store_records_batched(
+                chunks,
+                on_chunk=lambda count, total: progress.update(stored=total)
+            )
         
-        for chunk in processor.stream_records_from_api(api_client, query, max_records):
-            stored_count = db.store_records(chunk)
-            total_stored += stored_count
-            
-            click.echo(f"Stored chunk: {stored_count} records (total: {total_stored})")
-            
-            # Memory info
-            memory_info = processor.memory_monitor.check_memory()
-            if memory_info['usage_percent'] > 70:
-                click.echo(f"⚠️  Memory usage: {memory_info['usage_percent']:.1f}%")
+        writer = _QueueWriter(store_chunks, "stream-fetch-writer")
+        
+        try:
+            for chunk in processor.stream_records_from_api(api_client, query, max_records):
+                # Stop paging the API as soon as a write has failed
+                if not writer.put(chunk):
+                    break
+                click.echo(f"Fetched chunk: {len(chunk)} records (stored so far: {progress['stored']})")
+                
+                # Memory info
+                memory_info = processor.memory_monitor.check_memory()
+                if memory_info['usage_percent'] > 70:
+                    click.echo(f"⚠️  Memory usage: {memory_info['usage_percent']:.1f}%")
+        finally:
+            writer.close()
+        
+        if writer.error:
+            raise writer.error
+        
+        total_stored = progress['stored']
         
         # Final statistics
         stats = processor.get_statistics()
@@ -1723,26 +2098,19 @@ def stream_fetch(ctx, query, max_records, chunk_size, memory_limit, output):
 def stream_export(ctx, query, format, chunk_size, memory_limit):
     """Export large datasets using memory-efficient streaming"""
     try:
-        from utils.streaming import export_records_streaming
-        
         click.echo(f"📤 Starting streaming export")
         if query:
             click.echo(f"Filter: {query}")
         click.echo(f"Format: {format}, Chunk size: {chunk_size}")
         
-        output_path = export_records_streaming(
+        result = export_records_streaming(
             query=query,
             output_format=format,
             chunk_size=chunk_size
         )
         
-        click.echo(f"✅ Export complete: {output_path}")
-        
-        # Show file size
-        from pathlib import Path
-        if Path(output_path).exists():
-            size_mb = Path(output_path).stat().st_size / 1024 / 1024
-            click.echo(f"File size: {size_mb:.2f} MB")
+        click.echo(f"✅ Export complete: {result.path}")
+        click.echo(f"File size: {result.bytes_written / (1024 * 1024):.2f} MB")
         
     except Exception as e:
         click.echo(f"Error in streaming export: {e}")
@@ -1757,63 +2125,21 @@ def stream_export(ctx, query, format, chunk_size, memory_limit):
 def stream_analyze(ctx, analysis, query, chunk_size):
     """Perform analysis on large datasets using streaming"""
     try:
-        from utils.streaming import analyze_records_streaming
-        from collections import defaultdict
-        import json
-        
         click.echo(f"📊 Starting streaming analysis: {analysis}")
         if query:
             click.echo(f"Filter: {query}")
         
-        # Define analysis functions
-        def archive_stats_analysis(records):
-            """Analyze archive distribution"""
-            stats = defaultdict(int)
-            for record in records:
-                if record.archive:
-                    stats[record.archive] += 1
-            return dict(stats)
-        
-        def date_distribution_analysis(records):
-            """Analyze date distribution by decade"""
-            decades = defaultdict(int)
-            for record in records:
-                if record.date_from:
-                    try:
-                        year = int(record.date_from.split('/')[2]) if '/' in record.date_from else int(record.date_from[:4])
-                        decade = (year // 10) * 10
-                        decades[f"{decade}s"] += 1
-                    except (ValueError, IndexError):
-                        continue
-            return dict(decades)
-        
-        def word_frequency_analysis(records):
-            """Analyze word frequency in titles"""
-            words = defaultdict(int)
-            for record in records:
-                if record.title:
-                    # Simple word extraction
-                    title_words = record.title.lower().split()
-                    for word in title_words:
-                        if len(word) > 3:  # Skip short words
-                            words[word] += 1
-            # Return top 50 words
-            return dict(sorted(words.items(), key=lambda x: x[1], reverse=True)[:50])
-        
-        analysis_funcs = {
-            'archive_stats': archive_stats_analysis,
-            'date_distribution': date_distribution_analysis,
-            'word_frequency': word_frequency_analysis
-        }
-        
+        analysis_func, columns = _STREAM_ANALYSES[analysis]
         results = analyze_records_streaming(
-            analysis_funcs[analysis],
+            analysis_func,
             query=query,
-            chunk_size=chunk_size
+            chunk_size=chunk_size,
+            columns=list(columns)
         )
         
         click.echo(f"\n📈 Analysis Results ({analysis}):")
-        click.echo(json.dumps(results, indent=2))
+        # Bytes go straight to the binary stdout, skipping a decode/re-encode
+        click.echo(_json_pretty_bytes(results))
         
     except Exception as e:
         click.echo(f"Error in streaming analysis: {e}")
@@ -1890,15 +2216,20 @@ def performance_test(ctx, test_type, concurrent_users, operations, save_report,
                              f"({metrics['current_ops_per_sec']:.1f} vs {metrics['baseline_ops_per_sec']:.1f} ops/sec)")
         
         # Overall summary
-        total_ops = sum(r.operations_count for r in results)
-        total_time = sum(r.duration for r in results)
-        total_errors = sum(len(r.errors) for r in results)
-        
-        click.echo(f"\n🎯 Overall Summary:")
-        click.echo(f"Total Operations: {total_ops}")
-        click.echo(f"Total Time: {total_time:.1f}s")
-        click.echo(f"Total Errors: {total_errors}")
-        click.echo(f"Success Rate: {((total_ops - total_errors) / max(total_ops, 1) * 100):.1f}%")
+        total_ops = total_errors = 0
+        total_time = 0.0
+        for r in results:
+            total_ops += r.operations_count
+            total_time += r.duration
+            total_errors += len(r.errors)
+        
+        out = []
+        out.append(f"\n🎯 Overall Summary:")
+        out.append(f"Total Operations: {total_ops}")
+        out.append(f"Total Time: {total_time:.1f}s")
+        out.append(f"Total Errors: {total_errors}")
+        out.append(f"Success Rate: {((total_ops - total_errors) / max(total_ops, 1) * 100):.1f}%")
+        click.echo("\n".join(out))
         
     except Exception as e:
         click.echo(f"Error in performance testing: {e}")
@@ -1935,14 +2266,15 @@ def backup_system(ctx, action, backup_id, backup_type, restore_path, schedule):
             else:
                 backup_id = manager.create_incremental_backup()
             
-            click.echo(f"✅ Backup created: {backup_id}")
-            
             # Show backup info
             metadata = manager.metadata[backup_id]
-            click.echo(f"File: {metadata['file_path']}")
-            click.echo(f"Size: {metadata['file_size'] / 1024 / 1024:.1f} MB")
-            click.echo(f"Records: {metadata['record_count']}")
-            click.echo(f"Verified: {'✅' if metadata['verified'] else '❌'}")
+            out = []
+            out.append(f"✅ Backup created: {backup_id}")
+            out.append(f"File: {metadata['file_path']}")
+            out.append(f"Size: {metadata['file_size'] / (1024 * 1024):.1f} MB")
+            out.append(f"Records: {metadata['record_count']}")
+            out.append(f"Verified: {'✅' if metadata['verified'] else '❌'}")
+            click.echo("\n".join(out))
         
         elif action == 'list':
             backups = manager.list_backups()
@@ -1951,19 +2283,28 @@ def backup_system(ctx, action, backup_id, backup_type, restore_path, schedule):
                 click.echo("No backups found.")
                 return
             
-            click.echo("📋 Available Backups:")
-            click.echo("-" * 80)
-            click.echo(f"{'Backup ID':<25} {'Type':<12} {'Size (MB)':<10} {'Age (days)':<12} {'Records':<10}")
-            click.echo("-" * 80)
-            
-            for backup in backups:
-                click.echo(
-                    f"{backup['backup_id']:<25} "
-                    f"{backup['backup_type']:<12} "
-                    f"{backup['file_size'] / 1024 / 1024:<10.1f} "
-                    f"{backup['age_days']:<12} "
-                    f"{backup['record_count']:<10}"
+            row_format = "{:<25} {:<12} {:<10.1f} {:<12} {:<10}".format
+            bytes_to_mb = 1 / (1024 * 1024)
+            
+            lines = ["📋 Available Backups:", "-" * 80]
+            lines.append(f"{'Backup ID':<25} {'Type':<12} {'Size (MB)':<10} {'Age (days)':<12} {'Records':<10}")
+            lines.append("-" * 80)
+            lines.extend(
+                row_format(
+                    backup['backup_id'],
+                    backup['backup_type'],
+                    backup['file_size'] * bytes_to_mb,
+                    backup['age_days'],
+                    backup['record_count']
                 )
+                for backup in backups
+            )
+            
+            # Long listings go through the pager, like list-records
+            if len(lines) <= shutil.get_terminal_size().lines:
+                click.echo("\n".join(lines))
+            else:
+                click.echo_via_pager("\n".join(lines) + "\n")
         
         elif action == 'restore':
             if not backup_id:
@@ -1995,7 +2336,6 @@ def backup_system(ctx, action, backup_id, backup_type, restore_path, schedule):
             
             try:
                 # Keep the process running
-                import time
                 while True:
                     time.sleep(60)
                     
@@ -2037,22 +2377,26 @@ def enrich_metadata(ctx, series, batch_size, limit, dry_run):
         click.echo("=" * 60)
         
         # Initialize components
-        client = DiscoveryClient()
-        db_manager = DatabaseManager()
+        client = _get_client()
+        db_manager = _get_db()
         
-        # Get records to enrich
+        # Get records to enrich. A dry run only lists them, so it fetches
+        # (reference, title) pairs instead of full records.
         if series:
             click.echo(f"📋 Enriching records from series: {series}")
             # Get records from specific series
-            with click.progressbar(length=1, label='Querying database') as bar:
-                records = db_manager.search_records(f'reference:"{series}"', limit=limit)
-                bar.update(1)
+            series_query = f'reference:"{series}"'
+            if dry_run:
+                records = db_manager.search_record_summaries(series_query, limit=limit)
+            else:
+                records = db_manager.search_records(series_query, limit=limit)
         else:
             click.echo("📋 Enriching all records (limited by --limit)")
             # Get records with missing metadata using direct SQL query
-            with click.progressbar(length=1, label='Querying database') as bar:
+            if dry_run:
+                records = db_manager.get_missing_metadata_summaries(limit)
+            else:
                 records = db_manager.get_records_with_missing_metadata(limit)
-                bar.update(1)
         
         if not records:
             click.echo("❌ No records found to enrich")
@@ -2063,8 +2407,8 @@ def enrich_metadata(ctx, series, batch_size, limit, dry_run):
         if dry_run:
             click.echo("🔍 DRY RUN - No changes will be made")
             click.echo("Records that would be enriched:")
-            for record in records[:5]:  # Show first 5
-                click.echo(f"  • {record.reference}: {record.title}")
+            for reference, title in records[:5]:  # Show first 5
+                click.echo(f"  • {reference}: {title}")
             if len(records) > 5:
                 click.echo(f"  ... and {len(records) - 5} more")
             return
@@ -2078,23 +2422,46 @@ def enrich_metadata(ctx, series, batch_size, limit, dry_run):
         # Enrich metadata in batches
         click.echo(f"🚀 Starting metadata enrichment (batch size: {batch_size})")
         
-        with click.progressbar(length=len(record_ids), label='Enriching metadata') as bar:
-            enriched_records = client.batch_enrich_metadata(record_ids, batch_size)
-            bar.update(len(record_ids))
-        
-        if enriched_records:
-            # Update database with enriched records
-            click.echo(f"💾 Updating database with enriched metadata...")
-            
-            with click.progressbar(length=len(enriched_records), label='Updating database') as bar:
-                updated_count = db_manager.batch_update_metadata(enriched_records)
-                bar.update(len(enriched_records))
-            
+        # Enriched batches are written to the database on a writer thread, so
+        # the next batch's API requests overlap the previous batch's commit.
+        progress = {'updated': 0}
+        
+        def update_batches(batches):
+            for enriched_batch in batches:
+                progress['updated'] += db_manager.batch_update_metadata(enriched_batch)
+        
+        writer = _QueueWriter(update_batches, "enrich-writer")
+        
+        enriched_count = 0
+        sample = None
+        
+        try:
+            with click.progressbar(length=len(record_ids), label='Enriching and saving metadata') as bar:
+                # One batch is yielded per batch_size slice of record_ids
+                batch_starts = range(0, len(record_ids), batch_size)
+                for start, enriched_batch in zip(batch_starts, client.iter_enrich_metadata(record_ids, batch_size)):
+                    if enriched_batch:
+                        # Stop fetching as soon as a write has failed
+                        if not writer.put(enriched_batch):
+                            break
+                        enriched_count += len(enriched_batch)
+                        if sample is None:
+                            sample = enriched_batch[0]
+                    # The last slice may be short
+                    bar.update(min(batch_size, len(record_ids) - start))
+        finally:
+            writer.close()
+        
+        if writer.error:
+            raise writer.error
+        
+        updated_count = progress['updated']
+        
+        if enriched_count:
             click.echo(f"✅ Successfully enriched {updated_count} records!")
             
             # Show sample of enriched data
-            if enriched_records:
-                sample = enriched_records[0]
+            if sample:
                 click.echo(f"\n📋 Sample enriched record:")
                 click.echo(f"  Reference: {sample.reference}")
                 click.echo(f"  Scope Content: {sample.scope_content[:100] if sample.scope_content else 'None'}...")
@@ -4,13 +4,110 @@ Handles query parsing, expansion, and optimization
 """
 
 import re
+import copy
 import logging
-from typing import List, Dict, Tuple, Optional, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional, Set
 from datetime import datetime
 import json
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Processed queries remembered per QueryProcessor (repeat searches, paging)
+QUERY_CACHE_SIZE = 1024
+
+# Lowercase keyword triggers, matched by substring against the lowered query
+_MILITARY_TERMS = ('service', 'army', 'navy', 'air force', 'raf', 'regiment', 'battalion')
+_GENEALOGY_TERMS = ('birth', 'death', 'marriage', 'baptism', 'burial', 'will', 'census')
+_PLACE_TERMS = ('london', 'england')
+_FILTER_TERMS = (
+    'war office', 'wo ', 'admiralty', 'adm ', 'air ministry', 'air ',
+    'service record', 'military service'
+)
+# Related queries returned by suggest_related_queries
+MAX_RELATED_QUERIES = 8
+# Record types suggested for genealogy searches that do not mention them
+_RELATED_GENEALOGY_TERMS = ('birth', 'marriage', 'death', 'will', 'census')
+
+
+def _union_pattern(patterns: List[str], names: List[str]) -> Tuple[re.Pattern, Dict[str, Tuple[int, int]]]:
+    """
+    Combine patterns into one named alternation scanned in a single pass
+    
+    Args:
+        patterns: Regex pattern strings, tried in order at each position
+        names: Group name for each pattern
+        
+    Returns:
+        Tuple of (compiled pattern, name -> (first inner group index, inner group count))
+    """
+    groups = {}
+    index = 1
+    for name, pattern in zip(names, patterns):
+        inner = re.compile(pattern).groups
+        groups[name] = (index + 1, inner)
+        index += 1 + inner
+    
+    union = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in zip(names, patterns))
+    # Years, reference codes and UK place names are ASCII, so skip Unicode tables
+    return re.compile(union, re.IGNORECASE | re.ASCII), groups
+
+
+def _unique(items: Iterable[str]) -> Iterator[str]:
+    """Yield items in order, skipping any already seen"""
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+@dataclass
+class ProcessedQuery:
+    """Components of a processed query, as cached by QueryProcessor"""
+    
+    __slots__ = (
+        'original_query', 'cleaned_query', 'expanded_terms', 'extracted_dates',
+        'extracted_references', 'suggested_filters', 'query_type', 'enhanced_query'
+    )
+    
+    original_query: str
+    cleaned_query: str
+    expanded_terms: List[str]
+    extracted_dates: List[Dict]
+    extracted_references: List[str]
+    suggested_filters: Dict
+    query_type: str
+    enhanced_query: str
+    
+    def to_dict(self) -> Dict:
+        """
+        Convert to an independent dictionary
+        
+        Containers are copied one level down, which is all the nesting there
+        is (date dicts and filters hold only scalars), so callers may mutate
+        the result without touching the cached entry.
+        """
+        return {
+            'original_query': self.original_query,
+            'cleaned_query': self.cleaned_query,
+            'expanded_terms': list(self.expanded_terms),
+            'extracted_dates': [dict(date) for date in self.extracted_dates],
+            'extracted_references': list(self.extracted_references),
+            'suggested_filters': dict(self.suggested_filters),
+            'query_type': self.query_type,
+            'enhanced_query': self.enhanced_query
+        }
+
 
 class QueryProcessor:
     """
@@ -75,105 +172,208 @@ class QueryProcessor:
             r'\bC\s*\d+/\d+\b',           # C 54/1234
             r'\bE\s*\d+/\d+\b'            # E 179/123
         ]
+        
+        # Compiled once here so each query skips the re module's cache lookup.
+        # Dates and references are each one alternation so a query is scanned
+        # once per group rather than once per pattern.
+        # The bare year goes last so full dates such as "2020-01-05" win
+        date_kinds = [
+            'year', 'slash_date', 'dash_date', 'iso_date', 'month_first_date',
+            'day_first_date', 'qualified_year', 'circa', 'decade'
+        ]
+        date_order = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+        self._dates_union, self._date_groups = _union_pattern(
+            [self.date_patterns[i] for i in date_order],
+            [date_kinds[i] for i in date_order]
+        )
+        # Likewise "PREM 1/A123" must not be cut short at "PREM 1"
+        ref_order = [0, 2, 3, 4, 1]
+        self._refs_union, _ = _union_pattern(
+            [self.reference_patterns[i] for i in ref_order],
+            [f'ref{i}' for i in ref_order]
+        )
+        self._ws_re = re.compile(r'\s+')
+        # Name and organisation patterns keep Unicode \b and \w: under ASCII
+        # rules "Königs Regiment" would be found as "nigs Regiment"
+        self._person_re = re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b')
+        self._shire_re = re.compile(r'\b[A-Z][a-z]+shire\b', re.ASCII)
+        
+        # Common abbreviations, expanded in one scan of the cleaned query
+        self._abbrev_map = {
+            'st.': 'saint',
+            'st ': 'saint ',
+            'ltd.': 'limited',
+            'co.': 'company',
+            'inc.': 'incorporated',
+            '&': 'and'
+        }
+        self._abbrev_re = re.compile('|'.join(
+            re.escape(abbrev) for abbrev in sorted(self._abbrev_map, key=len, reverse=True)
+        ))
+        
+        # Entity patterns (basic UK place recognition and organisations)
+        # Place patterns never overlap, so one alternation finds them all
+        place_patterns = [
+            r'\b[A-Z][a-z]+shire\b',  # Counties
+            r'\bLondon\b',
+            r'\bEngland\b',
+            r'\bScotland\b',
+            r'\bWales\b',
+            r'\bIreland\b'
+        ]
+        self._place_kinds = [f'place{i}' for i in range(len(place_patterns))]
+        self._places_union, _ = _union_pattern(place_patterns, self._place_kinds)
+        # Organisation patterns overlap ("Royal Welsh Regiment"), so stay separate
+        self._org_res = [re.compile(p, re.IGNORECASE) for p in [
+            r'\b\w+ Regiment\b',
+            r'\b\w+ Battalion\b',
+            r'\bRoyal \w+\b',
+            r'\b\w+ Company\b'
+        ]]
+        
+        # Keyword triggers checked by substring, tagged (category, key)
+        triggers = [('expansion', term) for term in self.term_expansions]
+        triggers += [('subject', subject) for subject in self.archival_subjects]
+        triggers += [('military', term) for term in _MILITARY_TERMS]
+        triggers += [('genealogy', term) for term in _GENEALOGY_TERMS]
+        triggers += [('place', term) for term in _PLACE_TERMS]
+        triggers += [('filter', term) for term in _FILTER_TERMS]
+        
+        self._triggers = {}
+        for category, term in triggers:
+            self._triggers.setdefault(term, []).append((category, term))
+        
+        # One automaton walks the query once for every trigger
+        self._trigger_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._trigger_automaton = ahocorasick.Automaton()
+            for term, tags in self._triggers.items():
+                self._trigger_automaton.add_word(term, tuple(tags))
+            self._trigger_automaton.make_automaton()
+        
+        self._process_cached = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._process_query)
 
     def process_query(self, query: str) -> Dict:
         """
         Process and analyze a search query
         
+        Results are cached per query string; each caller gets its own copy.
+        
         Args:
             query: Raw search query
             
         Returns:
             Dictionary with processed query components
         """
-        processed = {
-            'original_query': query,
-            'cleaned_query': self._clean_query(query),
-            'expanded_terms': [],
-            'extracted_dates': [],
-            'extracted_references': [],
-            'suggested_filters': {},
-            'query_type': self._classify_query(query),
-            'enhanced_query': ''
-        }
-        
-        # Extract dates
-        processed['extracted_dates'] = self._extract_dates(query)
+        return self._process_cached(query).to_dict()
+
+    def process_queries(self, queries: List[str]) -> List[Dict]:
+        """
+        Process a batch of search queries
         
-        # Extract reference numbers
-        processed['extracted_references'] = self._extract_references(query)
+        Repeated queries are processed once.
         
-        # Expand terms
-        processed['expanded_terms'] = self._expand_terms(query)
+        Args:
+            queries: Raw search queries
+            
+        Returns:
+            Processed query dictionaries, in the same order as queries
+        """
+        results = {query: self._process_cached(query) for query in dict.fromkeys(queries)}
+        return [results[query].to_dict() for query in queries]
+
+    def _process_query(self, query: str) -> ProcessedQuery:
+        """Process a query without caching (see process_query)"""
+        query_lower = query.lower()
+        hits = self._match_triggers(query_lower)
+        dates = self._extract_dates(query)
         
-        # Suggest filters
-        processed['suggested_filters'] = self._suggest_filters(query)
+        processed = ProcessedQuery(
+            original_query=query,
+            cleaned_query=self._clean_query(query, query_lower),
+            expanded_terms=self._expand_terms(query, hits),
+            extracted_dates=dates,
+            extracted_references=self._extract_references(query),
+            suggested_filters=self._suggest_filters(query, hits, dates),
+            query_type=self._classify_query(query, hits, dates),
+            enhanced_query=''
+        )
         
         # Create enhanced query
-        processed['enhanced_query'] = self._create_enhanced_query(processed)
+        processed.enhanced_query = self._create_enhanced_query(processed)
         
         return processed
 
-    def _clean_query(self, query: str) -> str:
-        """Clean and normalize query text"""
+    def _clean_query(self, query: str, query_lower: Optional[str] = None) -> str:
+        """Clean and normalize query text (query_lower skips re-lowercasing)"""
         
-        # Convert to lowercase
-        cleaned = query.lower().strip()
+        if query_lower is None:
+            query_lower = query.lower()
         
-        # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        # Collapse whitespace
+        cleaned = self._ws_re.sub(' ', query_lower.strip())
         
         # Handle common abbreviations
-        abbreviations = {
-            'st.': 'saint',
-            'st ': 'saint ',
-            'ltd.': 'limited',
-            'co.': 'company',
-            'inc.': 'incorporated',
-            '&': 'and'
-        }
-        
-        for abbrev, full in abbreviations.items():
-            cleaned = cleaned.replace(abbrev, full)
+        cleaned = self._abbrev_re.sub(lambda match: self._abbrev_map[match.group(0)], cleaned)
         
         return cleaned.strip()
 
-    def _classify_query(self, query: str) -> str:
+    def _match_triggers(self, query_lower: str) -> Set[Tuple[str, str]]:
+        """
+        Find every keyword trigger contained in the query
+        
+        Args:
+            query_lower: Lowercased search query
+            
+        Returns:
+            Set of (category, key) tags for the triggers found
+        """
+        if self._trigger_automaton is not None:
+            return {tag for _, tags in self._trigger_automaton.iter(query_lower) for tag in tags}
+        
+        return {tag for term, tags in self._triggers.items() if term in query_lower for tag in tags}
+
+    def _classify_query(self, query: str, hits: Optional[Set[Tuple[str, str]]] = None,
+                        dates: Optional[List[Dict]] = None) -> str:
         """
         Classify the type of search query
         
         Args:
             query: Search query
+            hits: Keyword triggers already matched for this query
+            dates: Dates already extracted from this query
             
         Returns:
             Query type classification
         """
-        query_lower = query.lower()
+        if hits is None:
+            hits = self._match_triggers(query.lower())
         
         # Check for reference number search
-        if any(re.search(pattern, query, re.IGNORECASE) for pattern in self.reference_patterns):
+        if self._refs_union.search(query):
             return 'reference_search'
         
         # Check for name search
-        if re.search(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', query):
+        if self._person_re.search(query):
             return 'name_search'
         
         # Check for date range search
-        if len(self._extract_dates(query)) > 0:
+        if dates is None:
+            dates = self._extract_dates(query)
+        if len(dates) > 0:
             return 'date_search'
         
         # Check for military service search
-        military_terms = ['service', 'army', 'navy', 'air force', 'raf', 'regiment', 'battalion']
-        if any(term in query_lower for term in military_terms):
+        categories = {category for category, _ in hits}
+        if 'military' in categories:
             return 'military_search'
         
         # Check for genealogy search
-        genealogy_terms = ['birth', 'death', 'marriage', 'baptism', 'burial', 'will', 'census']
-        if any(term in query_lower for term in genealogy_terms):
+        if 'genealogy' in categories:
             return 'genealogy_search'
         
         # Check for place search
-        if 'london' in query_lower or 'england' in query_lower or re.search(r'\b[A-Z][a-z]+shire\b', query):
+        if 'place' in categories or self._shire_re.search(query):
             return 'place_search'
         
         return 'general_search'
@@ -190,31 +390,37 @@ class QueryProcessor:
         """
         dates = []
         
-        for pattern in self.date_patterns:
-            matches = re.finditer(pattern, query, re.IGNORECASE)
+        for match in self._dates_union.finditer(query):
+            first, count = self._date_groups[match.lastgroup]
+            groups = match.groups()[first - 1:first - 1 + count]
             
-            for match in matches:
-                date_info = {
-                    'raw_text': match.group(0),
-                    'start_pos': match.start(),
-                    'end_pos': match.end(),
-                    'type': 'unknown'
-                }
-                
-                # Try to parse the date
-                try:
-                    if len(match.groups()) == 1:  # Simple year
-                        year = int(match.group(1))
-                        date_info['year'] = year
-                        date_info['type'] = 'year'
-                    elif len(match.groups()) == 3:  # Full date
+            date_info = {
+                'raw_text': match.group(0),
+                'start_pos': match.start(),
+                'end_pos': match.end(),
+                'type': 'unknown'
+            }
+            
+            # Try to parse the date
+            try:
+                if count == 1:  # Simple year
+                    year = int(groups[0])
+                    date_info['year'] = year
+                    date_info['type'] = 'year'
+                else:
+                    # A longer form wins over the bare year inside it, so
+                    # carry that year on the match itself
+                    year = next((g for g in groups if g and len(g) == 4 and g.isdigit()), None)
+                    if year:
+                        date_info['year'] = int(year)
+                    if count == 3:  # Full date
                         date_info['type'] = 'full_date'
                         # Additional parsing logic would go here
-                    
-                    dates.append(date_info)
-                    
-                except ValueError:
-                    continue
+                
+                dates.append(date_info)
+                
+            except ValueError:
+                continue
         
         return dates
 
@@ -223,68 +429,72 @@ class QueryProcessor:
         
         references = []
         
-        for pattern in self.reference_patterns:
-            matches = re.finditer(pattern, query, re.IGNORECASE)
-            
-            for match in matches:
-                ref = match.group(0).upper().replace(' ', '')
-                references.append(ref)
+        for match in self._refs_union.finditer(query):
+            ref = match.group(0).upper().replace(' ', '')
+            references.append(ref)
         
         return references
 
-    def _expand_terms(self, query: str) -> List[str]:
+    def _expand_terms(self, query: str, hits: Optional[Set[Tuple[str, str]]] = None) -> List[str]:
         """
         Expand query terms with synonyms and related terms
         
         Args:
             query: Search query
+            hits: Keyword triggers already matched for this query
             
         Returns:
             List of expanded terms
         """
         expanded = []
-        query_lower = query.lower()
+        if hits is None:
+            hits = self._match_triggers(query.lower())
         
         # Check for term expansions
         for term, expansions in self.term_expansions.items():
-            if term in query_lower:
+            if ('expansion', term) in hits:
                 expanded.extend(expansions)
         
         # Check for archival subjects
         for subject, related_terms in self.archival_subjects.items():
-            if subject in query_lower:
+            if ('subject', subject) in hits:
                 expanded.extend(related_terms)
         
-        return list(set(expanded))  # Remove duplicates
+        return list(dict.fromkeys(expanded))  # Remove duplicates, keeping order
 
-    def _suggest_filters(self, query: str) -> Dict:
+    def _suggest_filters(self, query: str, hits: Optional[Set[Tuple[str, str]]] = None,
+                         dates: Optional[List[Dict]] = None) -> Dict:
         """
         Suggest appropriate filters based on query content
         
         Args:
             query: Search query
+            hits: Keyword triggers already matched for this query
+            dates: Dates already extracted from this query
             
         Returns:
             Dictionary of suggested filters
         """
         filters = {}
-        query_lower = query.lower()
+        if hits is None:
+            hits = self._match_triggers(query.lower())
         
         # Archive suggestions
-        if 'war office' in query_lower or 'wo ' in query_lower:
+        if ('filter', 'war office') in hits or ('filter', 'wo ') in hits:
             filters['archive'] = 'The National Archives'
             filters['collection_hint'] = 'War Office records'
         
-        elif 'admiralty' in query_lower or 'adm ' in query_lower:
+        elif ('filter', 'admiralty') in hits or ('filter', 'adm ') in hits:
             filters['archive'] = 'The National Archives'
             filters['collection_hint'] = 'Admiralty records'
         
-        elif 'air ministry' in query_lower or 'air ' in query_lower:
+        elif ('filter', 'air ministry') in hits or ('filter', 'air ') in hits:
             filters['archive'] = 'The National Archives'
             filters['collection_hint'] = 'Air Ministry records'
         
         # Date range suggestions
-        dates = self._extract_dates(query)
+        if dates is None:
+            dates = self._extract_dates(query)
         if dates:
             # Use first extracted date
             date = dates[0]
@@ -293,43 +503,38 @@ class QueryProcessor:
                 filters['date_to'] = str(date['year'])
         
         # Military service suggestions
-        if any(term in query_lower for term in ['service record', 'military service']):
+        if ('filter', 'service record') in hits or ('filter', 'military service') in hits:
             filters['subjects_hint'] = 'Military service records'
         
         return filters
 
-    def _create_enhanced_query(self, processed: Dict) -> str:
+    def _create_enhanced_query(self, processed: ProcessedQuery) -> str:
         """
         Create an enhanced search query with expanded terms
         
         Args:
-            processed: Processed query dictionary
+            processed: Processed query
             
         Returns:
             Enhanced query string
         """
-        enhanced_parts = [processed['cleaned_query']]
+        enhanced_parts = [processed.cleaned_query]
         
         # Add expanded terms
-        if processed['expanded_terms']:
+        if processed.expanded_terms:
             # Add most relevant expanded terms (limit to avoid over-expansion)
-            relevant_expansions = processed['expanded_terms'][:5]
+            relevant_expansions = processed.expanded_terms[:5]
             enhanced_parts.extend(relevant_expansions)
         
         # Create final enhanced query
         enhanced = ' '.join(enhanced_parts)
         
         # Remove duplicates while preserving order
-        words = enhanced.split()
-        seen = set()
-        unique_words = []
+        unique_words = {}
+        for word in enhanced.split():
+            unique_words.setdefault(word.lower(), word)
         
-        for word in words:
-            if word.lower() not in seen:
-                unique_words.append(word)
-                seen.add(word.lower())
-        
-        return ' '.join(unique_words)
+        return ' '.join(unique_words.values())
 
     def suggest_related_queries(self, query: str, query_type: str = None) -> List[str]:
         """
@@ -343,53 +548,42 @@ class QueryProcessor:
             List of suggested related queries
         """
         if query_type is None:
-            query_type = self._classify_query(query)
+            query_type = self._process_cached(query).query_type
         
-        suggestions = []
-        query_lower = query.lower()
+        # Remove duplicates (keeping order) and stop once the limit is reached
+        candidates = self._iter_related_queries(query, query_type)
+        return list(islice(_unique(candidates), MAX_RELATED_QUERIES))
+
+    def _iter_related_queries(self, query: str, query_type: str) -> Iterator[str]:
+        """Yield candidate related queries lazily, most specific first"""
+        hits = self._match_triggers(query.lower())
         
         if query_type == 'military_search':
-            if 'army' in query_lower:
-                suggestions.extend([
-                    query.replace('army', 'navy'),
-                    query.replace('army', 'air force'),
-                    query + ' medal',
-                    query + ' war diary'
-                ])
+            if ('military', 'army') in hits:
+                yield query.replace('army', 'navy')
+                yield query.replace('army', 'air force')
+                yield query + ' medal'
+                yield query + ' war diary'
             
-            if 'service' in query_lower:
-                suggestions.extend([
-                    query + ' record',
-                    query.replace('service', 'pension'),
-                    query.replace('service', 'medal')
-                ])
+            if ('military', 'service') in hits:
+                yield query + ' record'
+                yield query.replace('service', 'pension')
+                yield query.replace('service', 'medal')
         
         elif query_type == 'genealogy_search':
-            base_terms = ['birth', 'marriage', 'death', 'will', 'census']
-            for term in base_terms:
-                if term not in query_lower:
-                    suggestions.append(query + ' ' + term)
+            for term in _RELATED_GENEALOGY_TERMS:
+                if ('genealogy', term) not in hits:
+                    yield query + ' ' + term
         
         elif query_type == 'name_search':
-            suggestions.extend([
-                query + ' birth',
-                query + ' death',
-                query + ' marriage',
-                query + ' service record',
-                query + ' will'
-            ])
+            for suffix in (' birth', ' death', ' marriage', ' service record', ' will'):
+                yield query + suffix
         
         # Generic suggestions
-        suggestions.extend([
-            query + ' records',
-            query + ' documents',
-            'early ' + query,
-            'late ' + query
-        ])
-        
-        # Remove duplicates and limit
-        unique_suggestions = list(set(suggestions))
-        return unique_suggestions[:8]
+        yield query + ' records'
+        yield query + ' documents'
+        yield 'early ' + query
+        yield 'late ' + query
 
     def extract_entities(self, query: str) -> Dict:
         """
@@ -410,39 +604,25 @@ class QueryProcessor:
         }
         
         # Extract people (simple pattern matching)
-        person_pattern = r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'
-        people = re.findall(person_pattern, query)
+        people = self._person_re.findall(query)
         entities['people'] = people
         
         # Extract places (basic UK place recognition)
-        place_patterns = [
-            r'\b[A-Z][a-z]+shire\b',  # Counties
-            r'\bLondon\b',
-            r'\bEngland\b',
-            r'\bScotland\b',
-            r'\bWales\b',
-            r'\bIreland\b'
-        ]
-        
-        for pattern in place_patterns:
-            places = re.findall(pattern, query, re.IGNORECASE)
-            entities['places'].extend(places)
+        places = {kind: [] for kind in self._place_kinds}
+        for match in self._places_union.finditer(query):
+            places[match.lastgroup].append(match.group(0))
+        for kind in self._place_kinds:
+            entities['places'].extend(places[kind])
         
         # Extract organizations
-        org_patterns = [
-            r'\b\w+ Regiment\b',
-            r'\b\w+ Battalion\b',
-            r'\bRoyal \w+\b',
-            r'\b\w+ Company\b'
-        ]
-        
-        for pattern in org_patterns:
-            orgs = re.findall(pattern, query, re.IGNORECASE)
+        for pattern in self._org_res:
+            orgs = pattern.findall(query)
             entities['organizations'].extend(orgs)
         
-        # Use already implemented date and reference extraction
-        entities['dates'] = self._extract_dates(query)
-        entities['references'] = self._extract_references(query)
+        # Reuse the (cached) date and reference extraction from process_query
+        processed = self._process_cached(query)
+        entities['dates'] = copy.deepcopy(processed.extracted_dates)
+        entities['references'] = list(processed.extracted_references)
         
         return entities
 
@@ -456,24 +636,24 @@ class QueryProcessor:
         Returns:
             Optimized query for archive search systems
         """
-        # Process the query
-        processed = self.process_query(query)
+        # Process the query (read-only, so the cached result is used directly)
+        processed = self._process_cached(query)
         
         # Start with enhanced query
-        optimized = processed['enhanced_query']
+        optimized = processed.enhanced_query
         
         # Add archival context terms
         archival_boost_terms = []
         
-        if processed['query_type'] == 'military_search':
+        if processed.query_type == 'military_search':
             archival_boost_terms.extend(['record', 'service', 'military'])
         
-        elif processed['query_type'] == 'genealogy_search':
+        elif processed.query_type == 'genealogy_search':
             archival_boost_terms.extend(['register', 'record', 'certificate'])
         
         # Add reference numbers if found
-        if processed['extracted_references']:
-            optimized = ' '.join(processed['extracted_references']) + ' ' + optimized
+        if processed.extracted_references:
+            optimized = ' '.join(processed.extracted_references) + ' ' + optimized
         
         # Add boost terms
         if archival_boost_terms:
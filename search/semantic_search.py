@@ -3,6 +3,8 @@ Semantic search engine using sentence transformers and vector databases
 Provides AI-powered search capabilities over National Archives data
 """
 
+import hashlib
+import json
 import logging
 import os
 from typing import List, Dict, Tuple, Optional
@@ -32,11 +34,51 @@ except ImportError as e:
         def __init__(self, *args, **kwargs):
             raise ImportError("chromadb not installed")
 
+try:
+    import faiss
+    import numpy as np
+    FAISS_AVAILABLE = True
+except ImportError:
+    faiss = None
+    np = None
+    FAISS_AVAILABLE = False
+
 from api.models import Record
 from storage.database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Encoder runtime: 'torch' (default) or 'onnx-int8' for a dynamically
+# quantized ONNX export, built once under the vector database directory.
+# Embeddings differ slightly between runtimes; the next index run after a
+# switch re-encodes every record (see _text_hash).
+EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'torch')
+ONNX_QUANTIZATION = 'avx512_vnni'
+ONNX_QUANTIZED_FILE = f'onnx/model_qint8_{ONNX_QUANTIZATION}.onnx'
+
+# Read-side ANN index rebuilt from ChromaDB (see build_faiss_index)
+FAISS_INDEX_FILE = 'faiss.hnsw'
+FAISS_IDS_FILE = 'faiss_ids.json'
+FAISS_HNSW_M = 32
+
+
+def _text_hash(text: str, encoder: str) -> str:
+    """
+    Fingerprint searchable text so unchanged records can skip re-encoding
+    
+    The encoder (model and runtime) is part of the fingerprint, so after a
+    switch of model or EMBEDDING_BACKEND every record is re-encoded.
+    """
+    digest = hashlib.blake2b(encoder.encode('utf-8'), digest_size=16)
+    digest.update(b'\0')
+    digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _chroma_settings() -> 'Settings':
+    """ChromaDB client settings, shared by every client opened on a vector path"""
+    return Settings(anonymized_telemetry=False, allow_reset=True)
+
 
 class SemanticSearchEngine:
     """
@@ -79,17 +121,62 @@ class SemanticSearchEngine:
         
         # Lazy load model and database
         self._model_loaded = False
+        # Model and runtime that produced this engine's embeddings, set on load
+        self._encoder = None
         self._db_initialized = False
         
+        # Multi-GPU encoding pool, started on first bulk index
+        self._encode_pool = None
+        
+        # Memory-mapped FAISS index answering unfiltered searches, if built
+        self.faiss_index = None
+        self._faiss_ids: List[str] = []
+        # (inode, mtime) of the index file last loaded, to notice rebuilds
+        self._faiss_stamp: Optional[Tuple[int, int]] = None
+        
         logger.info(f"Semantic search engine initialized with model: {model_name}")
 
     def _load_model(self):
         """Lazy load the sentence transformer model"""
         if not self._model_loaded:
             logger.info(f"Loading sentence transformer model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
+            
+            if EMBEDDING_BACKEND == 'onnx-int8':
+                try:
+                    self.model = self._load_quantized_model()
+                except Exception as e:
+                    logger.warning(f"Quantized ONNX model not available, using PyTorch: {e}")
+            
+            if self.model is None:
+                self.model = SentenceTransformer(self.model_name)
+                self._encoder = f"{self.model_name}:torch"
+            else:
+                self._encoder = f"{self.model_name}:{EMBEDDING_BACKEND}"
             self._model_loaded = True
 
+    def _load_quantized_model(self) -> 'SentenceTransformer':
+        """
+        Load the int8 ONNX variant of the model, exporting it on first use
+        
+        Returns:
+            Sentence transformer running on ONNX Runtime
+        """
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+        
+        model_dir = Path(self.vector_db_path) / 'onnx-int8' / self.model_name.replace('/', '__')
+        
+        if not (model_dir / ONNX_QUANTIZED_FILE).exists():
+            logger.info(f"Exporting {self.model_name} to quantized ONNX in {model_dir}")
+            onnx_model = SentenceTransformer(self.model_name, backend='onnx')
+            onnx_model.save(str(model_dir))
+            export_dynamic_quantized_onnx_model(onnx_model, ONNX_QUANTIZATION, str(model_dir))
+        
+        return SentenceTransformer(
+            str(model_dir),
+            backend='onnx',
+            model_kwargs={'file_name': ONNX_QUANTIZED_FILE}
+        )
+
     def _init_vector_db(self):
         """Initialize ChromaDB vector database"""
         if not self._db_initialized:
@@ -97,10 +184,7 @@ class SemanticSearchEngine:
             
             self.chroma_client = chromadb.PersistentClient(
                 path=self.vector_db_path,
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
-                )
+                settings=_chroma_settings()
             )
             
             # Get or create collection
@@ -117,8 +201,106 @@ class SemanticSearchEngine:
                 )
                 logger.info("Created new vector collection")
             
+            self._load_faiss_index()
             self._db_initialized = True
 
+    def _load_faiss_index(self):
+        """Memory-map the FAISS index written by build_faiss_index, if present"""
+        index_path = Path(self.vector_db_path) / FAISS_INDEX_FILE
+        ids_path = Path(self.vector_db_path) / FAISS_IDS_FILE
+        
+        self._faiss_stamp = self._faiss_file_stamp()
+        if not FAISS_AVAILABLE or self._faiss_stamp is None or not ids_path.exists():
+            return
+        
+        try:
+            self.faiss_index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP)
+            with open(ids_path, 'r', encoding='utf-8') as f:
+                self._faiss_ids = json.load(f)
+            logger.info(f"Loaded FAISS index with {self.faiss_index.ntotal} vectors")
+        except Exception as e:
+            logger.warning(f"FAISS index not loaded, searching ChromaDB directly: {e}")
+            self.faiss_index = None
+            self._faiss_ids = []
+
+    def _faiss_file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Identify the current FAISS index file, or None if there is none"""
+        try:
+            stat = (Path(self.vector_db_path) / FAISS_INDEX_FILE).stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    def _refresh_faiss_index(self):
+        """Reload or drop the FAISS index if another process rebuilt or removed it"""
+        if not FAISS_AVAILABLE or self._faiss_file_stamp() == self._faiss_stamp:
+            return
+        
+        self.faiss_index = None
+        self._faiss_ids = []
+        self._load_faiss_index()
+
+    def build_faiss_index(self, page_size: int = 5000) -> int:
+        """
+        Rebuild the FAISS HNSW index from the embeddings stored in ChromaDB
+        
+        ChromaDB stays the store of record; the FAISS copy only serves
+        unfiltered searches and is dropped whenever the collection changes.
+        
+        Args:
+            page_size: Embeddings read from ChromaDB per request
+            
+        Returns:
+            Number of vectors in the new index
+        """
+        if not FAISS_AVAILABLE:
+            logger.warning("FAISS not installed; searches use ChromaDB directly")
+            return 0
+        
+        self._init_vector_db()
+        
+        ids = []
+        chunks = []
+        while True:
+            page = self.collection.get(include=['embeddings'], limit=page_size, offset=len(ids))
+            if not page['ids']:
+                break
+            ids.extend(page['ids'])
+            chunks.append(np.asarray(page['embeddings'], dtype='float32'))
+        
+        self._drop_faiss_index()
+        if not ids:
+            return 0
+        
+        vectors = np.vstack(chunks)
+        # Flat L2 codes, matching the squared-L2 distances ChromaDB returns
+        index = faiss.IndexHNSWFlat(vectors.shape[1], FAISS_HNSW_M)
+        index.add(vectors)
+        
+        # Write beside the final files and swap in, so readers never see a partial index
+        index_path = Path(self.vector_db_path) / FAISS_INDEX_FILE
+        ids_path = Path(self.vector_db_path) / FAISS_IDS_FILE
+        faiss.write_index(index, str(index_path) + '.tmp')
+        with open(str(ids_path) + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(ids, f)
+        os.replace(str(ids_path) + '.tmp', ids_path)
+        os.replace(str(index_path) + '.tmp', index_path)
+        
+        self._load_faiss_index()
+        logger.info(f"Built FAISS index with {len(ids)} vectors")
+        return len(ids)
+
+    def _drop_faiss_index(self):
+        """Discard the FAISS index once it no longer matches the collection"""
+        self.faiss_index = None
+        self._faiss_ids = []
+        self._faiss_stamp = None
+        
+        for name in (FAISS_INDEX_FILE, FAISS_IDS_FILE):
+            path = Path(self.vector_db_path) / name
+            if path.exists():
+                path.unlink()
+
     def index_record(self, record: Record) -> bool:
         """
         Index a single record for semantic search
@@ -136,6 +318,12 @@ class SemanticSearchEngine:
             # Create searchable text from record
             searchable_text = self._create_searchable_text(record)
             
+            text_hash = _text_hash(searchable_text, self._encoder)
+            
+            # Nothing to do if the stored embedding came from the same text
+            if not self._changed_ids([record.id], [text_hash]):
+                return True
+            
             # Generate embedding
             embedding = self.model.encode(searchable_text).tolist()
             
@@ -144,18 +332,10 @@ class SemanticSearchEngine:
                 ids=[record.id],
                 embeddings=[embedding],
                 documents=[searchable_text],
-                metadatas=[{
-                    'title': record.title,
-                    'reference': record.reference or '',
-                    'collection': record.collection or '',
-                    'archive': record.archive or '',
-                    'date_from': record.date_from or '',
-                    'date_to': record.date_to or '',
-                    'subjects': '|'.join(record.subjects) if record.subjects else '',
-                    'creators': '|'.join(record.creators) if record.creators else '',
-                    'places': '|'.join(record.places) if record.places else ''
-                }]
+                metadatas=[self._record_metadata(record, text_hash)]
             )
+            if self.faiss_index is not None:
+                self._drop_faiss_index()
             
             return True
             
@@ -167,6 +347,10 @@ class SemanticSearchEngine:
         """
         Index multiple records efficiently
         
+        Records are grouped by searchable text length before batching, so
+        each encoder batch pads to a similar length instead of the longest
+        record that happened to land in it.
+        
         Args:
             records: List of records to index
             batch_size: Number of records to process at once
@@ -181,48 +365,52 @@ class SemanticSearchEngine:
         self._init_vector_db()
         
         indexed_count = 0
+        unchanged_count = 0
+        
+        texts = [self._create_searchable_text(record) for record in records]
+        order = sorted(range(len(records)), key=lambda index: len(texts[index]))
         
         # Process in batches to manage memory
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
+        for i in range(0, len(order), batch_size):
+            batch_order = order[i:i + batch_size]
+            batch = [records[index] for index in batch_order]
             
             try:
                 # Prepare batch data
+                batch_texts = [texts[index] for index in batch_order]
+                text_hashes = [_text_hash(text, self._encoder) for text in batch_texts]
+                
+                # Only records whose text changed since the last run are re-encoded
+                changed = self._changed_ids([record.id for record in batch], text_hashes)
+                
                 ids = []
-                embeddings = []
                 documents = []
                 metadatas = []
                 
-                for record in batch:
-                    searchable_text = self._create_searchable_text(record)
+                for record, searchable_text, text_hash in zip(batch, batch_texts, text_hashes):
+                    if record.id not in changed:
+                        continue
                     
                     ids.append(record.id)
                     documents.append(searchable_text)
-                    metadatas.append({
-                        'title': record.title,
-                        'reference': record.reference or '',
-                        'collection': record.collection or '',
-                        'archive': record.archive or '',
-                        'date_from': record.date_from or '',
-                        'date_to': record.date_to or '',
-                        'subjects': '|'.join(record.subjects) if record.subjects else '',
-                        'creators': '|'.join(record.creators) if record.creators else '',
-                        'places': '|'.join(record.places) if record.places else ''
-                    })
-                
-                # Generate embeddings for batch
-                batch_texts = [self._create_searchable_text(r) for r in batch]
-                batch_embeddings = self.model.encode(batch_texts).tolist()
+                    metadatas.append(self._record_metadata(record, text_hash))
                 
-                # Store batch in vector database
-                self.collection.upsert(
-                    ids=ids,
-                    embeddings=batch_embeddings,
-                    documents=documents,
-                    metadatas=metadatas
-                )
+                if ids:
+                    # Generate embeddings for batch (ChromaDB 0.4 only accepts lists)
+                    batch_embeddings = self._encode_documents(documents, batch_size).tolist()
+                    
+                    # Store batch in vector database
+                    self.collection.upsert(
+                        ids=ids,
+                        embeddings=batch_embeddings,
+                        documents=documents,
+                        metadatas=metadatas
+                    )
+                    if self.faiss_index is not None:
+                        self._drop_faiss_index()
                 
                 indexed_count += len(batch)
+                unchanged_count += len(batch) - len(ids)
                 
                 if indexed_count % 1000 == 0:
                     logger.info(f"Indexed {indexed_count} records")
@@ -230,9 +418,96 @@ class SemanticSearchEngine:
             except Exception as e:
                 logger.error(f"Failed to index batch starting at {i}: {e}")
         
-        logger.info(f"Successfully indexed {indexed_count} records")
+        logger.info(f"Successfully indexed {indexed_count} records ({unchanged_count} unchanged, not re-encoded)")
         return indexed_count
 
+    def _encode_documents(self, documents: List[str], batch_size: int):
+        """
+        Encode documents for bulk indexing, spread over every GPU available
+        
+        With more than one CUDA device a multi-process pool is started once and
+        kept until close(). On CPU the model encodes in-process, where torch
+        already spreads each batch over the cores.
+        
+        Args:
+            documents: Searchable texts to encode
+            batch_size: Encoder batch size
+            
+        Returns:
+            Embedding array (numpy), one row per document
+        """
+        if self._encode_pool is None:
+            devices = self._encode_devices()
+            if len(devices) > 1:
+                logger.info(f"Starting encoding pool on {len(devices)} devices")
+                self._encode_pool = self.model.start_multi_process_pool(target_devices=devices)
+        
+        if self._encode_pool is not None:
+            return self.model.encode_multi_process(documents, self._encode_pool, batch_size=batch_size)
+        
+        return self.model.encode(documents, batch_size=batch_size, convert_to_numpy=True,
+                                 show_progress_bar=False)
+
+    @staticmethod
+    def _encode_devices() -> List[str]:
+        """List the CUDA devices an encoding pool should run on (empty on CPU)"""
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return [f'cuda:{i}' for i in range(torch.cuda.device_count())]
+        except ImportError:
+            pass
+        
+        # CPU workers would each load a model and run a full torch thread pool
+        return []
+
+    def _changed_ids(self, ids: List[str], text_hashes: List[str]) -> set:
+        """
+        Find records whose searchable text or encoder differs from what is indexed
+        
+        Args:
+            ids: Record IDs
+            text_hashes: Searchable text and encoder hash for each ID
+            
+        Returns:
+            Set of IDs that are new or whose text hash changed
+        """
+        existing = self.collection.get(ids=ids, include=['metadatas'])
+        
+        indexed_hashes = {
+            record_id: (metadata or {}).get('text_hash')
+            for record_id, metadata in zip(existing['ids'], existing['metadatas'])
+        }
+        
+        return {
+            record_id for record_id, text_hash in zip(ids, text_hashes)
+            if indexed_hashes.get(record_id) != text_hash
+        }
+
+    def _record_metadata(self, record: Record, text_hash: str) -> Dict:
+        """
+        Build the vector store metadata for a record
+        
+        Args:
+            record: Record being indexed
+            text_hash: Hash of the record's searchable text
+            
+        Returns:
+            Metadata dictionary
+        """
+        return {
+            'title': record.title,
+            'reference': record.reference or '',
+            'collection': record.collection or '',
+            'archive': record.archive or '',
+            'date_from': record.date_from or '',
+            'date_to': record.date_to or '',
+            'subjects': '|'.join(record.subjects) if record.subjects else '',
+            'creators': '|'.join(record.creators) if record.creators else '',
+            'places': '|'.join(record.places) if record.places else '',
+            'text_hash': text_hash
+        }
+
     def semantic_search(self, 
                        query: str,
                        limit: int = 20,
@@ -250,10 +525,12 @@ class SemanticSearchEngine:
         """
         self._load_model()
         self._init_vector_db()
+        # The CLI may have re-indexed or reset since this engine loaded FAISS
+        self._refresh_faiss_index()
         
         try:
             # Generate query embedding
-            query_embedding = self.model.encode(query).tolist()
+            query_embeddings = self.model.encode([query], convert_to_numpy=True)
             
             # Prepare ChromaDB filters
             where_clause = {}
@@ -262,27 +539,40 @@ class SemanticSearchEngine:
                     if value and key in ['collection', 'archive']:
                         where_clause[key] = value
             
-            # Search vector database
-            search_kwargs = {
-                'query_embeddings': [query_embedding],
-                'n_results': limit
-            }
-            
-            if where_clause:
-                search_kwargs['where'] = where_clause
-            
-            results = self.collection.query(**search_kwargs)
+            if self.faiss_index is not None and not where_clause:
+                # FAISS cannot filter on metadata, so it only serves unfiltered searches
+                distances, positions = self.faiss_index.search(
+                    np.asarray(query_embeddings, dtype='float32'), limit
+                )
+                hits = [
+                    (self._faiss_ids[position], float(distance))
+                    for distance, position in zip(distances[0], positions[0])
+                    if position >= 0
+                ]
+            else:
+                # Search vector database
+                search_kwargs = {
+                    'query_embeddings': query_embeddings.tolist(),
+                    'n_results': limit
+                }
+                
+                if where_clause:
+                    search_kwargs['where'] = where_clause
+                
+                results = self.collection.query(**search_kwargs)
+                hits = list(zip(results['ids'][0], results['distances'][0])) if results['ids'] else []
             
             # Retrieve full records from SQLite
             record_results = []
             
-            if results['ids'] and results['ids'][0]:
-                for i, record_id in enumerate(results['ids'][0]):
-                    record = self.db_manager.get_record(record_id)
+            if hits:
+                # One lookup for every hit instead of a query per hit
+                records_by_id = self.db_manager.get_records_by_ids([record_id for record_id, _ in hits])
+                for record_id, distance in hits:
+                    record = records_by_id.get(record_id)
                     if record:
-                        # ChromaDB returns distances, convert to similarity scores
-                        distance = results['distances'][0][i]
-                        similarity = 1.0 - distance  # Convert distance to similarity
+                        # Distances are squared L2, convert to similarity scores
+                        similarity = 1.0 - distance
                         record_results.append((record, similarity))
             
             return record_results
@@ -512,6 +802,49 @@ class SemanticSearchEngine:
                 'collection_name': None
             }
 
+    @classmethod
+    def index_stats_only(cls,
+                         model_name: str = "all-MiniLM-L6-v2",
+                         vector_db_path: str = "./data/vectors") -> Dict:
+        """
+        Get vector index statistics without building an engine
+        
+        Skips the SQLite manager and never creates the vector directory or
+        collection, so it is cheap enough for status commands.
+        
+        Args:
+            model_name: Model name to report
+            vector_db_path: Path to vector database
+            
+        Returns:
+            Dictionary with index statistics (same keys as get_index_stats)
+        """
+        stats = {
+            'total_records_indexed': 0,
+            'model_name': model_name,
+            'vector_db_path': vector_db_path,
+            'collection_name': None
+        }
+        
+        if not SEMANTIC_SEARCH_AVAILABLE or not Path(vector_db_path).exists():
+            return stats
+        
+        try:
+            # Same settings as _init_vector_db: Chroma refuses a second client
+            # on one path with different settings in the same process
+            client = chromadb.PersistentClient(
+                path=vector_db_path,
+                settings=_chroma_settings()
+            )
+            collection = client.get_collection(name="national_archives_records")
+            stats['total_records_indexed'] = collection.count()
+            stats['collection_name'] = collection.name
+            
+        except Exception as e:
+            logger.debug(f"Vector collection not available: {e}")
+        
+        return stats
+
     def reset_index(self):
         """Reset the vector index (delete all embeddings)"""
         try:
@@ -519,6 +852,7 @@ class SemanticSearchEngine:
             
             # Delete the collection and recreate it
             self.chroma_client.delete_collection("national_archives_records")
+            self._drop_faiss_index()
             
             self.collection = self.chroma_client.create_collection(
                 name="national_archives_records",
@@ -532,5 +866,7 @@ class SemanticSearchEngine:
 
     def close(self):
         """Clean up resources"""
-        # ChromaDB handles cleanup automatically
-        pass
+        # ChromaDB handles cleanup automatically; the encoding pool does not
+        if self._encode_pool is not None:
+            SentenceTransformer.stop_multi_process_pool(self._encode_pool)
+            self._encode_pool = None
@@ -5,6 +5,7 @@ Intelligent caching layer that respects National Archives API policies
 import hashlib
 import json
 import logging
+import threading
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 import sqlite3
@@ -34,8 +35,38 @@ class CacheManager:
         self.db_path = db_path
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
         
+        # One long-lived connection per thread (see _connect)
+        self._local = threading.local()
+        
         logger.info(f"Cache manager initialized with {cache_ttl_hours}h TTL")
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection to the cache database, opening it once
+        
+        Callers use it as a context manager, which commits or rolls back
+        the transaction but leaves the connection open for the next call.
+        The database runs in WAL mode (set by DatabaseManager), so NORMAL
+        sync is safe and spares a disk sync on every cache write.
+        
+        Returns:
+            SQLite connection
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close the calling thread's cache connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _generate_cache_key(self, query: str, filters: Optional[Dict] = None) -> str:
         """
         Generate a unique cache key for a query
@@ -45,15 +76,14 @@ class CacheManager:
             filters: Additional search filters
             
         Returns:
-            MD5 hash as cache key
+            BLAKE2b hash (128-bit hex) as cache key
         """
-        cache_data = {
-            'query': query.strip().lower(),
-            'filters': filters or {}
-        }
+        # Filter keys are unique strings, so sorting items never compares values
+        key_data = query.strip().lower()
+        if filters:
+            key_data += '\x00' + repr(sorted(filters.items()))
         
-        cache_string = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     def get_cached_search(self, 
                          query: str, 
@@ -71,9 +101,7 @@ class CacheManager:
         cache_key = self._generate_cache_key(query, filters)
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
+            with self._connect() as conn:
                 cursor = conn.execute("""
                     SELECT results_json, created_at, expires_at 
                     FROM search_cache 
@@ -149,7 +177,7 @@ class CacheManager:
             # Calculate expiry time
             expires_at = datetime.now() + self.cache_ttl
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO search_cache 
                     (query_hash, query, results_json, total_results, expires_at)
@@ -177,7 +205,7 @@ class CacheManager:
             query: Specific query to invalidate (None to clear all)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 if query:
                     cache_key = self._generate_cache_key(query)
                     conn.execute("DELETE FROM search_cache WHERE query_hash = ?", (cache_key,))
@@ -199,7 +227,7 @@ class CacheManager:
             Dictionary with cache statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 stats = {}
                 
                 # Total cached queries
@@ -242,7 +270,7 @@ class CacheManager:
     def cleanup_expired_cache(self):
         """Remove expired cache entries"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.execute("""
                     DELETE FROM search_cache 
                     WHERE expires_at < ?
@@ -265,7 +293,7 @@ class CacheManager:
             List of cached query strings
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.execute("""
                     SELECT DISTINCT query FROM search_cache 
                     WHERE expires_at > ?
@@ -6,9 +6,12 @@ SQLite-based storage with efficient indexing and search capabilities
 import sqlite3
 import logging
 import os
-from typing import List, Dict, Optional, Iterator, Tuple, Any
+import sys
+import time
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple, Any, Set, Callable
 from datetime import datetime, timedelta
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from api.models import Record, SearchResult
@@ -16,6 +19,82 @@ from api.models import Record, SearchResult
 logger = logging.getLogger(__name__)
 
 
+def _reference_series(reference: Optional[str]) -> Optional[str]:
+    """Series part of a citable reference ("CO 1/123/4" -> "CO 1")"""
+    return reference.split('/', 1)[0] if reference else reference
+
+
+def _reference_prefix(reference: Optional[str]) -> Optional[str]:
+    """Department code of a citable reference ("CO 1/123/4" -> "CO")"""
+    series = _reference_series(reference)
+    return series.split(' ', 1)[0] if series else series
+
+
+def _shared(value: Any) -> Any:
+    """
+    Intern a short column value so records loaded together share one copy
+    
+    Used for low-cardinality columns (archive, level, statuses...) whose
+    values repeat across nearly every record in a result set.
+    """
+    if isinstance(value, str) and len(value) < 64:
+        return sys.intern(value)
+    return value
+
+
+def _reference_columns(reference: Optional[str]) -> Dict[str, Optional[str]]:
+    """Derived lookup columns stored alongside a record's reference"""
+    return {
+        'reference_series': _reference_series(reference),
+        'series_prefix': _reference_prefix(reference)
+    }
+
+
+def _reference_filter(reference: str) -> Tuple[str, List[str]]:
+    """
+    Indexed WHERE clause matching a department, series or item reference
+    
+    Args:
+        reference: "CO", "CO 1" or "CO 1/5"
+        
+    Returns:
+        Tuple of (SQL clause, parameters)
+    """
+    series = _reference_series(reference)
+    
+    if ' ' not in series:
+        clause, params = "series_prefix = ?", [series]
+    else:
+        clause, params = "reference_series = ?", [series]
+    
+    if reference != series:
+        # Descendants sort between "<ref>/" and "<ref>0" ('0' follows '/')
+        clause += " AND (reference = ? OR (reference > ? AND reference < ?))"
+        params.extend([reference, f"{reference}/", f"{reference}0"])
+    
+    return f"({clause})", params
+
+
+@lru_cache(maxsize=None)
+def _build_upsert_sql(columns: Tuple[str, ...]) -> str:
+    """Build the INSERT ... ON CONFLICT(id) DO UPDATE statement for a column list"""
+    updates = ', '.join(f"{col} = excluded.{col}" for col in columns if col != 'id')
+    return f"""
+        INSERT INTO records ({', '.join(columns)})
+        VALUES ({', '.join('?' for _ in columns)})
+        ON CONFLICT(id) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP
+    """
+
+
+# Records still lacking detailed (records/v1/details) metadata
+_MISSING_METADATA_WHERE = """
+    (scope_content IS NULL OR scope_content = '')
+    OR (administrator_background IS NULL OR administrator_background = '')
+    OR (catalogue_id IS NULL)
+    OR (covering_dates IS NULL OR covering_dates = '')
+"""
+
+
 class DatabaseManager:
     """
     Manages local SQLite database for storing Discovery records
@@ -33,6 +112,14 @@ class DatabaseManager:
         """
         self.db_path = db_path
         
+        # Shared long-lived connection, opened on first use
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        # Statistics cache, kept beside the database so writing it never
+        # changes the database signature it is keyed on
+        self.stats_cache_path = f"{db_path}.stats.json"
+        self.stats_cache_ttl = 60
+        
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
@@ -102,6 +189,28 @@ class DatabaseManager:
             if 'is_parent' not in columns:
                 logger.info("Adding is_parent column to records table")
                 conn.execute("ALTER TABLE records ADD COLUMN is_parent BOOLEAN")
+            
+            # Series prefix of the citable reference for indexed series lookups
+            if 'reference_series' not in columns:
+                logger.info("Adding reference_series column to records table")
+                conn.execute("ALTER TABLE records ADD COLUMN reference_series TEXT")
+                conn.execute("""
+                    UPDATE records SET reference_series = CASE
+                        WHEN instr(reference, '/') > 0 THEN substr(reference, 1, instr(reference, '/') - 1)
+                        ELSE reference
+                    END
+                """)
+            
+            # Department code ("CO") for department-wide lookups
+            if 'series_prefix' not in columns:
+                logger.info("Adding series_prefix column to records table")
+                conn.execute("ALTER TABLE records ADD COLUMN series_prefix TEXT")
+                conn.execute("""
+                    UPDATE records SET series_prefix = CASE
+                        WHEN instr(reference_series, ' ') > 0 THEN substr(reference_series, 1, instr(reference_series, ' ') - 1)
+                        ELSE reference_series
+                    END
+                """)
                 
             conn.commit()
                 
@@ -181,6 +290,11 @@ class DatabaseManager:
                     covering_dates TEXT,
                     is_parent BOOLEAN,
                     
+                    -- Series prefix of reference (e.g. "CO 1" for "CO 1/123")
+                    reference_series TEXT,
+                    -- Department code of reference (e.g. "CO" for "CO 1/123")
+                    series_prefix TEXT,
+                    
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     
@@ -247,13 +361,20 @@ class DatabaseManager:
             indexes = [
                 "CREATE INDEX IF NOT EXISTS idx_records_title ON records(title)",
                 "CREATE INDEX IF NOT EXISTS idx_records_reference ON records(reference)",
+                "CREATE INDEX IF NOT EXISTS idx_records_reference_series ON records(reference_series, reference, id)",
+                "CREATE INDEX IF NOT EXISTS idx_records_series_prefix ON records(series_prefix, reference, id)",
                 "CREATE INDEX IF NOT EXISTS idx_records_collection ON records(collection)",
                 "CREATE INDEX IF NOT EXISTS idx_records_archive ON records(archive)",
                 "CREATE INDEX IF NOT EXISTS idx_records_date_from ON records(date_from)",
                 "CREATE INDEX IF NOT EXISTS idx_records_subjects ON records(subjects)",
                 "CREATE INDEX IF NOT EXISTS idx_records_creators ON records(creators)",
                 "CREATE INDEX IF NOT EXISTS idx_records_places ON records(places)",
+                # Partial index over records awaiting enrichment, in the
+                # created_at order the missing-metadata queries return them
+                f"CREATE INDEX IF NOT EXISTS idx_records_missing_metadata ON records(created_at) WHERE {_MISSING_METADATA_WHERE}",
                 "CREATE INDEX IF NOT EXISTS idx_search_cache_query ON search_cache(query)",
+                # Expiry sweeps and active-entry counts range-scan this
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_expires ON search_cache(expires_at)",
                 "CREATE INDEX IF NOT EXISTS idx_api_requests_timestamp ON api_requests(timestamp)",
                 
                 # Hierarchical structure indexes (critical for traversal performance)
@@ -306,6 +427,7 @@ class DatabaseManager:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 record_dict = record.to_dict()
+                record_dict.update(_reference_columns(record.reference))
                 record_dict['updated_at'] = datetime.now().isoformat()
                 
                 # Use INSERT OR REPLACE for upsert behavior
@@ -342,27 +464,7 @@ class DatabaseManager:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 # Convert records to dictionaries and ensure SQLite compatibility
-                record_data = []
-                for record in records:
-                    record_dict = record.to_dict()
-                    
-                    # Ensure all values are SQLite-compatible
-                    for key, value in record_dict.items():
-                        if isinstance(value, list):
-                            # Convert lists to pipe-separated strings
-                            record_dict[key] = '|'.join(str(item) for item in value) if value else ''
-                        elif isinstance(value, dict):
-                            # Convert dictionaries to JSON strings
-                            import json
-                            record_dict[key] = json.dumps(value, ensure_ascii=False) if value else ''
-                        elif value is None:
-                            # Convert None to empty string
-                            record_dict[key] = ''
-                        elif not isinstance(value, (str, int, float, bool)):
-                            # Convert any other types to string
-                            record_dict[key] = str(value)
-                    
-                    record_data.append(record_dict)
+                record_data = [self._record_to_row(record) for record in records]
                 
                 # Get column names from first record
                 columns = list(record_data[0].keys())
@@ -387,6 +489,128 @@ class DatabaseManager:
         
         return stored_count
 
+    def store_records_batched(self, 
+                              chunks: Iterable[List[Record]], 
+                              commit_every: int = 1000,
+                              on_chunk: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Store a stream of record chunks over one connection, committing in batches
+        
+        Same INSERT OR REPLACE semantics as store_records, but rows from
+        consecutive chunks share a transaction until at least commit_every
+        rows are pending, so a stream of small chunks costs one commit per
+        batch instead of one per chunk.
+        
+        Args:
+            chunks: Iterable of Record lists (consumed lazily)
+            commit_every: Minimum rows per transaction
+            on_chunk: Optional callback(chunk_size, total_written) after each chunk
+            
+        Returns:
+            Number of records committed
+            
+        Raises:
+            sqlite3.Error: If a write fails (the open transaction is rolled back)
+        """
+        committed = 0
+        pending = 0
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                # WAL is enabled at init; NORMAL only syncs at checkpoints
+                conn.execute("PRAGMA synchronous = NORMAL")
+                
+                insert_sql = None
+                
+                for records in chunks:
+                    if not records:
+                        continue
+                    
+                    record_data = [self._record_to_row(record) for record in records]
+                    
+                    if insert_sql is None:
+                        columns = list(record_data[0].keys())
+                        insert_sql = f"""
+                            INSERT OR REPLACE INTO records ({', '.join(columns)})
+                            VALUES ({', '.join('?' for _ in columns)})
+                        """
+                    
+                    conn.executemany(insert_sql, [tuple(rd.values()) for rd in record_data])
+                    pending += len(records)
+                    
+                    if pending >= commit_every:
+                        conn.commit()
+                        committed += pending
+                        pending = 0
+                    
+                    if on_chunk:
+                        on_chunk(len(records), committed + pending)
+                
+                conn.commit()
+                committed += pending
+                
+            logger.info(f"Stored {committed} records in database")
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to store record stream after {committed} records: {e}")
+            raise
+        
+        return committed
+
+    def bulk_upsert(self, records: List[Record]) -> int:
+        """
+        Insert or update multiple records in a single transaction
+        
+        Unlike store_records (INSERT OR REPLACE), existing rows are updated in
+        place, so created_at and rowid are kept and the FTS update trigger
+        fires instead of leaving a stale full-text entry behind.
+        
+        Args:
+            records: List of Record objects to store
+            
+        Returns:
+            Number of records successfully stored
+        """
+        if not records:
+            return 0
+        
+        try:
+            record_data = [self._record_to_row(record) for record in records]
+            upsert_sql = _build_upsert_sql(tuple(record_data[0].keys()))
+            
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(upsert_sql, [tuple(rd.values()) for rd in record_data])
+                conn.commit()
+            
+            logger.info(f"Upserted {len(records)} records in database")
+            return len(records)
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to upsert records batch: {e}")
+            return 0
+
+    def _record_to_row(self, record: Record) -> Dict[str, Any]:
+        """Convert a Record to a column dictionary with SQLite-compatible values"""
+        record_dict = record.to_dict()
+        
+        for key, value in record_dict.items():
+            if isinstance(value, list):
+                # Convert lists to pipe-separated strings
+                record_dict[key] = '|'.join(str(item) for item in value) if value else ''
+            elif isinstance(value, dict):
+                # Convert dictionaries to JSON strings
+                record_dict[key] = json.dumps(value, ensure_ascii=False) if value else ''
+            elif value is None:
+                # Convert None to empty string
+                record_dict[key] = ''
+            elif not isinstance(value, (str, int, float, bool)):
+                # Convert any other types to string
+                record_dict[key] = str(value)
+        
+        record_dict.update(_reference_columns(record_dict['reference']))
+        
+        return record_dict
+
     def get_records_with_missing_metadata(self, limit: int = 100) -> List[Record]:
         """
         Get records with missing critical metadata for enrichment
@@ -402,12 +626,9 @@ class DatabaseManager:
                 conn.row_factory = sqlite3.Row
                 
                 # Find records with missing critical metadata
-                query = """
+                query = f"""
                     SELECT * FROM records 
-                    WHERE (scope_content IS NULL OR scope_content = '') 
-                       OR (administrator_background IS NULL OR administrator_background = '')
-                       OR (catalogue_id IS NULL)
-                       OR (covering_dates IS NULL OR covering_dates = '')
+                    WHERE {_MISSING_METADATA_WHERE}
                     ORDER BY created_at DESC
                     LIMIT ?
                 """
@@ -421,6 +642,54 @@ class DatabaseManager:
             logger.error(f"Failed to get records with missing metadata: {e}")
             return []
 
+    def get_missing_metadata_summaries(self, limit: int = 100) -> List[Tuple[str, str]]:
+        """
+        Get (reference, title) for records with missing metadata
+        
+        Same selection as get_records_with_missing_metadata, without loading
+        whole rows or building Record objects.
+        
+        Args:
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of (reference, title) tuples
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute(f"""
+                    SELECT reference, title FROM records 
+                    WHERE {_MISSING_METADATA_WHERE}
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """, (limit,))
+                return cursor.fetchall()
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to get records with missing metadata: {e}")
+            return []
+
+    def get_enriched_record_ids(self) -> Set[str]:
+        """
+        Get IDs of records already stored with detailed (records/v1/details) metadata
+        
+        Returns:
+            Set of record IDs whose provenance marks them as API_DETAILED
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT id FROM records
+                    WHERE provenance LIKE '%API_DETAILED%'
+                      AND json_valid(provenance)
+                      AND json_extract(provenance, '$.source_system') = 'API_DETAILED'
+                """)
+                return {row[0] for row in cursor}
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to get enriched record IDs: {e}")
+            return set()
+
     def update_record_metadata(self, record: Record) -> bool:
         """
         Update an existing record with enriched metadata
@@ -433,29 +702,7 @@ class DatabaseManager:
         """
         try:
             with sqlite3.connect(self.db_path) as db:
-                record_dict = record.to_dict()
-                record_dict['updated_at'] = datetime.now().isoformat()
-                
-                # Convert list fields to strings for SQLite compatibility
-                for key, value in record_dict.items():
-                    if isinstance(value, list):
-                        record_dict[key] = '|'.join(str(item) for item in value) if value else ''
-                    elif value is None:
-                        record_dict[key] = ''
-                
-                # Build dynamic UPDATE statement
-                columns = list(record_dict.keys())
-                set_clause = ', '.join([f"{col} = ?" for col in columns])
-                
-                # Prepare values for UPDATE
-                values = list(record_dict.values()) + [record.id]  # Add id for WHERE clause
-                
-                query = f"""
-                    UPDATE records 
-                    SET {set_clause}
-                    WHERE id = ?
-                """
-                
+                query, values = self._metadata_update(record)
                 cursor = db.execute(query, values)
                 db.commit()
                 
@@ -470,24 +717,85 @@ class DatabaseManager:
             logger.error(f"Failed to update record metadata {record.id}: {e}")
             return False
 
-    def batch_update_metadata(self, records: List[Record]) -> int:
+    def _metadata_update(self, record: Record) -> Tuple[str, List[Any]]:
+        """Build the UPDATE statement and values for a record's metadata"""
+        record_dict = record.to_dict()
+        record_dict.update(_reference_columns(record.reference))
+        record_dict['updated_at'] = datetime.now().isoformat()
+        
+        # Convert list fields to strings for SQLite compatibility
+        for key, value in record_dict.items():
+            if isinstance(value, list):
+                record_dict[key] = '|'.join(str(item) for item in value) if value else ''
+            elif value is None:
+                record_dict[key] = ''
+        
+        # Build dynamic UPDATE statement
+        columns = list(record_dict.keys())
+        set_clause = ', '.join([f"{col} = ?" for col in columns])
+        
+        # Prepare values for UPDATE
+        values = list(record_dict.values()) + [record.id]  # Add id for WHERE clause
+        
+        query = f"""
+            UPDATE records 
+            SET {set_clause}
+            WHERE id = ?
+        """
+        return query, values
+
+    def batch_update_metadata(self, records: List[Record], chunk_size: int = 5000) -> int:
         """
         Update multiple records with enriched metadata
         
+        Updates share one connection and run in IMMEDIATE transactions of
+        chunk_size rows, so the journal is synced once per chunk rather
+        than once per record.
+        
         Args:
             records: List of Record objects with enriched metadata
+            chunk_size: Records per transaction
             
         Returns:
             Number of records successfully updated
+            
+        Raises:
+            sqlite3.Error: If a write fails (the failing chunk is rolled back)
         """
         if not records:
             return 0
         
         updated_count = 0
         
-        for record in records:
-            if self.update_record_metadata(record):
-                updated_count += 1
+        try:
+            with sqlite3.connect(self.db_path) as db:
+                # WAL is enabled at init; NORMAL only syncs at checkpoints
+                db.execute("PRAGMA synchronous = NORMAL")
+                db.execute("PRAGMA temp_store = MEMORY")
+                db.execute("PRAGMA cache_size = -65536")
+                
+                for start in range(0, len(records), chunk_size):
+                    chunk = records[start:start + chunk_size]
+                    chunk_updated = 0
+                    
+                    try:
+                        db.execute("BEGIN IMMEDIATE")
+                        for record in chunk:
+                            query, values = self._metadata_update(record)
+                            if db.execute(query, values).rowcount > 0:
+                                chunk_updated += 1
+                            else:
+                                logger.warning(f"No record found to update: {record.id}")
+                        db.commit()
+                        updated_count += chunk_updated
+                    except sqlite3.Error as e:
+                        db.rollback()
+                        logger.error(f"Failed to update metadata for records {start}-{start + len(chunk) - 1}: {e}")
+                        raise
+                        
+        except sqlite3.Error as e:
+            logger.error(f"Failed to batch update record metadata after {updated_count} records: {e}")
+            raise
         
         logger.info(f"Updated metadata for {updated_count} out of {len(records)} records")
         return updated_count
@@ -518,6 +826,38 @@ class DatabaseManager:
         
         return None
 
+    def get_records_by_ids(self, record_ids: List[str]) -> Dict[str, Record]:
+        """
+        Retrieve several records by ID in one query per 500 IDs
+        
+        Args:
+            record_ids: Record identifiers
+            
+        Returns:
+            Dict mapping each found ID to its Record (missing IDs are absent)
+        """
+        records = {}
+        ids = list(dict.fromkeys(record_ids))
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                # Stay under SQLite's default host-parameter limit
+                for start in range(0, len(ids), 500):
+                    batch = ids[start:start + 500]
+                    cursor = conn.execute(
+                        f"SELECT * FROM records WHERE id IN ({', '.join('?' for _ in batch)})",
+                        batch
+                    )
+                    for row in cursor:
+                        record = self._row_to_record(row)
+                        records[record.id] = record
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to retrieve {len(ids)} records: {e}")
+        
+        return records
+
     def search_records(self, 
                       query: str,
                       limit: int = 100,
@@ -576,6 +916,126 @@ class DatabaseManager:
             logger.error(f"Search failed for query '{query}': {e}")
             return []
 
+    def search_record_summaries(self, query: str, limit: int = 100) -> List[Tuple[str, str]]:
+        """
+        Full-text search returning only (reference, title) pairs
+        
+        Same matching and ordering as search_records, for callers that only
+        display results.
+        
+        Args:
+            query: Search query
+            limit: Maximum results to return
+            
+        Returns:
+            List of (reference, title) tuples
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT r.reference, r.title FROM records r
+                    JOIN records_fts fts ON r.rowid = fts.rowid
+                    WHERE records_fts MATCH ?
+                    ORDER BY r.created_at DESC LIMIT ?
+                """, (query, limit))
+                return cursor.fetchall()
+                
+        except sqlite3.Error as e:
+            logger.error(f"Search failed for query '{query}': {e}")
+            return []
+
+    def count_records(self) -> int:
+        """
+        Get the total number of stored records
+        
+        Returns:
+            Number of rows in the records table
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("SELECT COUNT(*) FROM records")
+                return cursor.fetchone()[0]
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to count records: {e}")
+            return 0
+
+    def iter_all_records(self, chunk_size: int = 1000) -> Iterator[List[Record]]:
+        """
+        Stream every stored record in chunks
+        
+        Plain table scan with no FTS matching or ORDER BY, so rows are read
+        in storage order and only one chunk is materialised at a time.
+        
+        Args:
+            chunk_size: Number of records per yielded chunk
+            
+        Yields:
+            Lists of Record objects
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        
+        try:
+            cursor = conn.execute("SELECT * FROM records")
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                
+                yield [self._row_to_record(row) for row in rows]
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to stream records: {e}")
+        finally:
+            conn.close()
+
+    def list_records(self, limit: int = 10, reference: Optional[str] = None) -> Iterator[Tuple]:
+        """
+        List stored records ordered by reference
+        
+        A department code ("CO") matches every series in that department; a
+        bare series ("CO 1") matches the series itself and everything below
+        it but not "CO 10"; a reference containing "/" ("CO 1/5") matches
+        that item and its descendants but not "CO 1/50". Every form is an
+        equality or range lookup on an index, so no LIKE patterns are needed.
+        
+        Several filters can be combined with commas ("CO 1,WO 95").
+        
+        Args:
+            limit: Maximum number of rows to return
+            reference: Optional series or reference filter(s)
+            
+        Yields:
+            (id, reference, title, date_from, date_to) tuples, streamed from
+            the cursor as the caller consumes them
+        """
+        sql = "SELECT id, reference, title, date_from, date_to FROM records"
+        params: List[Any] = []
+        
+        if reference:
+            clauses = []
+            for term in (term.strip() for term in reference.split(',')):
+                if term:
+                    clause, term_params = _reference_filter(term)
+                    clauses.append(clause)
+                    params.extend(term_params)
+            
+            # SQLite turns ORed equalities on one column into an IN lookup and
+            # mixed forms into a multi-index OR, so each term stays a SEARCH
+            if clauses:
+                sql += " WHERE " + " OR ".join(clauses)
+        
+        sql += " ORDER BY reference, id LIMIT ?"
+        params.append(limit)
+        
+        try:
+            yield from self.readonly_conn.execute(sql, params)
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to list records: {e}")
+
     def get_collections(self) -> List[Dict]:
         """
         Get all collections with record counts
@@ -615,9 +1075,14 @@ class DatabaseManager:
             with sqlite3.connect(self.db_path) as conn:
                 stats = {}
                 
-                # Total records
-                cursor = conn.execute("SELECT COUNT(*) FROM records")
-                stats['total_records'] = cursor.fetchone()[0]
+                # Total records and date range in one scan (created_at is
+                # not indexed, so MIN/MAX already read every row)
+                cursor = conn.execute("""
+                    SELECT COUNT(*), MIN(created_at), MAX(created_at)
+                    FROM records
+                """)
+                total_records, earliest, latest = cursor.fetchone()
+                stats['total_records'] = total_records
                 
                 # Records by archive
                 cursor = conn.execute("""
@@ -629,15 +1094,9 @@ class DatabaseManager:
                 """)
                 stats['archives'] = dict(cursor.fetchall())
                 
-                # Date range
-                cursor = conn.execute("""
-                    SELECT MIN(created_at), MAX(created_at)
-                    FROM records
-                """)
-                date_range = cursor.fetchone()
                 stats['date_range'] = {
-                    'earliest': date_range[0],
-                    'latest': date_range[1]
+                    'earliest': earliest,
+                    'latest': latest
                 }
                 
                 # Database size
@@ -650,6 +1109,99 @@ class DatabaseManager:
             logger.error(f"Failed to get statistics: {e}")
             return {}
 
+    def get_statistics_cached(self) -> Dict:
+        """
+        Get database statistics, reusing the last result while the database is unchanged
+        
+        Returns:
+            Dictionary with various statistics (see get_statistics)
+        """
+        return self._cached_by_signature('statistics', self.get_statistics)
+
+    def get_collections_cached(self) -> List[Dict]:
+        """
+        Get collections with record counts, reusing the last result while the database is unchanged
+        
+        Returns:
+            List of collection dictionaries (see get_collections)
+        """
+        return self._cached_by_signature('collections', self.get_collections)
+
+    def get_daily_request_count_cached(self, date: Optional[datetime] = None) -> int:
+        """
+        Get the API request count for a date, reusing the last result while the database is unchanged
+        
+        Args:
+            date: Date to check (defaults to today)
+            
+        Returns:
+            Number of requests made
+        """
+        date = date or datetime.now()
+        return self._cached_by_signature(
+            f"daily_requests:{date.strftime('%Y-%m-%d')}",
+            lambda: self.get_daily_request_count(date)
+        )
+
+    def _data_signature(self) -> List[int]:
+        """
+        Cheap signature of the database files that changes on every write
+        
+        Committed writes either land in the -wal file or, after a checkpoint,
+        in the main file, so their sizes and modification times together
+        identify the current database contents. An empty or missing WAL
+        counts as zero so merely opening a connection doesn't change it.
+        """
+        signature = []
+        
+        for path in (self.db_path, f"{self.db_path}-wal"):
+            try:
+                stat = os.stat(path)
+                signature.extend([stat.st_mtime_ns, stat.st_size] if stat.st_size else [0, 0])
+            except OSError:
+                signature.extend([0, 0])
+        
+        return signature
+
+    def _cached_by_signature(self, key: str, compute):
+        """
+        Return compute() from the statistics cache if the database is unchanged
+        
+        Args:
+            key: Cache entry name
+            compute: Zero-argument callable producing a JSON-serialisable value
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        # Take the signature first so a write racing with compute() is never
+        # cached under the pre-write signature
+        signature = self._data_signature()
+        
+        try:
+            with open(self.stats_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        entry = cache.get(key)
+        if (entry and entry.get('signature') == signature
+                and time.time() - entry.get('cached_at', 0) < self.stats_cache_ttl):
+            return entry['value']
+        
+        value = compute()
+        cache[key] = {'signature': signature, 'cached_at': time.time(), 'value': value}
+        
+        try:
+            tmp_path = f"{self.stats_cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.stats_cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write statistics cache: {e}")
+        
+        return value
+
     def log_api_request(self, 
                        endpoint: str,
                        query: Optional[str] = None,
@@ -775,16 +1327,16 @@ class DatabaseManager:
             date_from=row['date_from'],
             date_to=row['date_to'],
             reference=row['reference'],
-            archive=row['archive'],
-            collection=row['collection'],
+            archive=_shared(row['archive']),
+            collection=_shared(row['collection']),
             subjects=[s for s in subjects if s],
             creators=[c for c in creators if c],
             places=[p for p in places if p],
-            catalogue_source=row['catalogue_source'],
+            catalogue_source=_shared(row['catalogue_source']),
             access_conditions=row['access_conditions'],
-            closure_status=row['closure_status'],
-            legal_status=row['legal_status'],
-            held_by=row['held_by'],
+            closure_status=_shared(row['closure_status']),
+            legal_status=_shared(row['legal_status']),
+            held_by=_shared(row['held_by']),
             former_reference=row['former_reference'],
             note=row['note'],
             arrangement=row['arrangement'],
@@ -804,14 +1356,14 @@ class DatabaseManager:
             physical_description=row['physical_description'],
             immediate_source=row['immediate_source'],
             scope_content=row['scope_content'],
-            language=row['language'],
-            script=row['script'],
+            language=_shared(row['language']),
+            script=_shared(row['script']),
             web_links=[w for w in web_links if w],
             digital_files=[d for d in digital_files if d],
             
             # Hierarchical structure fields
             parent_id=row['parent_id'],
-            level=row['level'],
+            level=_shared(row['level']),
             child_count=row['child_count'],
             
             # Provenance tracking
@@ -927,9 +1479,27 @@ class DatabaseManager:
             logger.error(f"Failed to reset failed items: {e}")
             return 0
 
+    @property
+    def readonly_conn(self) -> sqlite3.Connection:
+        """
+        Shared read-only connection for list/browse queries, opened on first use
+        
+        Opening the file in ro mode skips write-journal setup, and the larger
+        page cache plus memory-mapped I/O keep repeated reads cheap.
+        """
+        if self._conn is None:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._conn.execute("PRAGMA query_only = 1")
+            self._conn.execute("PRAGMA cache_size = -65536")
+            self._conn.execute("PRAGMA mmap_size = 268435456")
+        return self._conn
+
     def close(self):
-        """Close database connections"""
-        pass  # Using context managers, so no persistent connections
+        """Close the shared connection (per-call connections use context managers)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def __enter__(self):
         return self
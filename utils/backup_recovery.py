@@ -15,6 +15,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime, timedelta
+from operator import itemgetter
 import hashlib
 import threading
 import time
@@ -332,20 +333,19 @@ class BackupManager:
             List of backup metadata
         """
         backups = []
+        now = datetime.now()
         
         for backup_id, metadata in self.metadata.items():
             if backup_type and metadata['backup_type'] != backup_type:
                 continue
             
             backup_info = metadata.copy()
-            backup_info['age_days'] = (
-                datetime.now() - datetime.fromisoformat(metadata['timestamp'])
-            ).days
+            backup_info['age_days'] = (now - datetime.fromisoformat(metadata['timestamp'])).days
             
             backups.append(backup_info)
         
         # Sort by timestamp (newest first)
-        backups.sort(key=lambda x: x['timestamp'], reverse=True)
+        backups.sort(key=itemgetter('timestamp'), reverse=True)
         return backups
     
     def cleanup_old_backups(self) -> int:
@@ -8,11 +8,14 @@ for scholarly integrity and auditing purposes.
 import hashlib
 import logging
 import platform
+import sqlite3
 import sys
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from dataclasses import dataclass, asdict
+from functools import cached_property
 import json
+from collections import OrderedDict
 
 from storage.database import DatabaseManager
 
@@ -65,9 +68,13 @@ class ProvenanceTracker:
             db_manager: Database manager for storing provenance data
         """
         self.db_manager = db_manager
-        self.system_info = self._collect_system_info()
         self.session_id = self._generate_session_id()
         
+        # LRU cache of built lineage objects, invalidated per record on writes
+        self.lineage_cache_size = 4096
+        self._lineage_cache: 'OrderedDict[str, DataLineage]' = OrderedDict()
+        self._lineage_cache_stats = {'hits': 0, 'misses': 0}
+        
         logger.info(f"Initialized provenance tracker with session ID: {self.session_id}")
     
     def create_record_provenance(self, 
@@ -152,6 +159,9 @@ class ProvenanceTracker:
             'additional_metadata': additional_metadata or {}
         }
         
+        # A fresh extraction supersedes any lineage built for this record
+        self._lineage_cache.pop(record_id, None)
+        
         return provenance
     
     def add_transformation(self, 
@@ -189,6 +199,8 @@ class ProvenanceTracker:
         if self.db_manager:
             self._store_transformation(record_id, transformation)
         
+        self._lineage_cache.pop(record_id, None)
+        
         logger.info(f"Recorded transformation for {record_id}: {transformation_type}")
         return transformation
     
@@ -224,6 +236,8 @@ class ProvenanceTracker:
         if self.db_manager:
             self._store_validation(record_id, validation)
         
+        self._lineage_cache.pop(record_id, None)
+        
         logger.info(f"Recorded validation for {record_id}: {validation_type} = {status}")
         return validation
     
@@ -272,6 +286,9 @@ class ProvenanceTracker:
         Args:
             record_id: Record to trace lineage for
             
+        Lineage objects are cached per record and shared between callers,
+        so they should be treated as read-only.
+        
         Returns:
             DataLineage object or None if not found
         """
@@ -279,6 +296,35 @@ class ProvenanceTracker:
             logger.warning("No database manager available for lineage creation")
             return None
         
+        lineage = self._lineage_cache.get(record_id)
+        if lineage is not None:
+            self._lineage_cache.move_to_end(record_id)
+            self._lineage_cache_stats['hits'] += 1
+            return lineage
+        
+        self._lineage_cache_stats['misses'] += 1
+        lineage = self._build_data_lineage(record_id)
+        
+        if lineage is not None:
+            self._lineage_cache[record_id] = lineage
+            if len(self._lineage_cache) > self.lineage_cache_size:
+                self._lineage_cache.popitem(last=False)
+        
+        return lineage
+    
+    def get_lineage_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the lineage cache"""
+        lookups = self._lineage_cache_stats['hits'] + self._lineage_cache_stats['misses']
+        return {
+            'hits': self._lineage_cache_stats['hits'],
+            'misses': self._lineage_cache_stats['misses'],
+            'hit_rate': self._lineage_cache_stats['hits'] / lookups if lookups else 0.0,
+            'size': len(self._lineage_cache),
+            'max_size': self.lineage_cache_size
+        }
+    
+    def _build_data_lineage(self, record_id: str) -> Optional[DataLineage]:
+        """Build lineage for a record from its stored provenance"""
         try:
             # Get record provenance data
             provenance_data = self._get_record_provenance(record_id)
@@ -327,6 +373,33 @@ class ProvenanceTracker:
         Returns:
             Comprehensive provenance report
         """
+        report, lineage_records = self.stream_provenance_report(record_ids, start_date, end_date)
+        report['records'] = list(lineage_records)
+        
+        if report['summary']:
+            report['summary']['records_with_lineage'] = len(report['records'])
+        
+        return report
+    
+    def stream_provenance_report(self, 
+                                record_ids: Optional[List[str]] = None,
+                                start_date: Optional[str] = None,
+                                end_date: Optional[str] = None) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """
+        Generate a provenance report whose lineage records are built lazily
+        
+        The lineage for each record is only created as the returned iterator
+        is consumed, so large reports can be written out without holding
+        every record in memory.
+        
+        Args:
+            record_ids: Specific records to include (None = all)
+            start_date: Start date filter (ISO format)
+            end_date: End date filter (ISO format)
+            
+        Returns:
+            Tuple of (report without its 'records' list, iterator of lineage dicts)
+        """
         report = {
             'report_metadata': {
                 'generated_at': datetime.now().isoformat(),
@@ -335,7 +408,6 @@ class ProvenanceTracker:
                 'session_id': self.session_id
             },
             'summary': {},
-            'records': [],
             'statistics': {},
             'quality_analysis': {},
             'recommendations': []
@@ -344,32 +416,25 @@ class ProvenanceTracker:
         try:
             if not self.db_manager:
                 report['error'] = 'No database manager available'
-                return report
+                return report, iter(())
             
             # Get records matching criteria
             records_data = self._get_records_for_report(record_ids, start_date, end_date)
-            
-            # Process each record
-            for record_data in records_data:
-                record_id = record_data.get('id')
-                lineage = self.create_data_lineage(record_id)
-                
-                if lineage:
-                    report['records'].append(lineage.to_dict())
+            where, params = self._report_filter(record_ids, start_date, end_date)
             
             # Generate statistics
-            report['statistics'] = self._calculate_provenance_statistics(records_data)
+            report['statistics'] = self._calculate_provenance_statistics(where, params)
             
             # Generate quality analysis
-            report['quality_analysis'] = self._analyze_data_quality(records_data)
+            report['quality_analysis'] = self._analyze_data_quality(where, params)
             
             # Generate recommendations
             report['recommendations'] = self._generate_provenance_recommendations(records_data)
             
-            # Summary
+            # Summary (records_with_lineage is filled in once the records are consumed)
             report['summary'] = {
                 'total_records': len(records_data),
-                'records_with_lineage': len(report['records']),
+                'records_with_lineage': 0,
                 'average_quality_score': report['quality_analysis'].get('average_quality_score', 0),
                 'date_range': {
                     'start': start_date,
@@ -378,12 +443,25 @@ class ProvenanceTracker:
             }
             
             logger.info(f"Generated provenance report for {len(records_data)} records")
-            return report
+            return report, self._iter_lineage_records(records_data)
             
         except Exception as e:
             logger.error(f"Error generating provenance report: {e}")
             report['error'] = str(e)
-            return report
+            return report, iter(())
+    
+    def _iter_lineage_records(self, records_data: List[Dict]) -> Iterator[Dict[str, Any]]:
+        """Yield the lineage dict for each report record that has one"""
+        for record_data in records_data:
+            lineage = self.create_data_lineage(record_data.get('id'))
+            
+            if lineage:
+                yield lineage.to_dict()
+    
+    @cached_property
+    def system_info(self) -> Dict[str, str]:
+        """System environment information, probed once on first access"""
+        return self._collect_system_info()
     
     def _collect_system_info(self) -> Dict[str, str]:
         """Collect system environment information"""
@@ -501,8 +579,22 @@ class ProvenanceTracker:
     
     def _get_record_provenance(self, record_id: str) -> Optional[Dict]:
         """Get provenance data for a record"""
-        # This would query the records table for provenance data
-        return {}
+        if not self.db_manager:
+            return {}
+        
+        try:
+            with sqlite3.connect(self.db_manager.db_path) as conn:
+                cursor = conn.execute(
+                    "SELECT provenance FROM records WHERE id = ? AND json_valid(provenance)",
+                    (record_id,)
+                )
+                row = cursor.fetchone()
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to get provenance for record {record_id}: {e}")
+            return {}
+        
+        return json.loads(row[0]) if row else {}
     
     def _get_record_transformations(self, record_id: str) -> List[Dict]:
         """Get transformation history for a record"""
@@ -514,31 +606,129 @@ class ProvenanceTracker:
         # This would query validations table
         return []
     
+    def _report_filter(self, 
+                       record_ids: Optional[List[str]], 
+                       start_date: Optional[str], 
+                       end_date: Optional[str]) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause selecting records for a report"""
+        clauses = ["json_valid(provenance)"]
+        params: List[Any] = []
+        
+        if record_ids:
+            clauses.append(f"id IN ({', '.join('?' for _ in record_ids)})")
+            params.extend(record_ids)
+        
+        if start_date:
+            clauses.append("created_at >= ?")
+            params.append(start_date)
+        
+        if end_date:
+            clauses.append("created_at < date(?, '+1 day')")
+            params.append(end_date)
+        
+        return " AND ".join(clauses), params
+    
     def _get_records_for_report(self, 
                                record_ids: Optional[List[str]], 
                                start_date: Optional[str], 
                                end_date: Optional[str]) -> List[Dict]:
         """Get records matching report criteria"""
-        # This would query the database with filters
-        return []
+        where, params = self._report_filter(record_ids, start_date, end_date)
+        
+        try:
+            with sqlite3.connect(self.db_manager.db_path) as conn:
+                cursor = conn.execute(f"SELECT id, reference FROM records WHERE {where}", params)
+                return [{'id': row[0], 'reference': row[1]} for row in cursor]
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to get records for provenance report: {e}")
+            return []
     
-    def _calculate_provenance_statistics(self, records_data: List[Dict]) -> Dict[str, Any]:
-        """Calculate statistics for provenance report"""
-        return {
+    def _calculate_provenance_statistics(self, where: str, params: List[Any]) -> Dict[str, Any]:
+        """
+        Calculate statistics for provenance report
+        
+        Counts are aggregated by SQLite (json_extract + GROUP BY) so only one
+        row per distinct value comes back to Python.
+        
+        Args:
+            where: WHERE clause from _report_filter
+            params: Parameters for the WHERE clause
+        """
+        stats = {
             'source_methods': {},
             'parser_versions': {},
             'extraction_timeline': {},
             'quality_distribution': {}
         }
+        
+        grouped_fields = {
+            # Scraped records record their origin under source_method
+            'source_methods': "COALESCE(json_extract(provenance, '$.source_system'), "
+                              "json_extract(provenance, '$.source_method'), 'unknown')",
+            'parser_versions': "COALESCE(json_extract(provenance, '$.parser_version'), 'unknown')",
+            'extraction_timeline': "COALESCE(json_extract(provenance, '$.extraction_date'), 'unknown')"
+        }
+        
+        try:
+            with sqlite3.connect(self.db_manager.db_path) as conn:
+                for key, expression in grouped_fields.items():
+                    cursor = conn.execute(f"""
+                        SELECT {expression} AS value, COUNT(*)
+                        FROM records WHERE {where}
+                        GROUP BY value ORDER BY COUNT(*) DESC
+                    """, params)
+                    stats[key] = dict(cursor.fetchall())
+                
+                # Few distinct scores, so grade the grouped rows in Python
+                cursor = conn.execute(f"""
+                    SELECT json_extract(provenance, '$.quality_metrics.overall_quality_score') AS score, COUNT(*)
+                    FROM records WHERE {where}
+                    GROUP BY score
+                """, params)
+                for score, count in cursor:
+                    grade = 'Unscored' if score is None else self._score_to_grade(score)
+                    stats['quality_distribution'][grade] = stats['quality_distribution'].get(grade, 0) + count
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to calculate provenance statistics: {e}")
+        
+        return stats
     
-    def _analyze_data_quality(self, records_data: List[Dict]) -> Dict[str, Any]:
-        """Analyze data quality across records"""
-        return {
+    def _analyze_data_quality(self, where: str, params: List[Any]) -> Dict[str, Any]:
+        """
+        Analyze data quality across records
+        
+        Args:
+            where: WHERE clause from _report_filter
+            params: Parameters for the WHERE clause
+        """
+        analysis = {
             'average_quality_score': 0.0,
             'quality_trends': [],
             'quality_by_source': {},
             'quality_issues': []
         }
+        
+        score = "json_extract(provenance, '$.quality_metrics.overall_quality_score')"
+        source = "COALESCE(json_extract(provenance, '$.source_system'), json_extract(provenance, '$.source_method'), 'unknown')"
+        
+        try:
+            with sqlite3.connect(self.db_manager.db_path) as conn:
+                cursor = conn.execute(f"SELECT AVG({score}) FROM records WHERE {where}", params)
+                analysis['average_quality_score'] = cursor.fetchone()[0] or 0.0
+                
+                cursor = conn.execute(f"""
+                    SELECT {source} AS source, AVG({score})
+                    FROM records WHERE {where} AND {score} IS NOT NULL
+                    GROUP BY source
+                """, params)
+                analysis['quality_by_source'] = dict(cursor.fetchall())
+                
+        except sqlite3.Error as e:
+            logger.error(f"Failed to analyze provenance data quality: {e}")
+        
+        return analysis
     
     def _generate_provenance_recommendations(self, records_data: List[Dict]) -> List[str]:
         """Generate recommendations based on provenance analysis"""
@@ -30,6 +30,13 @@ class StreamingConfig:
     progress_callback: Optional[Callable[[int, int], None]] = None
 
 
+@dataclass
+class ExportResult:
+    """Outcome of a streaming export"""
+    path: str
+    bytes_written: int
+
+
 class MemoryMonitor:
     """Monitor and manage memory usage during streaming operations"""
     
@@ -100,7 +107,8 @@ class StreamingRecordProcessor:
             'failed_chunks': 0,
             'total_time': 0.0,
             'peak_memory_mb': 0.0,
-            'gc_runs': 0
+            'gc_runs': 0,
+            'bytes_written': 0
         }
         
         logger.info(f"Initialized streaming processor (chunk_size={self.config.chunk_size}, "
@@ -176,8 +184,8 @@ class StreamingRecordProcessor:
                     if self.memory_monitor.force_gc_if_needed():
                         self.stats['gc_runs'] += 1
                 
-                # Rate limiting compliance
-                time.sleep(1.0)  # 1 request per second
+                # Rate limiting is enforced by the client itself (1 req/s,
+                # backing off on 429), so no extra sleep between pages
                 
             except Exception as e:
                 logger.error(f"Error fetching page {page}: {e}")
@@ -248,6 +256,57 @@ class StreamingRecordProcessor:
                     if self.memory_monitor.force_gc_if_needed():
                         self.stats['gc_runs'] += 1
     
+    def stream_columns_from_database(self,
+                                   columns: List[str],
+                                   query: Optional[str] = None,
+                                   batch_size: int = None) -> Generator[Dict[str, list], None, None]:
+        """
+        Stream selected record columns from database in chunks
+        
+        Only the named columns are fetched, and each chunk is laid out as
+        one list per column rather than one Record per row, so analyses
+        iterate plain lists instead of building and dereferencing objects.
+        
+        Args:
+            columns: Names of records columns to fetch
+            query: SQL WHERE clause (optional)
+            batch_size: Override default chunk size
+            
+        Yields:
+            Dicts mapping each column name to that chunk's values
+        """
+        chunk_size = batch_size or self.config.chunk_size
+        where = f"WHERE {query}" if query else ""
+        
+        with self.database_transaction() as conn:
+            known = {row[1] for row in conn.execute("PRAGMA table_info(records)")}
+            unknown = [column for column in columns if column not in known]
+            if unknown:
+                raise ValueError(f"Unknown records columns: {unknown}")
+            
+            sql = f"""
+                SELECT {', '.join(columns)} FROM records 
+                {where} 
+                ORDER BY created_at 
+                LIMIT ? OFFSET ?
+            """
+            total_records = conn.execute(f"SELECT COUNT(*) FROM records {where}").fetchone()[0]
+            logger.info(f"Streaming {len(columns)} columns of {total_records} records from database")
+            
+            offset = 0
+            while offset < total_records:
+                rows = conn.execute(sql, (chunk_size, offset)).fetchall()
+                if not rows:
+                    break
+                
+                # Transpose rows into one list per column
+                yield dict(zip(columns, map(list, zip(*rows))))
+                
+                offset += len(rows)
+                
+                if self.config.progress_callback:
+                    self.config.progress_callback(offset, total_records)
+    
     def _row_to_record(self, row_dict: Dict[str, Any]) -> Record:
         """Convert database row to Record object"""
         # Import here to avoid circular imports
@@ -294,7 +353,11 @@ class StreamingRecordProcessor:
                         output_file.flush()
                     
                     self.stats['successful_chunks'] += 1
-                    self.stats['total_processed'] += len(chunk)
+                    if isinstance(chunk, dict):
+                        # Column chunk: every column list has the row count
+                        self.stats['total_processed'] += len(next(iter(chunk.values()), ()))
+                    else:
+                        self.stats['total_processed'] += len(chunk)
                     
                     # Memory monitoring
                     memory_info = self.memory_monitor.check_memory()
@@ -321,6 +384,8 @@ class StreamingRecordProcessor:
         
         finally:
             if output_file:
+                # Position of the write-only file is its size; no stat() needed
+                self.stats['bytes_written'] = output_file.tell()
                 output_file.close()
         
         self.stats['total_time'] = time.time() - start_time
@@ -415,7 +480,7 @@ def stream_large_search(api_client: DiscoveryClient,
 
 def export_records_streaming(query: Optional[str] = None,
                            output_format: str = "jsonl",
-                           chunk_size: int = 1000) -> str:
+                           chunk_size: int = 1000) -> ExportResult:
     """
     Export records in streaming fashion to prevent memory issues
     
@@ -425,7 +490,7 @@ def export_records_streaming(query: Optional[str] = None,
         chunk_size: Records per chunk
         
     Returns:
-        Path to exported file
+        ExportResult with the exported file path and its size in bytes
     """
     config = StreamingConfig(chunk_size=chunk_size)
     processor = StreamingRecordProcessor(config)
@@ -434,12 +499,14 @@ def export_records_streaming(query: Optional[str] = None,
         """Convert record to dictionary for export"""
         return record.to_dict()
     
-    return processor.bulk_transform_records(record_to_dict, query, output_format)
+    output_path = processor.bulk_transform_records(record_to_dict, query, output_format)
+    return ExportResult(path=output_path, bytes_written=processor.stats['bytes_written'])
 
 
-def analyze_records_streaming(analysis_func: Callable[[List[Record]], Dict[str, Any]],
+def analyze_records_streaming(analysis_func: Callable[[Any], Dict[str, Any]],
                             query: Optional[str] = None,
-                            chunk_size: int = 500) -> Dict[str, Any]:
+                            chunk_size: int = 500,
+                            columns: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Perform analysis on large datasets using streaming
     
@@ -447,6 +514,8 @@ def analyze_records_streaming(analysis_func: Callable[[List[Record]], Dict[str,
         analysis_func: Function to analyze record chunks
         query: SQL WHERE clause (optional)
         chunk_size: Records per chunk
+        columns: If given, fetch only these columns and pass analysis_func
+            a dict of column lists instead of a list of Records
         
     Returns:
         Aggregated analysis results
@@ -454,5 +523,8 @@ def analyze_records_streaming(analysis_func: Callable[[List[Record]], Dict[str,
     config = StreamingConfig(chunk_size=chunk_size)
     processor = StreamingRecordProcessor(config)
     
-    record_stream = processor.stream_records_from_database(query, chunk_size)
+    if columns:
+        record_stream = processor.stream_columns_from_database(columns, query, chunk_size)
+    else:
+        record_stream = processor.stream_records_from_database(query, chunk_size)
     return processor.process_stream(record_stream, analysis_func)
@@ -6,12 +6,20 @@ Generates comprehensive validation reports in multiple formats
 
 import json
 import csv
+import io
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -141,10 +149,21 @@ class ValidationReport:
     
     def generate_csv_report(self) -> str:
         """Generate CSV report for data analysis"""
-        output = []
+        csv_buffer = io.StringIO()
+        self.write_csv_report(csv_buffer)
+        return csv_buffer.getvalue()
+    
+    def write_csv_report(self, fp: TextIO):
+        """
+        Write CSV report rows straight to a text stream
+        
+        Args:
+            fp: Open text stream (files should use newline='')
+        """
+        writer = csv.writer(fp)
         
         # Header
-        output.append([
+        writer.writerow([
             'Validator', 'Check_Name', 'Status', 'Expected', 'Actual', 
             'Message', 'Timestamp', 'Details'
         ])
@@ -152,7 +171,7 @@ class ValidationReport:
         # Data rows
         for validator_name, validator_data in self.results.get('validators', {}).items():
             for result in validator_data['results']:
-                output.append([
+                writer.writerow([
                     validator_name,
                     result['check_name'],
                     result['status'],
@@ -162,13 +181,6 @@ class ValidationReport:
                     result['timestamp'],
                     json.dumps(result.get('details', {}))
                 ])
-        
-        # Convert to CSV string
-        import io
-        csv_buffer = io.StringIO()
-        writer = csv.writer(csv_buffer)
-        writer.writerows(output)
-        return csv_buffer.getvalue()
     
     def save_report(self, output_dir: str, formats: Optional[List[str]] = None) -> Dict[str, str]:
         """
@@ -190,27 +202,36 @@ class ValidationReport:
         timestamp_str = self.timestamp.strftime('%Y%m%d_%H%M%S')
         saved_files = {}
         
+        extensions = {'console': 'txt', 'json': 'json', 'csv': 'csv'}
+        
         for format_name in formats:
             try:
-                if format_name == 'console':
-                    content = self.generate_console_report()
-                    filename = f"validation_report_{timestamp_str}.txt"
-                    
-                elif format_name == 'json':
-                    content = json.dumps(self.generate_json_report(), indent=2, default=str)
-                    filename = f"validation_report_{timestamp_str}.json"
-                    
-                elif format_name == 'csv':
-                    content = self.generate_csv_report()
-                    filename = f"validation_report_{timestamp_str}.csv"
-                    
-                else:
+                if format_name not in extensions:
                     logger.warning(f"Unknown report format: {format_name}")
                     continue
                 
-                file_path = output_path / filename
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                file_path = output_path / f"validation_report_{timestamp_str}.{extensions[format_name]}"
+                
+                if format_name == 'json' and ORJSON_AVAILABLE:
+                    # Datetimes pass through to default=str, matching json's output
+                    payload = orjson.dumps(
+                        self.generate_json_report(),
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                        default=str
+                    )
+                    with open(file_path, 'wb') as f:
+                        f.write(payload)
+                else:
+                    # JSON and CSV are written straight to the file rather than
+                    # built as one string first
+                    with open(file_path, 'w', encoding='utf-8',
+                              newline='' if format_name == 'csv' else None) as f:
+                        if format_name == 'console':
+                            f.write(self.generate_console_report())
+                        elif format_name == 'json':
+                            json.dump(self.generate_json_report(), f, indent=2, default=str)
+                        else:
+                            self.write_csv_report(f)
                 
                 saved_files[format_name] = str(file_path)
                 logger.info(f"Saved {format_name} report to {file_path}")